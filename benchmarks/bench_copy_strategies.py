@@ -0,0 +1,69 @@
+"""
+Compare the copy engine strategies on one file.
+
+Copies a generated file of --size-mb from --source-dir to --target-dir (both
+a temporary directory by default) with each strategy alone, then with the
+default fallback order, and reports time and throughput. Point the
+directories at the repository share and NUKE_KIT_DIR to measure installs;
+unsupported strategies are reported as such.
+
+    python benchmarks/bench_copy_strategies.py --size-mb 256 --target-dir ~/.nuke
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from nukekit.core.copy import DEFAULT_STRATEGIES, CopyStrategy, copy_file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--source-dir", type=Path)
+    parser.add_argument("--target-dir", type=Path)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = args.source_dir or Path(tmp)
+        target_dir = args.target_dir or Path(tmp)
+        source = source_dir / f"bench_copy_{os.getpid()}.src"
+        with open(source, "wb") as file:
+            for _ in range(args.size_mb):
+                file.write(os.urandom(1 << 20))
+        destination = target_dir / f"bench_copy_{os.getpid()}.dst"
+
+        runs: list[tuple[str, list[CopyStrategy]]] = [
+            (strategy.value, [strategy]) for strategy in DEFAULT_STRATEGIES
+        ]
+        runs.append(("default order", list(DEFAULT_STRATEGIES)))
+        try:
+            for label, strategies in runs:
+                best = float("inf")
+                try:
+                    for _ in range(args.repeat):
+                        start = time.perf_counter()
+                        used = copy_file(
+                            source, destination, hardlink=True, strategies=strategies
+                        )
+                        best = min(best, time.perf_counter() - start)
+                        destination.unlink()
+                except OSError as e:
+                    print(f"{label:<16} unsupported ({e.strerror or e})")
+                    continue
+                print(
+                    f"{label:<16} {best * 1000:9.2f} ms  "
+                    f"{args.size_mb / best:9.0f} MB/s  ({used})"
+                )
+        finally:
+            source.unlink()
+            destination.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
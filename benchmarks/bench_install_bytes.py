@@ -0,0 +1,92 @@
+"""
+Measure bytes moved per install with each repository compression codec.
+
+Publishes a synthetic .nk script (or --script) into a temporary repository
+with every codec, then installs it back, reporting stored bytes, which is
+what an install reads over the network, and store/restore times. Also
+reports the size of a manifest of --versions records.
+
+    python benchmarks/bench_install_bytes.py --nodes 5000 --versions 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from nukekit.core import Asset, Manifest, Repository, copy
+from nukekit.core.compression import codec_for_path
+from nukekit.core.serialization import encode_manifest
+
+
+def build_script(path: Path, nodes: int) -> None:
+    """Write a Nuke-script-like text file of blur/grade/merge nodes."""
+    lines = ['Root {\n inputs 0\n format "2048 1556 0 0 2048 1556 1 2K_Super_35"\n}\n']
+    for i in range(nodes):
+        lines.append(
+            f"Blur {{\n size {i % 17}.5\n name Blur{i}\n xpos {i * 10}\n}}\n"
+            f"Grade {{\n white {{1.{i % 9} 1 1 1}}\n name Grade{i}\n}}\n"
+        )
+    path.write_text("".join(lines))
+
+
+def build_manifest(versions: int) -> Manifest:
+    manifest = Manifest()
+    for i in range(versions):
+        asset = Asset.from_path(Path(f"tool{i % 500}_v1.{i // 500}.0.gizmo"))
+        asset.stamp_metadata()
+        asset.message = f"Fix edge case {i}"
+        manifest.add_asset(asset)
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--script", type=Path, help="Existing .nk file to publish")
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--versions", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        script = args.script
+        if script is None:
+            script = tmp_path / "comp_v1.0.0.nk"
+            build_script(script, args.nodes)
+        asset = Asset.from_path(script)
+        size = script.stat().st_size
+        manifest = encode_manifest(build_manifest(args.versions).data, compact=True)
+        print(f"asset {size / 1e6:.2f} MB, manifest {len(manifest) / 1e6:.2f} MB")
+
+        print(
+            f"{'codec':<6} {'asset bytes':>12} {'ratio':>6} {'store':>8} "
+            f"{'install':>8} {'manifest bytes':>15}"
+        )
+        for name in ("none", "gzip", "zstd"):
+            repository = Repository(tmp_path / name, ["Script"], compression=name)
+            stored = repository.get_stored_path(asset)
+
+            start = time.perf_counter()
+            copy.stream_copy(script, stored, write_codec=repository.codec)
+            store_time = time.perf_counter() - start
+            stored_size = stored.stat().st_size
+
+            start = time.perf_counter()
+            copy.restore_asset(stored, tmp_path / f"installed_{name}.nk")
+            install_time = time.perf_counter() - start
+
+            manifest_size = len(
+                codec_for_path(repository.manifest_path).compress(manifest)
+            )
+            ratio = size / stored_size
+            print(
+                f"{repository.codec.name:<6} {stored_size:>12,} {ratio:>5.1f}x "
+                f"{store_time * 1000:>6.1f}ms {install_time * 1000:>6.1f}ms "
+                f"{manifest_size:>15,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark manifest decoding on a generated manifest of about 50 MB.
+
+Compares the original object_hook + key_to_version decoder against the
+schema-aware single pass decoder used by serialization.load_json.
+
+    python benchmarks/bench_manifest_decode.py --size-mb 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from nukekit.core import Asset, AssetStatus, AssetType
+from nukekit.core.serialization import load_json
+from nukekit.core.versioning import Version
+
+# Size of one indented asset record in the generated manifest, roughly
+RECORD_BYTES = 580
+
+
+def legacy_load(path: Path) -> dict[Any, Any]:
+    """Decoding as done before the schema-aware decoder."""
+
+    def test_version(x: str) -> bool:
+        try:
+            Version.from_string(x)
+            return True
+        except Exception:
+            return False
+
+    def key_to_version(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return {
+                Version.from_string(k) if test_version(k) else k: key_to_version(v)
+                for k, v in obj.items()
+            }
+        return obj
+
+    def universal_decoder(dct: dict[Any, Any]) -> Any:
+        for k, v in dct.items():
+            if isinstance(v, str) and k.endswith("_path"):
+                dct[k] = Path(v)
+            elif isinstance(v, str) and k == "version":
+                dct[k] = Version.from_string(v)
+            elif isinstance(v, str) and k == "status":
+                dct[k] = AssetStatus(v)
+            elif isinstance(v, str) and k == "type":
+                dct[k] = AssetType(v)
+        if dct.pop("__type__", None) == "Asset":
+            return Asset(**dct)
+        return dct
+
+    with open(path) as file:
+        return key_to_version(json.load(file, object_hook=universal_decoder))
+
+
+def generate(path: Path, size_mb: int) -> int:
+    count = size_mb * 1_000_000 // RECORD_BYTES
+    data: dict[str, Any] = {"Gizmo": {}, "Script": {}}
+    for i in range(count):
+        asset_type = "Gizmo" if i % 2 else "Script"
+        name = f"asset{i // 40}"
+        version = f"{i % 40 // 10}.{i % 10}.0"
+        data[asset_type].setdefault(name, {})[version] = {
+            "name": name,
+            "version": version,
+            "source_path": f"/studio/nuke/{asset_type}/{name}_v{version}.gizmo",
+            "status": "published",
+            "type": asset_type,
+            "message": "Fixed edge handling for the matte input",
+            "author": f"artist{i % 25}",
+            "time": "01/03/2026, 10:15:00",
+            "id": f"{i:010d}",
+            "tags": [],
+            "category": "",
+            "description": "",
+            "__type__": "Asset",
+        }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+    return count
+
+
+def timed(label: str, func, path: Path) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:7.2f} s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "manifest.json"
+        count = generate(path, args.size_mb)
+        size = path.stat().st_size / 1e6
+        print(f"Generated {count} asset versions, {size:.1f} MB")
+
+        legacy = timed("object_hook + key_to_version", legacy_load, path)
+        fast = timed("schema-aware decoder", load_json, path)
+        print(f"speedup: {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
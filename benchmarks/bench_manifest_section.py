@@ -0,0 +1,99 @@
+"""
+Compare full manifest loading with memory-mapped section reads.
+
+Writes a generated manifest of about --size-mb with its offset table, then
+in fresh interpreters times loading everything versus one asset type or one
+asset, reporting peak RSS for each.
+
+    python benchmarks/bench_manifest_section.py --size-mb 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from nukekit.core import Asset, Manifest, ManifestStore
+
+# Roughly one indented asset record in the written manifest
+RECORD_BYTES = 335
+
+_PROBE = """
+import json, resource, sys, time
+from pathlib import Path
+from nukekit.core import ManifestStore
+
+path, mode = Path(sys.argv[1]), sys.argv[2]
+start = time.perf_counter()
+if mode == "full":
+    manifest = ManifestStore.load_from_json(path)
+elif mode == "type":
+    manifest = ManifestStore.load_section(path, "Gizmo")
+else:
+    manifest = ManifestStore.load_section(path, "Gizmo", "asset1")
+elapsed = time.perf_counter() - start
+try:
+    # VmHWM starts over at exec, ru_maxrss keeps the parent's peak on Linux
+    with open("/proc/self/status") as status:
+        rss = next(int(l.split()[1]) for l in status if l.startswith("VmHWM"))
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_kb": rss, "versions": len(manifest)}))
+"""
+
+
+def generate(path: Path, size_mb: int) -> int:
+    count = size_mb * 1_000_000 // RECORD_BYTES
+    manifest = Manifest()
+    for i in range(count):
+        suffix = ".gizmo" if i % 2 else ".nk"
+        asset = Asset.from_path(
+            Path(f"/studio/nuke/asset{i // 40}_v{i % 40 // 10}.{i % 10}.0{suffix}")
+        )
+        asset.message = "Fixed edge handling for the matte input"
+        asset.author = f"artist{i % 25}"
+        asset.id = f"{i:010d}"
+        manifest.add_asset(asset)
+    ManifestStore.save_to_json(manifest, path)
+    return count
+
+
+def probe(path: Path, mode: str) -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(path), mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return dict(json.loads(out))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "manifest.json"
+        count = generate(path, args.size_mb)
+        print(f"Generated {count} asset versions, {path.stat().st_size / 1e6:.1f} MB")
+
+        for mode, label in (
+            ("full", "full load"),
+            ("type", "one asset type"),
+            ("name", "one asset"),
+        ):
+            result = probe(path, mode)
+            print(
+                f"{label:<16} {result['seconds']:7.3f} s  "
+                f"peak RSS {result['rss_kb'] / 1024:7.1f} MB  "
+                f"({int(result['versions'])} versions)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measure memory used per loaded asset version.
+
+Writes a synthetic repository manifest, loads it back with
+ManifestStore.load_from_json under tracemalloc and reports bytes per asset.
+
+    python benchmarks/bench_memory.py --assets 2000 --versions 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from nukekit.core import Asset, AssetStatus, AssetType, Manifest, ManifestStore
+from nukekit.core.versioning import Version
+
+AUTHORS = ["alice", "bob", "carol", "dave"]
+
+
+def build_manifest(assets: int, versions: int) -> Manifest:
+    manifest = Manifest()
+    for i in range(assets):
+        asset_type = AssetType.GIZMO if i % 2 else AssetType.SCRIPT
+        for v in range(versions):
+            manifest.add_asset(
+                Asset(
+                    name=f"asset{i}",
+                    version=Version(1, v // 10, v % 10),
+                    source_path=Path(f"/repo/{asset_type}/asset{i}/asset{i}.gizmo"),
+                    status=AssetStatus.PUBLISHED,
+                    type=asset_type,
+                    message="Update",
+                    author=AUTHORS[(i + v) % len(AUTHORS)],
+                    time="01/01/2026, 10:00:00",
+                    id=f"{i:05d}{v:05d}",
+                )
+            )
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=2000)
+    parser.add_argument("--versions", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "manifest.json"
+        ManifestStore.save_to_json(build_manifest(args.assets, args.versions), path)
+
+        gc.collect()
+        tracemalloc.start()
+        manifest = ManifestStore.load_from_json(path)
+        gc.collect()
+        current, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    count = len(manifest)
+    print(f"Loaded {count} asset versions")
+    print(f"Retained: {current / 1e6:.1f} MB ({current / count:.0f} bytes/asset)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark serial vs parallel directory traversal in core.scanner.
+
+Builds a synthetic deep tree (or uses --root) and times scan_folder with
+different worker counts. Use --latency-ms to simulate the per-directory
+round trip of an SMB/NFS share on a local disk.
+
+    python benchmarks/bench_scan.py --depth 5 --fanout 4 --latency-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from nukekit.core import scanner
+
+
+def build_tree(root: Path, depth: int, fanout: int, files: int) -> int:
+    """Create a tree of depth levels with fanout subdirectories per level."""
+    count = 0
+    level = [root]
+    for d in range(depth):
+        next_level = []
+        for parent in level:
+            for i in range(fanout):
+                child = parent / f"dir{d}_{i}"
+                child.mkdir()
+                for f in range(files):
+                    (child / f"tool{d}{i}{f}_v1.{d}.{f}.gizmo").write_text("set cut")
+                    (child / f"notes{f}.txt").write_text("")
+                    count += 1
+                next_level.append(child)
+        level = next_level
+    return count
+
+
+def timed_scan(root: Path, workers: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scanner.scan_folder(root, workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", type=Path, help="Existing tree to scan")
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--files", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.latency_ms:
+        real_scandir = os.scandir
+
+        def slow_scandir(path):  # type: ignore[no-untyped-def]
+            time.sleep(args.latency_ms / 1000)
+            return real_scandir(path)
+
+        scanner.os.scandir = slow_scandir  # type: ignore[assignment]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root
+        if root is None:
+            root = Path(tmp)
+            count = build_tree(root, args.depth, args.fanout, args.files)
+            print(f"Synthetic tree: {count} assets, depth {args.depth}")
+
+        baseline = None
+        for workers in args.workers:
+            elapsed = timed_scan(root, workers, args.repeat)
+            baseline = baseline or elapsed
+            print(
+                f"workers={workers:<3} {elapsed * 1000:9.1f} ms "
+                f"({baseline / elapsed:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,13 @@ Manages all application dependencies and their lifecycles.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from ..core import Manifest, ManifestStore, Repository
+from ..core.copy import DEFAULT_COPY_WORKERS, DEFAULT_PER_DEVICE
 from ..core.exceptions import ConfigurationError
+from ..core.manifest_store import ManifestBackend, open_manifest_backend
 from ..utils import UserPaths, init_logger
 
 
@@ -28,8 +31,11 @@ class Dependencies:
     logger: logging.Logger
 
     # Manifests
-    repo_manifest: Manifest
+    repo_backend: ManifestBackend
     cached_manifest: Manifest
+    # Loaded on first use of repo_manifest: browsing commands only list
+    # versions or load one asset through repo_backend
+    _repo_manifest: Manifest | None = field(default=None, repr=False)
 
     @classmethod
     def create(
@@ -59,7 +65,7 @@ class Dependencies:
         user_paths = UserPaths()
 
         # Load manifests
-        repo_manifest = ManifestStore.load_from_json(repository.manifest_path)
+        repo_backend = open_manifest_backend(repository)
         cached_manifest = ManifestStore.load_from_json(user_paths.CACHED_MANIFEST)
 
         return cls(
@@ -67,7 +73,7 @@ class Dependencies:
             user_paths=user_paths,
             config=config,
             logger=logger,
-            repo_manifest=repo_manifest,
+            repo_backend=repo_backend,
             cached_manifest=cached_manifest,
         )
 
@@ -82,9 +88,57 @@ class Dependencies:
                 f"Missing required configuration keys: {', '.join(missing)}"
             )
 
+    @property
+    def scan_workers(self) -> int:
+        """Number of threads used to traverse directories while scanning."""
+        scanner_config: Any = self.config.get("scanner") or {}
+        return max(1, int(scanner_config.get("workers", 1)))
+
+    @property
+    def hardlink_installs(self) -> bool:
+        """Whether installs may hardlink uncompressed files from the repository."""
+        install_config: Any = self.config.get("install") or {}
+        return bool(install_config.get("hardlink", False))
+
+    @property
+    def verify_installs(self) -> bool:
+        """Whether installs check file content against the recorded digest."""
+        install_config: Any = self.config.get("install") or {}
+        return bool(install_config.get("verify", True))
+
+    @property
+    def copy_workers(self) -> int:
+        """Number of files copied in parallel by bulk installs."""
+        install_config: Any = self.config.get("install") or {}
+        return max(1, int(install_config.get("workers", DEFAULT_COPY_WORKERS)))
+
+    @property
+    def copy_per_device(self) -> int:
+        """Number of parallel copies allowed on one filesystem."""
+        install_config: Any = self.config.get("install") or {}
+        return max(1, int(install_config.get("per_filesystem", DEFAULT_PER_DEVICE)))
+
+    @property
+    def repo_manifest(self) -> Manifest:
+        """Full repository manifest, loaded under the read lock on first use."""
+        if self._repo_manifest is None:
+            with self.repository.read_lock():
+                self._repo_manifest = self.repo_backend.load()
+        return self._repo_manifest
+
+    @repo_manifest.setter
+    def repo_manifest(self, manifest: Manifest) -> None:
+        self._repo_manifest = manifest
+
+    @property
+    def loaded_repo_manifest(self) -> Manifest | None:
+        """Repository manifest if already loaded, None without loading it."""
+        return self._repo_manifest
+
     def reload_manifests(self) -> None:
         """Reload manifests from disk."""
-        self.repo_manifest = ManifestStore.load_from_json(self.repository.manifest_path)
+        with self.repository.read_lock():
+            self.repo_manifest = self.repo_backend.load()
         self.cached_manifest = ManifestStore.load_from_json(
             self.user_paths.CACHED_MANIFEST
         )
@@ -8,14 +8,22 @@ This is the entry point for all use cases. It handles:
 - Transaction management
 """
 
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
+from ..core import Asset
+from ..core.copy import CopyProgress
 from ..core.exceptions import (
     NukeKitError,
     UserAbortedError,
     WorkflowError,
 )
-from ..workflows import install_workflow, publish_workflow, scan_workflow
+from ..workflows import (
+    install_workflow,
+    publish_workflow,
+    scan_workflow,
+    verify_workflow,
+)
 from .container import Dependencies
 
 
@@ -128,18 +136,70 @@ class ApplicationService:
             self.logger.exception("Unexpected error during install")
             raise WorkflowError(f"Install failed: {e}") from e
 
-    def scan_assets(self, location: str = "local") -> dict[str, Any]:
+    def install_all_assets(
+        self, on_progress: Callable[[CopyProgress], None] | None = None
+    ) -> dict[str, Any]:
+        """
+        Install the latest version of every repository asset.
+
+        Args:
+            on_progress: Optional callback invoked as each file is copied.
+
+        Returns:
+            Dictionary with status, assets, report (copy.CopyReport) and
+            message. Status is "partial" if some assets failed to install.
+
+        Raises:
+            WorkflowError: If workflow fails
+        """
+        self.logger.info("Starting bulk install workflow")
+
+        try:
+            result = install_workflow.execute_all(
+                deps=self.deps, on_progress=on_progress
+            )
+            report = result["report"]
+            installed = len(result["assets"])
+            for failure in report.failed:
+                self.logger.error(
+                    f"Install of {failure.job.source_path.name} failed: "
+                    f"{failure.error}"
+                )
+            self.logger.info(f"Installed {installed}/{result['total']} assets")
+            return {
+                "status": "success" if report.ok else "partial",
+                "assets": result["assets"],
+                "report": report,
+                "message": f"Installed {installed} of {result['total']} assets "
+                f"({report.bytes_copied / 1e6:.1f} MB)",
+            }
+
+        except NukeKitError as e:
+            self.logger.error(f"Install failed: {e}")
+            raise WorkflowError(f"Install failed: {e}") from e
+
+        except Exception as e:
+            self.logger.exception("Unexpected error during install")
+            raise WorkflowError(f"Install failed: {e}") from e
+
+    def scan_assets(
+        self,
+        location: str = "local",
+        on_asset: Callable[[Asset], None] | None = None,
+    ) -> dict[str, Any]:
         """
         Execute scan workflow.
 
         Args:
             location: "local" to scan NUKE_DIR filesystem, "remote" to use
                 repository manifest.
+            on_asset: Optional callback invoked for each asset as it is found.
 
         Returns:
             Dictionary with:
                 - 'status': "success"
-                - 'assets': Nested dict from Manifest.to_dict()
+                - 'versions': Nested dict of type -> name -> versions,
+                  newest first
                 - 'count': Total number of asset versions
 
         Raises:
@@ -148,11 +208,13 @@ class ApplicationService:
         self.logger.info("Starting scan workflow", extra={"location": location})
 
         try:
-            result = scan_workflow.execute(deps=self.deps, location=location)
+            result = scan_workflow.execute(
+                deps=self.deps, location=location, on_asset=on_asset
+            )
             self.logger.info(f"Scan found {result['count']} assets")
             return {
                 "status": "success",
-                "assets": result["assets"],
+                "versions": result["versions"],
                 "count": result["count"],
             }
         except NukeKitError as e:
@@ -161,3 +223,128 @@ class ApplicationService:
         except Exception as e:
             self.logger.exception("Unexpected error during scan")
             raise WorkflowError(f"Scan failed: {e}") from e
+
+    def verify_assets(
+        self, workers: int | None = None, use_cache: bool = True
+    ) -> dict[str, Any]:
+        """
+        Check repository and installed files against their manifests.
+
+        Args:
+            workers: Hashing processes, one per core if None
+            use_cache: If True, skip files unchanged since they last verified
+
+        Returns:
+            Dictionary with status ("success" or "failed"), report
+            (integrity.VerifyReport) and message.
+
+        Raises:
+            WorkflowError: If workflow fails
+        """
+        self.logger.info("Starting verify workflow")
+
+        try:
+            report = verify_workflow.execute(
+                deps=self.deps, workers=workers, use_cache=use_cache
+            )["report"]
+            for problem in report.problems:
+                self.logger.error(
+                    f"{problem['manifest']} {problem['asset']}: {problem['problem']} "
+                    f"({problem['path']})"
+                )
+            message = (
+                f"Verified {report.checked} files, {report.hashed} hashed, "
+                f"{report.skipped} unchanged, {len(report.problems)} problems"
+            )
+            self.logger.info(message)
+            return {
+                "status": "success" if report.ok else "failed",
+                "report": report,
+                "message": message,
+            }
+
+        except NukeKitError as e:
+            self.logger.error(f"Verify failed: {e}")
+            raise WorkflowError(f"Verify failed: {e}") from e
+
+        except Exception as e:
+            self.logger.exception("Unexpected error during verify")
+            raise WorkflowError(f"Verify failed: {e}") from e
+
+    def transfer_manifest(
+        self, direction: str, path: Path | None = None
+    ) -> dict[str, Any]:
+        """
+        Import or export the repository manifest as JSON.
+
+        Used to migrate between manifest backends: export from one, switch
+        repository.manifest_backend, then import into the other.
+
+        Args:
+            direction: "import" to load path into the backend, "export" to
+                write the backend content to path
+            path: JSON manifest file, defaults to the repository manifest_path
+
+        Returns:
+            Dictionary with status, path, count and message.
+
+        Raises:
+            WorkflowError: If reading or writing fails.
+        """
+        path = path or self.deps.repository.manifest_path
+        backend = self.deps.repo_backend
+        self.logger.info(f"Starting manifest {direction} ({backend.name})")
+
+        try:
+            if direction == "import":
+                with self.deps.repository.write_lock():
+                    manifest = backend.import_json(path)
+                self.deps.repo_manifest = manifest
+            else:
+                with self.deps.repository.read_lock():
+                    manifest = backend.export_json(
+                        path, compact=self.deps.repository.compact_manifest
+                    )
+            return {
+                "status": "success",
+                "path": path,
+                "count": len(manifest),
+                "message": f"{direction.capitalize()}ed {len(manifest)} "
+                f"asset versions ({backend.name} backend, {path})",
+            }
+        except NukeKitError as e:
+            self.logger.error(f"Manifest {direction} failed: {e}")
+            raise WorkflowError(f"Manifest {direction} failed: {e}") from e
+        except Exception as e:
+            self.logger.exception(f"Unexpected error during manifest {direction}")
+            raise WorkflowError(f"Manifest {direction} failed: {e}") from e
+
+    def compact_manifest(self) -> dict[str, Any]:
+        """
+        Fold the repository manifest journal into a new snapshot.
+
+        Returns:
+            Dictionary with status, count and message.
+
+        Raises:
+            WorkflowError: If compaction fails.
+        """
+        backend = self.deps.repo_backend
+        self.logger.info(f"Starting manifest compaction ({backend.name})")
+
+        try:
+            with self.deps.repository.write_lock():
+                count = backend.compact()
+            self.deps.reload_manifests()
+            return {
+                "status": "success",
+                "count": count,
+                "message": f"Compacted {count} journal records "
+                f"({backend.name} backend)",
+            }
+        except NukeKitError as e:
+            self.logger.error(f"Compaction failed: {e}")
+            raise WorkflowError(f"Compaction failed: {e}") from e
+        except Exception as e:
+            self.logger.exception("Unexpected error during compaction")
+            raise WorkflowError(f"Compaction failed: {e}") from e
@@ -9,21 +9,24 @@ Thin layer that:
 """
 
 import argparse
+import json
 import logging
 import sys
 from argparse import Namespace
+from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 
 from .app.container import Dependencies
 from .app.service import ApplicationService
+from .core.assets import Asset
+from .core.copy import CopyProgress
 from .core.exceptions import (
     ConfigurationError,
     NukeKitError,
     UserAbortedError,
 )
-from .core.versioning import Version
 from .utils import ConfigLoader, init_logger
 
 console = Console()
@@ -114,6 +117,11 @@ def create_parser() -> argparse.ArgumentParser:
     )
     install_parser.add_argument("--asset", "-a", help="Specific asset to install")
     install_parser.add_argument("--version", "-ver", help="Specific version to install")
+    install_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Install the latest version of every asset, copying in parallel",
+    )
     install_parser.set_defaults(func=cmd_install)
 
     # Scan command
@@ -127,6 +135,52 @@ def create_parser() -> argparse.ArgumentParser:
     )
     scan_parser.set_defaults(func=cmd_scan)
 
+    # Manifest command
+    manifest_parser = subparsers.add_parser(
+        "manifest", help="Import or export the repository manifest as JSON"
+    )
+    manifest_parser.add_argument(
+        "direction",
+        choices=["import", "export"],
+        help="Import JSON into the configured backend, or export it to JSON",
+    )
+    manifest_parser.add_argument(
+        "path",
+        type=Path,
+        nargs="?",
+        help="JSON manifest file (default: repository manifest.json)",
+    )
+    manifest_parser.set_defaults(func=cmd_manifest)
+
+    # Compact command
+    compact_parser = subparsers.add_parser(
+        "compact", help="Fold the manifest journal into a new snapshot"
+    )
+    compact_parser.set_defaults(func=cmd_compact)
+
+    # Verify command
+    verify_parser = subparsers.add_parser(
+        "verify", help="Check stored and installed files against the manifests"
+    )
+    verify_parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help="Write the JSON report to a file instead of stdout",
+    )
+    verify_parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        help="Hashing processes (default: one per core)",
+    )
+    verify_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Hash every file, even if unchanged since it last verified",
+    )
+    verify_parser.set_defaults(func=cmd_verify)
+
     return parser
 
 
@@ -167,12 +221,21 @@ def cmd_install(args: Namespace, app: ApplicationService) -> int:
     Handle the install command.
 
     Args:
-        args: Parsed command-line arguments (may include --asset, --version).
+        args: Parsed command-line arguments (may include --asset, --version,
+            or --all alone).
         app: ApplicationService instance.
 
     Returns:
         Exit code: 0 on success, 1 on error.
     """
+    if args.all:
+        if args.asset or args.version:
+            console.print(
+                "[red]✗ --all cannot be combined with --asset or --version[/red]"
+            )
+            return 1
+        return _install_all(app)
+
     try:
         result = app.install_asset(
             asset_name=args.asset, version=args.version, interactive=True
@@ -196,6 +259,55 @@ def cmd_install(args: Namespace, app: ApplicationService) -> int:
         return 1
 
 
+def _install_all(app: ApplicationService) -> int:
+    """Install every asset with a progress bar, then list failed copies."""
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+    from rich.table import Table
+
+    try:
+        with Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Installing", total=None)
+
+            def _on_copy(event: CopyProgress) -> None:
+                progress.update(
+                    task,
+                    completed=event.done,
+                    total=event.total,
+                    description=f"Installing {event.job.destination_path.name}",
+                )
+
+            result = app.install_all_assets(on_progress=_on_copy)
+
+    except NukeKitError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        return 1
+
+    report = result["report"]
+    if report.ok:
+        console.print(
+            Panel(
+                f"[green]✓[/green] {result['message']}",
+                title="Success",
+                border_style="green",
+            )
+        )
+        return 0
+
+    table = Table(title="Failed copies")
+    table.add_column("File", style="cyan")
+    table.add_column("Error", style="red")
+    for failure in report.failed:
+        table.add_row(str(failure.job.source_path), str(failure.error))
+    console.print(table)
+    console.print(f"[yellow]{result['message']}[/yellow]")
+    return 1
+
+
 def cmd_scan(args: Namespace, app: ApplicationService) -> int:
     """
     Handle the scan command.
@@ -211,7 +323,15 @@ def cmd_scan(args: Namespace, app: ApplicationService) -> int:
         Exit code: 0 on success, 1 on error.
     """
     try:
-        result = app.scan_assets(location=args.location)
+        with console.status("Scanning...") as status:
+            found = 0
+
+            def _on_asset(asset: Asset) -> None:
+                nonlocal found
+                found += 1
+                status.update(f"Scanning... {found} found, last: {asset}")
+
+            result = app.scan_assets(location=args.location, on_asset=_on_asset)
 
         console.print(f"[green]Found {result['count']} assets[/green]")
 
@@ -223,34 +343,12 @@ def cmd_scan(args: Namespace, app: ApplicationService) -> int:
         table.add_column("Type", style="magenta")
         table.add_column("Versions", style="green")
 
-        def _version_sort_key(v: Version) -> tuple[int, int, int]:
-            """Sort key for versions."""
-            if hasattr(v, "major"):
-                return (v.major, v.minor, v.patch)
-            try:
-                ver = Version.from_string(str(v))
-                return (ver.major, ver.minor, ver.patch)
-            except (ValueError, TypeError):
-                return (0, 0, 0)
-
-        for asset_type, assets in result["assets"].items():
-            for name, versions in assets.items():
-                version_keys = list(versions.keys())
-                if not version_keys:
-                    version_str = ""
-                elif len(version_keys) == 1:
-                    version_str = f"[green]{version_keys[0]}[/green]"
-                else:
-                    latest = Version.highest_version(version_keys)
-                    version_parts = []
-                    for v in sorted(version_keys, key=_version_sort_key, reverse=True):
-                        v_str = str(v)
-                        if str(v) == str(latest):
-                            version_parts.append(f"[green]{v_str}[/green]")
-                        else:
-                            version_parts.append(f"[yellow]{v_str}[/yellow]")
-                    version_str = ", ".join(version_parts)
-                table.add_row(name, asset_type, version_str)
+        for asset_type, assets in result["versions"].items():
+            for name in sorted(assets):
+                versions = assets[name]
+                version_parts = [f"[green]{versions[0]}[/green]"] if versions else []
+                version_parts.extend(f"[yellow]{v}[/yellow]" for v in versions[1:])
+                table.add_row(name, asset_type, ", ".join(version_parts))
 
         console.print(table)
         return 0
@@ -260,5 +358,79 @@ def cmd_scan(args: Namespace, app: ApplicationService) -> int:
         return 1
 
 
+def cmd_manifest(args: Namespace, app: ApplicationService) -> int:
+    """
+    Handle the manifest command.
+
+    Args:
+        args: Parsed command-line arguments (includes direction and path).
+        app: ApplicationService instance.
+
+    Returns:
+        Exit code: 0 on success, 1 on error.
+    """
+    try:
+        result = app.transfer_manifest(args.direction, path=args.path)
+        console.print(f"[green]✓[/green] {result['message']}")
+        return 0
+
+    except NukeKitError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        return 1
+
+
+def cmd_compact(args: Namespace, app: ApplicationService) -> int:
+    """
+    Handle the compact command.
+
+    Args:
+        args: Parsed command-line arguments.
+        app: ApplicationService instance.
+
+    Returns:
+        Exit code: 0 on success, 1 on error.
+    """
+    try:
+        result = app.compact_manifest()
+        console.print(f"[green]✓[/green] {result['message']}")
+        return 0
+
+    except NukeKitError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        return 1
+
+
+def cmd_verify(args: Namespace, app: ApplicationService) -> int:
+    """
+    Handle the verify command.
+
+    Prints the JSON report to stdout, or writes it to --output and prints a
+    summary.
+
+    Args:
+        args: Parsed command-line arguments (includes output, workers, no_cache).
+        app: ApplicationService instance.
+
+    Returns:
+        Exit code: 0 if every file verified, 1 on problems or error.
+    """
+    try:
+        result = app.verify_assets(workers=args.workers, use_cache=not args.no_cache)
+    except NukeKitError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        return 1
+
+    report = json.dumps(result["report"].to_dict(), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report + "\n")
+        if result["report"].ok:
+            console.print(f"[green]✓[/green] {result['message']} ({args.output})")
+        else:
+            console.print(f"[red]✗ {result['message']} ({args.output})[/red]")
+    return 0 if result["report"].ok else 1
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
 import getpass
 import logging
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
@@ -42,7 +45,42 @@ INSTALL_STATUS = Literal["non_local", "local"]
 PUBLISH_STATUS = Literal["unpublished", "synced", "published"]
 
 
-@dataclass
+# "<name>_v<version>", split on the last "_v" followed by a digit
+_VERSIONED_STEM_RE = re.compile(r"(?P<name>.+)_v(?P<version>\d[^_]*)")
+
+
+def parse_asset_stem(stem: str) -> tuple[str, Version | None]:
+    """
+    Split a file stem into asset name and version.
+
+    Args:
+        stem: File name without suffix, e.g. "blur_v1.2.0"
+
+    Returns:
+        Tuple of (name, version), version is None for unversioned stems.
+
+    Raises:
+        ValueError: If the stem is versioned but the version is invalid
+    """
+    match = _VERSIONED_STEM_RE.fullmatch(stem)
+    if match is None:
+        return stem, None
+    return match["name"], Version.from_string(match["version"])
+
+
+@functools.cache
+def _session_user() -> str:
+    """Current user, resolved once per process."""
+    return getpass.getuser()
+
+
+@functools.cache
+def _session_time() -> str:
+    """Timestamp of this session, resolved once per process."""
+    return datetime.now().strftime("%d/%m/%Y, %H:%M:%S")
+
+
+@dataclass(slots=True)
 class Asset:
     name: str
     version: Version
@@ -56,16 +94,30 @@ class Asset:
     tags: list[str] = field(default_factory=list)
     category: str = ""
     description: str = ""
+    # File size in bytes, and as stored in the repository (compressed or not)
+    size: int = 0
+    stored_size: int = 0
+    # SHA-256 of the uncompressed file content, set when published
+    digest: str = ""
 
     def __post_init__(self) -> None:
-        """Ensure metadata at creation time"""
-        self.ensure_metadata()
+        """Share repeated strings and enum members between instances."""
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+        if isinstance(self.author, str):
+            self.author = sys.intern(self.author)
+        if isinstance(self.category, str):
+            self.category = sys.intern(self.category)
+        if not isinstance(self.type, AssetType):
+            self.type = AssetType(self.type)
+        if self.status is not None and not isinstance(self.status, AssetStatus):
+            self.status = AssetStatus(self.status)
 
     def _set_time(self) -> None:
-        self.time = str(datetime.now().strftime("%d/%m/%Y, %H:%M:%S"))
+        self.time = _session_time()
 
     def _set_author(self) -> None:
-        self.author = getpass.getuser()
+        self.author = _session_user()
 
     def _set_uuid(self) -> None:
         unique_id = shortuuid.uuid()[:10]
@@ -84,8 +136,8 @@ class Asset:
 
         self.message = message
 
-    def ensure_metadata(self) -> None:
-        """Ensure all metadata fields are set."""
+    def stamp_metadata(self) -> None:
+        """Stamp author, time and a new id. Called once, when publishing."""
         self._set_time()
         self._set_author()
         self._set_uuid()
@@ -126,7 +178,7 @@ class Asset:
 
     def __hash__(self) -> int:
         """Make Asset hashable for use in sets/dicts."""
-        return hash((self.name, str(self.version), self.type))
+        return hash((self.name, self.version, self.type))
 
     @classmethod
     def from_path(cls, asset_path: Path) -> Asset:
@@ -152,12 +204,9 @@ class Asset:
         asset_suffix = asset_path.suffix
 
         # Check if naming matches with enforced versioning
-        if "_v" in asset_stem:
-            asset_name = asset_stem.split(sep="_v")[0]
-            asset_version = Version.from_string(asset_stem.split(sep="_v")[1])
-        else:
+        asset_name, asset_version = parse_asset_stem(asset_stem)
+        if asset_version is None:
             # No specified version, local asset
-            asset_name = asset_stem
             asset_version = Version.from_string("0.1.0")
             logger.info(f"No specified version for {asset_path}")
 
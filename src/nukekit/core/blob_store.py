@@ -0,0 +1,111 @@
+"""
+Content-addressed blob store for published asset files.
+
+Blobs live under <root>/.objects/<first two hex digits>/<sha256><suffix>,
+keyed by the SHA-256 of the uncompressed file content. Publishing a file
+whose content is already stored writes nothing new; the version path in
+the repository becomes a hardlink to the existing blob.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from .compression import IDENTITY, Codec
+from .copy import DEFAULT_STRATEGIES, CopyStrategy, copy_file, stream_copy
+from .exceptions import ChecksumMismatchError, FileOperationError
+
+logger = logging.getLogger(__name__)
+
+# Version paths share the blob's inode where possible, whatever the filesystem
+_LINK_STRATEGIES = (
+    CopyStrategy.HARDLINK,
+    *(s for s in DEFAULT_STRATEGIES if s is not CopyStrategy.HARDLINK),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Blob:
+    """A stored blob and the sizes of its content."""
+
+    digest: str
+    path: Path
+    size: int
+    stored_size: int
+    created: bool
+
+
+class BlobStore:
+    """Deduplicating store of asset file content."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize blob store.
+
+        Args:
+            root: Directory holding the blobs, created on first write
+        """
+        self.root = root
+
+    def path_for(self, digest: str, codec: Codec = IDENTITY) -> Path:
+        """Return where the blob of a digest is stored with codec."""
+        return self.root / digest[:2] / f"{digest}{codec.suffix}"
+
+    def put(self, source_path: Path, codec: Codec = IDENTITY) -> Blob:
+        """
+        Store a file's content, unless a blob with the same content exists.
+
+        The local source is hashed first, so nothing is written to the
+        repository when the blob exists. Otherwise it is read again while
+        the blob is written, and rejected if it changed in between.
+
+        Args:
+            source_path: File to store
+            codec: Codec the blob is written with
+
+        Returns:
+            The stored blob; created is False if it already existed.
+
+        Raises:
+            FileOperationError: If the file could not be stored
+        """
+        try:
+            with open(source_path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                digest = hashlib.file_digest(file, "sha256").hexdigest()
+            path = self.path_for(digest, codec)
+            created = not path.exists()
+            if created:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                stream_copy(source_path, path, write_codec=codec, digest=digest)
+            stored_size = path.stat().st_size
+        except ChecksumMismatchError as e:
+            raise FileOperationError(
+                f"{source_path} changed while it was stored"
+            ) from e
+        except OSError as e:
+            raise FileOperationError(f"Could not store {source_path}: {e}") from e
+
+        logger.debug(f"{'Stored' if created else 'Reused'} blob {digest[:12]}")
+        return Blob(digest, path, size, stored_size, created)
+
+    def link(self, blob: Blob, destination_path: Path) -> None:
+        """
+        Make destination_path refer to a blob.
+
+        Uses a hardlink, or a reflink or copy of the blob where the
+        filesystem does not support hardlinks.
+
+        Raises:
+            FileOperationError: If the blob could not be linked or copied
+        """
+        try:
+            copy_file(
+                blob.path, destination_path, hardlink=True, strategies=_LINK_STRATEGIES
+            )
+        except OSError as e:
+            raise FileOperationError(f"Could not link {destination_path}: {e}") from e
@@ -0,0 +1,140 @@
+"""
+Compression codecs for repository storage.
+
+Manifests and asset files can be stored compressed on slow remote shares.
+The codec of a stored file is given by its suffix (".gz", ".zst"), so
+reading is transparent whatever the repository is configured to write.
+
+zstd needs the optional zstandard package (`pip install "nukekit[zstd]"`);
+without it, gzip from the standard library is used instead.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import zlib
+from pathlib import Path
+from typing import BinaryIO, cast
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class Codec:
+    """Identity codec, the base for compressing codecs."""
+
+    name = "none"
+    suffix = ""
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def reader(self, file: BinaryIO) -> BinaryIO:
+        """Wrap a binary file to read decompressed data from it."""
+        return file
+
+    def writer(self, file: BinaryIO) -> BinaryIO:
+        """Wrap a binary file to write compressed data to it."""
+        return file
+
+
+class GzipCodec(Codec):
+    """gzip from the standard library."""
+
+    name = "gzip"
+    suffix = ".gz"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        # mtime=0 keeps output identical for identical input
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+    def reader(self, file: BinaryIO) -> BinaryIO:
+        return cast(BinaryIO, gzip.GzipFile(fileobj=file, mode="rb"))
+
+    def writer(self, file: BinaryIO) -> BinaryIO:
+        return cast(
+            BinaryIO,
+            gzip.GzipFile(fileobj=file, mode="wb", compresslevel=self.level, mtime=0),
+        )
+
+
+class ZstdCodec(Codec):
+    """Zstandard, faster and denser than gzip. Needs the zstandard package."""
+
+    name = "zstd"
+    suffix = ".zst"
+
+    def __init__(self, level: int = 10):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+    def reader(self, file: BinaryIO) -> BinaryIO:
+        return cast(BinaryIO, zstandard.ZstdDecompressor().stream_reader(file))
+
+    def writer(self, file: BinaryIO) -> BinaryIO:
+        compressor = zstandard.ZstdCompressor(level=self.level)
+        return cast(BinaryIO, compressor.stream_writer(file, closefd=False))
+
+
+IDENTITY = Codec()
+
+# Raised reading a truncated or corrupted compressed file
+DECODE_ERRORS: tuple[type[Exception], ...] = (EOFError, zlib.error, gzip.BadGzipFile)
+if zstandard is not None:
+    DECODE_ERRORS += (zstandard.ZstdError,)
+
+# Suffixes a stored file may carry, see codec_for_path
+STORED_SUFFIXES = (GzipCodec.suffix, ZstdCodec.suffix)
+
+
+def get_codec(name: str | None) -> Codec:
+    """
+    Return the codec configured by name.
+
+    Args:
+        name: "none", "gzip" or "zstd"; zstd falls back to gzip when the
+            zstandard package is missing
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if not name or name == "none":
+        return IDENTITY
+    if name == "gzip":
+        return GzipCodec()
+    if name == "zstd":
+        if zstandard is None:
+            logger.warning("zstandard is not installed, using gzip compression")
+            return GzipCodec()
+        return ZstdCodec()
+    raise ValueError(f"Unknown compression: {name}")
+
+
+def codec_for_path(path: Path) -> Codec:
+    """Return the codec a stored file was written with, from its suffix."""
+    if path.suffix == GzipCodec.suffix:
+        return GzipCodec()
+    if path.suffix == ZstdCodec.suffix:
+        if zstandard is None:
+            raise ValueError(f"{path} is zstd compressed, install zstandard")
+        return ZstdCodec()
+    return IDENTITY
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable
 from typing import Any, Literal, Union, get_args, get_origin
 
 from InquirerPy.inquirer import fuzzy  # type: ignore[attr-defined]
@@ -7,8 +8,8 @@ from rich.tree import Tree
 from simple_term_menu import TerminalMenu  # type: ignore[import-untyped]
 
 from .assets import Asset
+from .manifest import Manifest
 from .serialization import stringify_keys
-from .versioning import Version
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,7 @@ def _unique_asset_names(
 
 
 def _version_choices_for_asset(
-    data: dict[Any, Any], type_key: Any, name: str
+    manifest: Manifest, type_key: Any, name: str
 ) -> list[tuple[str, Asset]]:
     """
     Build version choices for a specific asset.
@@ -82,7 +83,7 @@ def _version_choices_for_asset(
     - Each individual version as a separate option
 
     Args:
-        data: Nested dict from Manifest.to_dict().
+        manifest: Manifest holding the asset.
         type_key: Asset type key (e.g., AssetType enum or string).
         name: Asset name.
 
@@ -90,29 +91,13 @@ def _version_choices_for_asset(
         List of (display_string, Asset) tuples sorted by version
         (newest first). First entry is always "Latest (x.y.z)".
     """
-    version_dict = data[type_key][name]
-    if not version_dict:
+    sorted_versions = manifest.sorted_versions(type_key, name, reverse=True)
+    if not sorted_versions:
         return []
-    version_keys = list(version_dict.keys())
-    latest = Version.highest_version(version_keys)
-    # Resolve Asset for latest (key might be Version or str)
-    latest_asset = next(
-        (version_dict[k] for k in version_dict if str(k) == str(latest)),
-        next(iter(version_dict.values())),
-    )
-
-    def _version_sort_key(v: Any) -> tuple[int, int, int]:
-        if hasattr(v, "major"):
-            return (v.major, v.minor, v.patch)
-        try:
-            ver = Version.from_string(str(v))
-            return (ver.major, ver.minor, ver.patch)
-        except (ValueError, TypeError):
-            return (0, 0, 0)
-
-    sorted_versions = sorted(version_dict.keys(), key=_version_sort_key, reverse=True)
+    version_dict = manifest.data[type_key][name]
+    latest = sorted_versions[0]
     choices: list[tuple[str, Asset]] = [
-        (f"Latest ({latest})", latest_asset),
+        (f"Latest ({latest})", version_dict[latest]),
     ]
     for v in sorted_versions:
         choices.append((str(v), version_dict[v]))
@@ -120,9 +105,10 @@ def _version_choices_for_asset(
 
 
 def choose_asset_fuzzy(
-    manifest_data: dict[Any, Any],
+    manifest: Manifest | dict[Any, Any],
     prompt: str = "Select asset",
     prompt_version: str = "Version to install",
+    load_section: Callable[[Any, str], Manifest] | None = None,
 ) -> Asset | None:
     """
     Two-step picker: choose asset (name) then version (Latest or specific).
@@ -131,15 +117,18 @@ def choose_asset_fuzzy(
     Step 2: Fuzzy list "Latest (x.y.z)" plus each available version.
 
     Args:
-        manifest_data: Nested dict from Manifest.to_dict()
-        (type -> name -> version -> Asset).
+        manifest: Manifest to pick from (type -> name -> version -> Asset),
+            or only its type -> names when load_section is given.
         prompt: Prompt for the asset step.
         prompt_version: Prompt for the version step (e.g. "Version to install").
+        load_section: Loads the versions of the chosen (type, name), so
+            only that asset is read.
 
     Returns:
         Selected Asset, or None if user aborted.
     """
-    asset_choices = _unique_asset_names(manifest_data)
+    names = manifest.data if isinstance(manifest, Manifest) else manifest
+    asset_choices = _unique_asset_names(names)
     if not asset_choices:
         return None
 
@@ -162,7 +151,10 @@ def choose_asset_fuzzy(
     if type_key is None or name is None:
         return None
 
-    version_choices = _version_choices_for_asset(manifest_data, type_key, name)
+    if load_section is not None:
+        manifest = load_section(type_key, name)
+    assert isinstance(manifest, Manifest)
+    version_choices = _version_choices_for_asset(manifest, type_key, name)
     if not version_choices:
         return None
     if len(version_choices) == 1:
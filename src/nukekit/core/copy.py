@@ -1,19 +1,186 @@
 from __future__ import annotations
 
+import errno
+import hashlib
 import logging
+import os
 import shutil
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
 
+from ..utils.fileio import temporary_path
+from .compression import DECODE_ERRORS, IDENTITY, Codec, codec_for_path
+from .exceptions import ChecksumMismatchError, FileOperationError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_COPY_CHUNK = 1 << 20
+_KERNEL_CHUNK = 1 << 26
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# ioctl request cloning a whole file, in fcntl since Python 3.12
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+DEFAULT_COPY_WORKERS = 8
+DEFAULT_PER_DEVICE = 4
+
+
+class CopyStrategy(StrEnum):
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    COPY_FILE_RANGE = "copy_file_range"
+    SENDFILE = "sendfile"
+    BUFFERED = "buffered"
+
+
+def _reflink(src: int, dst: int) -> None:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink unsupported")
+    fcntl.ioctl(dst, _FICLONE, src)
+
+
+def _copy_file_range(src: int, dst: int) -> None:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range unsupported")
+    while os.copy_file_range(src, dst, _KERNEL_CHUNK):
+        pass
+
+
+def _sendfile(src: int, dst: int) -> None:
+    if not sys.platform.startswith("linux"):
+        # Elsewhere sendfile only writes to sockets
+        raise OSError(errno.ENOTSOCK, "sendfile to a file unsupported")
+    offset = 0
+    while sent := os.sendfile(dst, src, offset, _KERNEL_CHUNK):
+        offset += sent
+
+
+def _buffered(src: int, dst: int) -> None:
+    while chunk := os.read(src, _COPY_CHUNK):
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst, view) :]
+
+
+_DATA_COPIES: dict[CopyStrategy, Callable[[int, int], None]] = {
+    CopyStrategy.REFLINK: _reflink,
+    CopyStrategy.COPY_FILE_RANGE: _copy_file_range,
+    CopyStrategy.SENDFILE: _sendfile,
+    CopyStrategy.BUFFERED: _buffered,
+}
+
+# Fastest first; HARDLINK is only tried when allowed, see copy_file
+DEFAULT_STRATEGIES = (
+    CopyStrategy.REFLINK,
+    CopyStrategy.HARDLINK,
+    CopyStrategy.COPY_FILE_RANGE,
+    CopyStrategy.SENDFILE,
+    CopyStrategy.BUFFERED,
+)
+
 
-def copy_asset(source_path: Path, destination_path: Path) -> bool:
+def _copy_data(
+    strategy: CopyStrategy, source_path: Path, destination_path: Path
+) -> None:
+    """Copy content with one strategy, removing the destination on failure."""
+    src = os.open(source_path, os.O_RDONLY | _O_BINARY)
+    try:
+        dst = os.open(
+            destination_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666
+        )
+        try:
+            _DATA_COPIES[strategy](src, dst)
+        except BaseException:
+            os.close(dst)
+            destination_path.unlink(missing_ok=True)
+            raise
+        os.close(dst)
+    finally:
+        os.close(src)
+
+
+def copy_file(
+    source_path: Path,
+    destination_path: Path,
+    hardlink: bool = False,
+    strategies: Sequence[CopyStrategy] = DEFAULT_STRATEGIES,
+) -> CopyStrategy:
+    """
+    Copy a file with the fastest strategy the filesystems support.
+
+    Tries a reflink (copy-on-write clone), a hardlink if allowed, an
+    in-kernel copy_file_range or sendfile, then a buffered copy. The copy
+    is made to a temporary sibling and renamed over the destination, so
+    readers see the old file or the new one, never neither, a failed copy
+    leaves the destination in place, and a previously hardlinked install
+    never modifies the repository file.
+
+    Args:
+        source_path: File to copy
+        destination_path: Destination file, replaced if it exists
+        hardlink: If True, allow linking the destination to the source; only
+            for installs that are never edited in place
+        strategies: Strategies to try, in order
+
+    Returns:
+        The strategy that copied the file.
+
+    Raises:
+        shutil.SameFileError: If source and destination are the same path
+        OSError: If no strategy could copy the file
+    """
+    if os.path.abspath(source_path) == os.path.abspath(destination_path):
+        raise shutil.SameFileError(f"{source_path} and {destination_path} are the same")
+    if not hardlink:
+        strategies = [s for s in strategies if s is not CopyStrategy.HARDLINK]
+    if not strategies:
+        raise ValueError("No copy strategy given")
+
+    temporary = temporary_path(destination_path)
+    temporary.unlink(missing_ok=True)
+    try:
+        for strategy in strategies:
+            try:
+                if strategy is CopyStrategy.HARDLINK:
+                    os.link(source_path, temporary)
+                else:
+                    _copy_data(strategy, source_path, temporary)
+                break
+            except OSError as e:
+                if strategy is strategies[-1]:
+                    raise
+                logger.debug(f"{strategy} unavailable for {destination_path}: {e}")
+
+        if strategy is not CopyStrategy.HARDLINK:
+            shutil.copystat(source_path, temporary)
+        os.replace(temporary, destination_path)
+    finally:
+        # Left behind if it was already a link to the same file as destination
+        temporary.unlink(missing_ok=True)
+    logger.debug(f"Copied {source_path} -> {destination_path} ({strategy})")
+    return strategy
+
+
+def copy_asset(
+    source_path: Path, destination_path: Path, hardlink: bool = False
+) -> bool:
     copied = False
     if not source_path.exists():
         raise FileExistsError("File")
 
     try:
-        shutil.copy2(source_path, destination_path)
+        copy_file(source_path, destination_path, hardlink=hardlink)
         copied = True
     except shutil.SameFileError:
         logger.error("Source and destination represent the same file.")
@@ -24,3 +191,243 @@ def copy_asset(source_path: Path, destination_path: Path) -> bool:
     except Exception as e:
         logger.error(f"An error occurred: {e}")
     return copied
+
+
+def stream_copy(
+    source_path: Path,
+    destination_path: Path,
+    read_codec: Codec = IDENTITY,
+    write_codec: Codec = IDENTITY,
+    digest: str = "",
+) -> tuple[str, int]:
+    """
+    Copy a file through memory, hashing its content in the same pass.
+
+    The digest is taken over the uncompressed content, so it is the same
+    whatever codecs the file is read and written with. The copy is written
+    to a temporary sibling, given the source's permissions and times, and
+    renamed over the destination, see copy_file.
+
+    Args:
+        source_path: File to read, decoded with read_codec
+        destination_path: File to write, encoded with write_codec
+        read_codec: Codec source_path was stored with
+        write_codec: Codec to store destination_path with
+        digest: Expected SHA-256 of the content, empty to accept any; the
+            destination is left untouched if it does not match
+
+    Returns:
+        SHA-256 hex digest and size in bytes of the uncompressed content.
+
+    Raises:
+        OSError: If the file could not be copied
+        EOFError, zlib.error: If source_path cannot be decoded, see
+            compression.DECODE_ERRORS
+        ChecksumMismatchError: If the content does not match digest
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    temporary = temporary_path(destination_path)
+    try:
+        with open(source_path, "rb") as src, open(temporary, "wb") as dst:
+            with read_codec.reader(src) as data, write_codec.writer(dst) as out:
+                while chunk := data.read(_COPY_CHUNK):
+                    sha256.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+        actual = sha256.hexdigest()
+        if digest and actual != digest:
+            raise ChecksumMismatchError(
+                f"{source_path} is corrupted: SHA-256 {actual}, expected {digest}"
+            )
+        shutil.copystat(source_path, temporary)
+        os.replace(temporary, destination_path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return actual, size
+
+
+def restore_asset(
+    stored_path: Path,
+    destination_path: Path,
+    hardlink: bool = False,
+    digest: str = "",
+) -> None:
+    """
+    Copy a stored asset file out of the repository, decompressing it.
+
+    The codec is taken from the stored file suffix. With a digest, the
+    content is hashed while it is copied and only replaces the destination
+    if it matches; the reflink and hardlink fast paths are skipped then.
+
+    Args:
+        stored_path: Stored file in the repository
+        destination_path: Installed file, replaced if it exists
+        hardlink: If True, uncompressed files may be hardlinked, see copy_file
+        digest: SHA-256 recorded for the asset, empty to skip verification
+
+    Raises:
+        FileOperationError: If the file could not be restored
+        ChecksumMismatchError: If the content does not match digest, or
+            the stored file cannot be decompressed
+    """
+    codec = codec_for_path(stored_path)
+    if codec is IDENTITY and not digest:
+        if not copy_asset(stored_path, destination_path, hardlink=hardlink):
+            raise FileOperationError(f"Could not copy {stored_path}")
+        return
+    try:
+        stream_copy(stored_path, destination_path, read_codec=codec, digest=digest)
+    except DECODE_ERRORS as e:
+        raise ChecksumMismatchError(f"{stored_path} is corrupted: {e}") from e
+    except OSError as e:
+        raise FileOperationError(f"Could not restore {stored_path}: {e}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class CopyJob:
+    """One file to copy in a batch."""
+
+    source_path: Path
+    destination_path: Path
+
+
+@dataclass(frozen=True, slots=True)
+class CopyFailure:
+    """A job of a batch that failed, with its error."""
+
+    job: CopyJob
+    error: Exception
+
+
+@dataclass(frozen=True, slots=True)
+class CopyProgress:
+    """Progress of a batch, passed to the on_progress callback of copy_files."""
+
+    job: CopyJob
+    error: Exception | None
+    done: int
+    total: int
+
+
+@dataclass(slots=True)
+class CopyReport:
+    """Outcome of a batch of copies, see copy_files."""
+
+    copied: list[CopyJob] = field(default_factory=list)
+    failed: list[CopyFailure] = field(default_factory=list)
+    # Bytes read from the sources of copied jobs
+    bytes_copied: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+class _DeviceLimits:
+    """Bounds concurrent copies per filesystem, keyed by st_dev."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self._lock = threading.Lock()
+        self._semaphores: dict[int, threading.Semaphore] = {}
+        self._devices: dict[Path, int] = {}
+
+    def _device(self, path: Path) -> int:
+        directory = path.parent
+        with self._lock:
+            device = self._devices.get(directory)
+        if device is None:
+            try:
+                device = os.stat(directory).st_dev
+            except OSError:
+                # The copy itself reports the error
+                device = -1
+            with self._lock:
+                self._devices[directory] = device
+        return device
+
+    @contextmanager
+    def hold(self, job: CopyJob) -> Iterator[None]:
+        """Hold a slot on the source and destination filesystems."""
+        devices = {self._device(job.source_path), self._device(job.destination_path)}
+        with self._lock:
+            semaphores = [
+                self._semaphores.setdefault(d, threading.Semaphore(self.limit))
+                for d in sorted(devices)
+            ]
+        # Acquired in device order, so two jobs never wait on each other
+        with ExitStack() as stack:
+            for semaphore in semaphores:
+                stack.enter_context(semaphore)
+            yield
+
+
+def _run_job(
+    job: CopyJob, copy: Callable[[Path, Path], object], limits: _DeviceLimits
+) -> int:
+    with limits.hold(job):
+        size = os.stat(job.source_path).st_size
+        copy(job.source_path, job.destination_path)
+    return size
+
+
+def copy_files(
+    jobs: Iterable[CopyJob | tuple[Path, Path]],
+    copy: Callable[[Path, Path], object] = copy_file,
+    workers: int = DEFAULT_COPY_WORKERS,
+    per_device: int = DEFAULT_PER_DEVICE,
+    on_progress: Callable[[CopyProgress], None] | None = None,
+) -> CopyReport:
+    """
+    Copy a batch of files in parallel.
+
+    Jobs run on a pool of workers threads, with at most per_device copies
+    reading from or writing to the same filesystem at once. A failed job
+    does not stop the others; its error is collected in the report.
+
+    Args:
+        jobs: CopyJob or (source, destination) pairs
+        copy: Function copying one file, copy_file by default; restore_asset
+            for installs from the repository
+        workers: Maximum number of concurrent copies
+        per_device: Maximum number of concurrent copies per filesystem
+        on_progress: Called in the calling thread as each job finishes
+
+    Returns:
+        Report of copied and failed jobs.
+    """
+    batch = [job if isinstance(job, CopyJob) else CopyJob(*job) for job in jobs]
+    limits = _DeviceLimits(per_device)
+    report = CopyReport()
+    if not batch:
+        return report
+
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(batch))), thread_name_prefix="copy"
+    )
+    try:
+        futures: dict[Future[int], CopyJob] = {
+            pool.submit(_run_job, job, copy, limits): job for job in batch
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            error: Exception | None = None
+            try:
+                report.bytes_copied += future.result()
+                report.copied.append(job)
+            except Exception as e:
+                logger.debug(f"Copy of {job.source_path} failed: {e}")
+                report.failed.append(CopyFailure(job, e))
+                error = e
+            if on_progress is not None:
+                on_progress(CopyProgress(job, error, done, len(batch)))
+    finally:
+        # On interruption, drop the jobs not started yet
+        pool.shutdown(cancel_futures=True)
+
+    logger.debug(
+        f"Copied {len(report.copied)}/{len(batch)} files, "
+        f"{report.bytes_copied} bytes, {len(report.failed)} failed"
+    )
+    return report
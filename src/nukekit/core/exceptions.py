@@ -64,6 +64,12 @@ class ManifestNotFoundError(NukeKitError):
     pass
 
 
+class ManifestConflictError(ManifestError):
+    """Manifest kept changing concurrently and could not be committed."""
+
+    pass
+
+
 class ManifestCorruptedError(ManifestError):
     """Manifest file is corrupted."""
 
@@ -82,6 +88,12 @@ class RepositoryNotFoundError(RepositoryError):
     pass
 
 
+class RepositoryLockTimeoutError(RepositoryError):
+    """Repository lock could not be acquired in time."""
+
+    pass
+
+
 class ScannerError(NukeKitError):
     """Errors related to repository operations."""
 
@@ -101,6 +113,12 @@ class FileOperationError(StorageError):
     pass
 
 
+class ChecksumMismatchError(StorageError):
+    """File content does not match the digest recorded in the manifest."""
+
+    pass
+
+
 # Application Layer Exceptions
 class WorkflowError(NukeKitError):
     """Errors during workflow execution."""
@@ -0,0 +1,266 @@
+"""
+Integrity checks of stored and installed asset files.
+
+Every manifest entry is checked for existence and size with a stat, and
+its content hashed against the recorded digest on a process pool. Files
+whose stat data did not change since they last verified are not hashed
+again, see VerifyCache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..utils.fileio import write_atomic
+from .compression import DECODE_ERRORS, codec_for_path
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK = 1 << 20
+
+# Files modified this recently may still change within the same mtime tick,
+# so their result is never cached, as for the scan index.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class VerifyCache:
+    """
+    Persisted stat data of files that matched their digest.
+
+    Maps each verified path to its (inode, size, mtime) and digest. A file
+    with the same stat data and expected digest on the next run is skipped
+    without being read.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: Path | None = None, files: dict[str, Any] | None = None):
+        """
+        Initialize verify cache.
+
+        Args:
+            path: File the cache is persisted to
+            files: [inode, size, mtime_ns, digest] records keyed by path
+        """
+        self.path = path
+        self.files: dict[str, Any] = files or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> VerifyCache:
+        """Load cache from disk, returning an empty one if missing or invalid."""
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable verify cache {path}: {e}")
+            return cls(path)
+
+        if data.get("version") != cls.FORMAT_VERSION:
+            logger.info(f"Verify cache {path} has an old format, rebuilding")
+            return cls(path)
+        return cls(path, data.get("files", {}))
+
+    def save(self) -> None:
+        """Persist cache to disk if anything changed since loading."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            self.path,
+            json.dumps({"version": self.FORMAT_VERSION, "files": self.files}).encode(),
+        )
+        self._dirty = False
+        logger.debug(f"Saved verify cache to {self.path}")
+
+    def is_verified(self, path: str, st: os.stat_result, digest: str) -> bool:
+        """Check whether path verified against digest with this stat data."""
+        return self.files.get(path) == [*_stat_key(st), digest]
+
+    def record(self, path: str, st: os.stat_result, digest: str) -> None:
+        """Remember that path matched digest, unless it changed too recently."""
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return
+        self.files[path] = [*_stat_key(st), digest]
+        self._dirty = True
+
+    def forget(self, path: str) -> None:
+        if self.files.pop(path, None) is not None:
+            self._dirty = True
+
+    def retain(self, paths: set[str]) -> None:
+        """Drop records of files no longer checked."""
+        stale = [path for path in self.files if path not in paths]
+        for path in stale:
+            del self.files[path]
+        if stale:
+            self._dirty = True
+
+
+@dataclass(frozen=True, slots=True)
+class VerifyTarget:
+    """A manifest entry and the file expected to hold it."""
+
+    manifest: str
+    asset: str
+    type: str
+    path: Path
+    # Expected size in bytes and SHA-256, 0 and "" when not recorded
+    size: int = 0
+    digest: str = ""
+
+
+@dataclass(slots=True)
+class VerifyReport:
+    """Outcome of verify_files, serializable with to_dict."""
+
+    checked: int = 0
+    hashed: int = 0
+    skipped: int = 0
+    problems: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+    def add_problem(
+        self,
+        target: VerifyTarget,
+        problem: str,
+        expected: Any = None,
+        actual: Any = None,
+    ) -> None:
+        self.problems.append(
+            {
+                "manifest": target.manifest,
+                "asset": target.asset,
+                "type": target.type,
+                "path": str(target.path),
+                "problem": problem,
+                "expected": expected,
+                "actual": actual,
+            }
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "checked": self.checked,
+            "hashed": self.hashed,
+            "skipped": self.skipped,
+            "problems": self.problems,
+        }
+
+
+def hash_file(path: str) -> tuple[str, str]:
+    """
+    SHA-256 of a stored file's uncompressed content.
+
+    Runs in pool processes, so it takes and returns plain strings.
+
+    Returns:
+        Hex digest and an empty error, or an empty digest and the error.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as file:
+            with codec_for_path(Path(path)).reader(file) as data:
+                while chunk := data.read(_HASH_CHUNK):
+                    digest.update(chunk)
+    except (OSError, ValueError, *DECODE_ERRORS) as e:
+        return "", str(e)
+    return digest.hexdigest(), ""
+
+
+def verify_files(
+    targets: Iterable[VerifyTarget],
+    workers: int | None = None,
+    cache: VerifyCache | None = None,
+) -> VerifyReport:
+    """
+    Check that files exist and match their recorded size and digest.
+
+    Existence and size are checked with a stat in the calling process.
+    Digests are computed on a pool of processes, reading each inode once
+    even when several entries share it, as hardlinked blobs do. Files that
+    cache records as verified with the same stat data are not read.
+
+    Args:
+        targets: Entries to check
+        workers: Hashing processes, os.cpu_count() if None; 1 hashes in
+            the calling process
+        cache: Stat cache of verified files, updated with the new results
+
+    Returns:
+        Report of the checks and problems found.
+    """
+    report = VerifyReport()
+    pending: dict[tuple[int, int], list[tuple[VerifyTarget, os.stat_result]]] = {}
+    seen: set[str] = set()
+    for target in targets:
+        report.checked += 1
+        seen.add(str(target.path))
+        try:
+            st = os.stat(target.path)
+        except FileNotFoundError:
+            report.add_problem(target, "missing")
+            continue
+        except OSError as e:
+            report.add_problem(target, "unreadable", actual=str(e))
+            continue
+
+        if target.size and st.st_size != target.size:
+            report.add_problem(target, "size", target.size, st.st_size)
+            continue
+        if not target.digest:
+            continue
+        if cache is not None and cache.is_verified(str(target.path), st, target.digest):
+            report.skipped += 1
+            continue
+        pending.setdefault((st.st_dev, st.st_ino), []).append((target, st))
+
+    paths = [str(entries[0][0].path) for entries in pending.values()]
+    if workers == 1 or len(paths) < 2:
+        results = list(map(hash_file, paths))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 8))
+            results = list(pool.map(hash_file, paths, chunksize=chunksize))
+    report.hashed = len(results)
+
+    for entries, (digest, error) in zip(pending.values(), results):
+        for target, st in entries:
+            if digest == target.digest:
+                if cache is not None:
+                    cache.record(str(target.path), st, digest)
+                continue
+            if error:
+                report.add_problem(target, "unreadable", actual=error)
+            else:
+                report.add_problem(target, "digest", target.digest, digest)
+            if cache is not None:
+                cache.forget(str(target.path))
+
+    if cache is not None:
+        cache.retain(seen)
+
+    logger.debug(
+        f"Verified {report.checked} files: {report.hashed} hashed, "
+        f"{report.skipped} unchanged, {len(report.problems)} problems"
+    )
+    return report
+
+
+def _stat_key(st: os.stat_result) -> list[int]:
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
@@ -0,0 +1,234 @@
+"""
+Log-structured manifest backend.
+
+The repository manifest is split into a snapshot (the regular
+manifest.json) and an append-only journal of publishes. Publishing appends
+one JSON line to the journal, so its cost does not depend on the size of
+the repository, and concurrent publishers never overwrite each other.
+Readers replay the journal over the snapshot. Compaction folds the
+journal into a new snapshot.
+
+Compaction first renames the live journal to a pending file, so publishes
+keep appending to a fresh journal while the snapshot is rebuilt. Pending
+files left over by an interrupted compaction are replayed by readers and
+folded by the next compaction.
+
+Appends and the rename are serialized by an exclusive lock on a journal
+lock file, so no record lands in a journal after compaction read it, and a
+publisher sees every earlier publish of the same version. Readers never
+take it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from .assets import Asset
+from .exceptions import VersionConflictError
+from .locking import RepositoryLock
+from .manifest import Manifest
+from .manifest_store import ManifestBackend, ManifestStore
+from .serialization import decode_asset, encode_asset, get_backend
+from .versioning import Version
+
+logger = logging.getLogger(__name__)
+
+
+class JournalManifestBackend(ManifestBackend):
+    """
+    Repository manifest stored as a JSON snapshot plus a publish journal.
+
+    Each journal line is one asset record in the manifest record format.
+    Records are replayed in order, a later record of the same version
+    replacing an earlier one.
+    """
+
+    name = "journal"
+
+    def __init__(self, snapshot_path: Path, journal_path: Path, compact: bool = False):
+        """
+        Initialize journal backend.
+
+        Args:
+            snapshot_path: Snapshot manifest file
+            journal_path: Journal file publishes are appended to
+            compact: If True, write snapshots without indentation
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_json = compact
+        self.lock = RepositoryLock(journal_path.with_name(f"{journal_path.name}.lock"))
+
+    def _pending_journals(self) -> list[Path]:
+        """Journals renamed by a compaction, oldest first."""
+        prefix = f"{self.journal_path.name}."
+        pending = [
+            path
+            for path in self.journal_path.parent.glob(f"{prefix}*")
+            if path.name[len(prefix) :].isdigit()
+        ]
+        return sorted(pending, key=lambda path: int(path.name[len(prefix) :]))
+
+    @staticmethod
+    def _read_journal(path: Path) -> list[Asset]:
+        """Decode every complete record of a journal file."""
+        try:
+            with open(path, "rb") as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        loads = get_backend().loads
+        assets = []
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                assets.append(decode_asset(loads(line)))
+            except (ValueError, KeyError, TypeError) as e:
+                # A torn final line from an interrupted append
+                logger.warning(f"Skipping invalid record {path}:{number}: {e}")
+        return assets
+
+    def load(self) -> Manifest:
+        """Load the snapshot and replay every journal record over it."""
+        records = self._read_journals()
+        manifest = ManifestStore.load_from_json(self.snapshot_path)
+        for asset in records:
+            manifest.add_asset(asset)
+        return manifest
+
+    def _read_journals(self) -> list[Asset]:
+        """
+        Records of the live and pending journals, in publish order.
+
+        The live journal is read before the pending ones and the snapshot
+        must be read after both, so a concurrent compaction can move records
+        from one to the next but never out of sight.
+        """
+        live = self._read_journal(self.journal_path)
+        records = [
+            asset
+            for path in self._pending_journals()
+            for asset in self._read_journal(path)
+        ]
+        records.extend(live)
+        return records
+
+    def load_section(self, asset_type: str, name: str) -> Manifest:
+        """Load the stored versions of one asset only."""
+        records = [
+            record
+            for record in self._read_journals()
+            if record.type == asset_type and record.name == name
+        ]
+        manifest = ManifestStore.load_section(self.snapshot_path, asset_type, name)
+        for record in records:
+            manifest.add_asset(record)
+        return manifest
+
+    def list_versions(self) -> dict[str, dict[str, list[Version]]]:
+        """List versions from the snapshot offset table and the journals."""
+        records = self._read_journals()
+        listing = ManifestStore.list_versions(self.snapshot_path)
+        touched = set()
+        for record in records:
+            versions = listing.setdefault(record.type, {}).setdefault(record.name, [])
+            if record.version not in versions:
+                versions.append(record.version)
+                touched.add((record.type, record.name))
+        for asset_type, name in touched:
+            listing[asset_type][name].sort(reverse=True)
+        return listing
+
+    def save(self, manifest: Manifest) -> None:
+        """Write manifest as the new snapshot and discard the journals."""
+        with self.lock.exclusive():
+            self._write_snapshot(manifest)
+            for path in [*self._pending_journals(), self.journal_path]:
+                path.unlink(missing_ok=True)
+
+    def publish(self, manifest: Manifest | None, asset: Asset) -> Manifest | None:
+        """
+        Append one record to the journal, then update manifest.
+
+        Raises:
+            VersionConflictError: If this version of asset was already
+                published
+        """
+        line = get_backend().dumps(encode_asset(asset)) + b"\n"
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock.exclusive():
+            existing = self.load_section(asset.type, asset.name).get_asset(asset)
+            if existing is not None:
+                raise VersionConflictError(
+                    f"{asset} was published concurrently by {existing.author}"
+                )
+            # One O_APPEND write per record, so a torn append only loses itself
+            fd = os.open(
+                self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        if manifest is not None:
+            manifest.add_asset(asset)
+        return manifest
+
+    def latest_version(self, manifest: Manifest | None, asset: Asset) -> Version | None:
+        """Include versions published since manifest was read."""
+        section = self.load_section(asset.type, asset.name)
+        versions = [
+            version
+            for version in (
+                manifest.get_latest_asset_version(asset) if manifest else None,
+                section.get_latest_asset_version(asset),
+            )
+            if version is not None
+        ]
+        return max(versions, default=None)
+
+    def compact(self) -> int:
+        """
+        Fold all journal records into a new snapshot.
+
+        Returns:
+            Number of journal records folded.
+        """
+        # Once renamed under the lock, no publish appends to it anymore
+        with self.lock.exclusive():
+            try:
+                os.replace(
+                    self.journal_path,
+                    self.journal_path.with_name(
+                        f"{self.journal_path.name}.{time.time_ns()}"
+                    ),
+                )
+            except FileNotFoundError:
+                pass
+
+        pending = self._pending_journals()
+        if not pending:
+            return 0
+        records = [asset for path in pending for asset in self._read_journal(path)]
+        manifest = ManifestStore.load_from_json(self.snapshot_path)
+        for asset in records:
+            manifest.add_asset(asset)
+        self._write_snapshot(manifest)
+
+        for path in pending:
+            path.unlink(missing_ok=True)
+        logger.info(
+            f"Compacted {len(records)} journal records into {self.snapshot_path}"
+        )
+        return len(records)
+
+    def _write_snapshot(self, manifest: Manifest) -> None:
+        ManifestStore.save_to_json(
+            manifest, self.snapshot_path, compact=self.compact_json
+        )
@@ -0,0 +1,163 @@
+"""
+Reader/writer locking for repository operations.
+
+Uses fcntl.flock advisory locks on a lock file in the repository root.
+Any number of readers hold the shared lock at once, a writer holds the
+exclusive lock alone. Waiting is bounded by a timeout.
+
+flock has no fairness, so a steady stream of readers could keep a writer
+waiting forever. Both therefore pass through a gate lock file first: a
+writer holds it exclusively while it waits for the readers to drain, and
+new readers queue on it instead of overtaking the writer.
+
+Lock files that cannot be created or opened for writing, as on a
+read-only mount, are opened read-only. If that fails too the operation
+proceeds unlocked with a warning.
+
+Linux emulates flock over NFS with POSIX byte-range locks. SMB mounts and
+platforms without fcntl (Windows) get no cross-machine locking, in which
+case locks are no-ops and the manifest backends' own concurrency handling
+applies.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .exceptions import RepositoryLockTimeoutError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT = 30.0
+_POLL_INTERVAL = 0.01
+_MAX_POLL_INTERVAL = 0.2
+
+
+class RepositoryLock:
+    """
+    Advisory reader/writer lock on a file.
+
+    Each acquisition opens its own file descriptor, so locks taken by
+    different threads or processes exclude each other the same way.
+    """
+
+    def __init__(self, path: Path, timeout: float = DEFAULT_LOCK_TIMEOUT):
+        """
+        Initialize lock.
+
+        Args:
+            path: Lock file, created on first use along with its gate file
+            timeout: Seconds to wait for the lock before giving up
+        """
+        self.path = path
+        self.gate_path = path.with_name(f"{path.name}.gate")
+        self.timeout = timeout
+
+    @contextmanager
+    def shared(self, timeout: float | None = None) -> Iterator[None]:
+        """Hold the lock as one of many readers."""
+        with self._hold(exclusive=False, timeout=timeout):
+            yield
+
+    @contextmanager
+    def exclusive(self, timeout: float | None = None) -> Iterator[None]:
+        """Hold the lock as the only writer."""
+        with self._hold(exclusive=True, timeout=timeout):
+            yield
+
+    @contextmanager
+    def _hold(self, exclusive: bool, timeout: float | None) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        mode = "exclusive" if exclusive else "shared"
+
+        with ExitStack() as held:
+            # The gate is only held until the lock itself is acquired
+            with self._locked(self.gate_path, operation, deadline, timeout, mode):
+                held.enter_context(
+                    self._locked(self.path, operation, deadline, timeout, mode)
+                )
+            yield
+
+    @contextmanager
+    def _locked(
+        self, path: Path, operation: int, deadline: float, timeout: float, mode: str
+    ) -> Iterator[None]:
+        fd = self._open(path)
+        if fd is None:
+            yield
+            return
+        try:
+            locked = self._acquire(fd, path, operation, deadline, timeout, mode)
+            try:
+                yield
+            finally:
+                if locked:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _open(path: Path) -> int | None:
+        """Open lock file, read-only if it cannot be written, None if not at all."""
+        try:
+            return os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        except OSError:
+            pass
+        try:
+            # flock works on read-only descriptors too
+            return os.open(path, os.O_RDONLY)
+        except OSError as e:
+            logger.warning(f"Cannot open lock file {path}, continuing unlocked: {e}")
+            return None
+
+    def _acquire(
+        self,
+        fd: int,
+        path: Path,
+        operation: int,
+        deadline: float,
+        timeout: float,
+        mode: str,
+    ) -> bool:
+        """
+        Poll for the lock with backoff until deadline.
+
+        Returns:
+            True if locked, False if the filesystem does not support locking.
+        """
+        delay = _POLL_INTERVAL
+        while True:
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                # Filesystem without lock support, carry on unlocked
+                logger.warning(f"Locking {path} unsupported, continuing: {e}")
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RepositoryLockTimeoutError(
+                    f"Timed out waiting for {mode} lock on {self.path}",
+                    details={"timeout": timeout},
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _MAX_POLL_INTERVAL)
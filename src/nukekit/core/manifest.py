@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import bisect
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterator
 
-from ..utils import deep_merge
 from .assets import Asset, AssetType
 from .versioning import Version
 
 logger = logging.getLogger(__name__)
 
+AssetKey = tuple[str, str, Version]
+
 
 @dataclass
 class Manifest:
@@ -25,47 +27,286 @@ class Manifest:
     # Metadata about this manifest (optional)
     source_path: Path | None = None
 
+    # Number of commits of the stored manifest this copy was read at
+    generation: int = field(default=0, compare=False)
+
+    # Ascending versions per (type, name), built on first use then kept current
+    _versions: dict[tuple[str, str], list[Version]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Set once version subtrees are shared with another manifest by merge();
+    # each (type, name) subtree is then copied before its first write.
+    _copy_on_write: bool = field(default=False, init=False, repr=False, compare=False)
+    _owned: set[tuple[str, str]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    # Secondary indexes: field -> value -> asset keys, built on first find()
+    _indexes: dict[str, dict[str, set[AssetKey]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (field, value) pairs each asset key was indexed under, so unindexing
+    # does not depend on fields that may have been mutated since
+    _indexed: dict[AssetKey, list[tuple[str, str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_dict(
-        cls, data: dict[Any, Any], source_path: Path | None = None
+        cls, data: dict[Any, Any], source_path: Path | None = None, generation: int = 0
     ) -> "Manifest":
         """Create manifest from dictionary."""
-        return cls(data=data, source_path=source_path)
+        return cls(data=data, source_path=source_path, generation=generation)
 
     def add_asset(self, asset: Asset) -> None:
         """Add or update an asset in the manifest."""
 
-        if asset.name not in self.data[asset.type]:
+        names = self.data[asset.type]
+        key = (asset.type, asset.name)
+        versions = names.get(asset.name)
+        if versions is None:
             # New asset
-            self.data[asset.type][asset.name] = {}
+            versions = names[asset.name] = {}
+            self._owned.add(key)
+        elif self._copy_on_write and key not in self._owned:
+            # Subtree is shared with a merge input or output, copy before writing
+            versions = names[asset.name] = dict(versions)
+            self._owned.add(key)
+            if self._versions is not None and key in self._versions:
+                self._versions[key] = list(self._versions[key])
+
+        previous = versions.get(asset.version)
+        if self._versions is not None and previous is None:
+            bisect.insort(
+                self._versions.setdefault((asset.type, asset.name), []),
+                asset.version,
+            )
+        if self._indexes is not None:
+            self._unindex(asset)
+            self._index(asset)
+        versions[asset.version] = asset
+
+    def iter_assets(self) -> Iterator[Asset]:
+        """Yield every asset version in the manifest."""
+        for names in self.data.values():
+            if not isinstance(names, dict):
+                continue
+            for versions in names.values():
+                yield from versions.values()
+
+    @staticmethod
+    def _index_entries(asset: Asset) -> Iterator[tuple[str, str]]:
+        """Yield the (field, value) pairs an asset is indexed under."""
+        if asset.id:
+            yield "id", asset.id
+        if asset.author:
+            yield "author", asset.author
+        if asset.category:
+            yield "category", asset.category
+        for tag in asset.tags:
+            yield "tag", tag
+
+    def _index(self, asset: Asset) -> None:
+        assert self._indexes is not None
+        key = (asset.type, asset.name, asset.version)
+        entries = self._indexed[key] = list(self._index_entries(asset))
+        for index_name, value in entries:
+            self._indexes[index_name].setdefault(value, set()).add(key)
+
+    def _unindex(self, asset: Asset) -> None:
+        """Remove the entries the version of asset was last indexed under."""
+        assert self._indexes is not None
+        key = (asset.type, asset.name, asset.version)
+        for index_name, value in self._indexed.pop(key, ()):
+            keys = self._indexes[index_name].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._indexes[index_name][value]
+
+    def _build_indexes(self) -> None:
+        self._indexes = {"id": {}, "author": {}, "category": {}, "tag": {}}
+        self._indexed = {}
+        for asset in self.iter_assets():
+            self._index(asset)
+
+    def find(
+        self,
+        *,
+        id: str | None = None,
+        author: str | None = None,
+        tag: str | None = None,
+        category: str | None = None,
+        type: str | None = None,
+        name: str | None = None,
+    ) -> list[Asset]:
+        """
+        Query assets by metadata. All given criteria must match.
+
+        Indexes for id, author, tag and category are built on the first
+        call and kept current by add_asset. An asset whose metadata is
+        changed in place keeps its old index entries until it is added
+        again, which replaces them.
+
+        Args:
+            id: Asset id
+            author: Publishing user
+            tag: Tag the asset carries
+            category: Asset category
+            type: Asset type key
+            name: Asset name
+
+        Returns:
+            Matching assets ordered by type, name and version.
+        """
+        if self._indexes is None:
+            self._build_indexes()
+        assert self._indexes is not None
+
+        criteria = {"id": id, "author": author, "tag": tag, "category": category}
+        matches: set[AssetKey] | None = None
+        for index_name, value in criteria.items():
+            if value is None:
+                continue
+            keys = self._indexes[index_name].get(value, set())
+            matches = set(keys) if matches is None else matches & keys
+            if not matches:
+                return []
 
-        self.data[asset.type][asset.name][asset.version] = asset
+        if matches is None:
+            # No indexed criteria, filter every asset
+            matches = {(a.type, a.name, a.version) for a in self.iter_assets()}
+
+        return [
+            self.data[key[0]][key[1]][key[2]]
+            for key in sorted(matches)
+            if (type is None or key[0] == type) and (name is None or key[1] == name)
+        ]
+
+    def _version_index(self) -> dict[tuple[str, str], list[Version]]:
+        """Return the sorted version index, building it on first use."""
+        if self._versions is None:
+            self._versions = {
+                (asset_type, name): sorted(versions)
+                for asset_type, names in self.data.items()
+                if isinstance(names, dict)
+                for name, versions in names.items()
+                if versions
+            }
+        return self._versions
+
+    def sorted_versions(
+        self, asset_type: str, name: str, reverse: bool = False
+    ) -> list[Version]:
+        """
+        List versions of an asset in order, without re-sorting.
+
+        Args:
+            asset_type: Asset type key
+            name: Asset name
+            reverse: If True, newest version first
+
+        Returns:
+            New list of versions, empty if the asset is unknown.
+        """
+        versions = self._version_index().get((asset_type, name), [])
+        return versions[::-1] if reverse else list(versions)
+
+    def list_versions(self) -> dict[str, dict[str, list[Version]]]:
+        """Return type -> name -> versions newest first, for every asset."""
+        return {
+            asset_type: {
+                name: self.sorted_versions(asset_type, name, reverse=True)
+                for name in names
+            }
+            for asset_type, names in self.data.items()
+            if isinstance(names, dict)
+        }
+
+    def section(self, asset_type: str, name: str) -> Manifest:
+        """Return a manifest holding only the versions of one asset."""
+        section = Manifest(source_path=self.source_path)
+        versions = self.data.get(asset_type, {}).get(name)
+        if versions:
+            section.data.setdefault(asset_type, {})[name] = dict(versions)
+        return section
+
+    def latest_version(self, asset_type: str, name: str) -> Version | None:
+        """Return the highest version of an asset, or None if unknown."""
+        versions = self._version_index().get((asset_type, name))
+        return versions[-1] if versions else None
 
     def get_latest_asset_version(self, asset: Asset) -> Version | None:
-        try:
-            self.data[asset.type][asset.name]
-        except Exception:
-            # Asset is not in manifest.
-            return None
-        else:
-            # Asset is in manifest, get list of all versions.
-            asset_versions_list: Iterable[Version]
-            logger.debug(list(self.data[asset.type][asset.name].keys()))
-            asset_versions_list = list(self.data[asset.type][asset.name].keys())
-            if len(asset_versions_list) > 1:
-                # If list has at least two version, sort and return highest value
-                return Version.highest_version(asset_versions_list)
-            else:
-                # Only one version
-                return asset_versions_list[0]
+        return self.latest_version(asset.type, asset.name)
 
     def merge(self, other: "Manifest") -> "Manifest":
         """
         Merge another manifest into this one.
         Returns a NEW manifest (immutable operation).
+
+        Versions from this manifest win over the same versions in other.
+        Per asset type, the larger name table is shallow-copied and only the
+        names of the smaller side are visited. Version subtrees present on a
+        single side are shared between inputs and output rather than copied,
+        and all three manifests copy a shared subtree before writing to it.
         """
-        merged_data = deep_merge(self.data, other.data)
-        return Manifest(data=merged_data)
+        merged_data: dict[str, dict[str, dict[Version, Asset]]] = {}
+        merged_owned: set[tuple[str, str]] = set()
+        asset_types = [*self.data, *(t for t in other.data if t not in self.data)]
+        for asset_type in asset_types:
+            ours = self.data.get(asset_type, {})
+            theirs = other.data.get(asset_type, {})
+            if not isinstance(ours, dict) or not isinstance(theirs, dict):
+                merged_data[asset_type] = ours if asset_type in self.data else theirs
+                continue
+
+            if len(ours) >= len(theirs):
+                names = dict(ours)
+                for name, versions in theirs.items():
+                    if name in names:
+                        names[name] = {**versions, **names[name]}
+                        merged_owned.add((asset_type, name))
+                    else:
+                        names[name] = versions
+            else:
+                names = dict(theirs)
+                for name, versions in ours.items():
+                    if name in names:
+                        names[name] = {**names[name], **versions}
+                        merged_owned.add((asset_type, name))
+                    else:
+                        names[name] = versions
+            merged_data[asset_type] = names
+
+        merged = Manifest(data=merged_data)
+        merged._copy_on_write = True
+        merged._owned = merged_owned
+        merged._versions = self._merge_version_index(other, merged_owned)
+
+        # Inputs now share their subtrees with the output
+        for source in (self, other):
+            source._copy_on_write = True
+            source._owned = set()
+        return merged
+
+    def _merge_version_index(
+        self, other: "Manifest", merged_keys: set[tuple[str, str]]
+    ) -> dict[tuple[str, str], list[Version]] | None:
+        """Combine both version indexes, or None if either is not built yet."""
+        if self._versions is None or other._versions is None:
+            return None
+        if len(self._versions) >= len(other._versions):
+            index, smaller = dict(self._versions), other._versions
+        else:
+            index, smaller = dict(other._versions), self._versions
+        for key, versions in smaller.items():
+            index[key] = versions
+        for key in merged_keys:
+            ours = self._versions.get(key, [])
+            theirs = other._versions.get(key, [])
+            index[key] = sorted(set(ours).union(theirs))
+        return index
 
     def to_dict(self) -> dict[Any, Any]:
         """Convert to JSON-serializable dict."""
@@ -1,15 +1,47 @@
 from __future__ import annotations
 
 import logging
+import os
+import random
+import re
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from ..utils import _sort_dict
+from .assets import Asset
+from .compression import STORED_SUFFIXES, codec_for_path
+from .exceptions import (
+    ConfigurationError,
+    ManifestConflictError,
+    ManifestNotFoundError,
+    VersionConflictError,
+)
 from .manifest import Manifest
-from .scanner import scan_folder
-from .serialization import dump_json, load_json
+from .scan_index import ScanIndex
+from .scanner import iter_assets
+from .serialization import (
+    GENERATION_KEY,
+    dump_json,
+    load_manifest_json,
+    load_manifest_section,
+    load_manifest_versions,
+    manifest_index_path,
+)
+from .versioning import Version
+
+if TYPE_CHECKING:
+    from .repository import Repository
 
 logger = logging.getLogger(__name__)
 
+# Compare-and-swap commits of manifest.json
+COMMIT_RETRIES = 20
+CLAIM_TIMEOUT = 30.0
+_RETRY_DELAY = 0.05
+_GENERATION_HEAD_BYTES = 64
+_GENERATION_RE = re.compile(rb'\{\s*"__generation__"\s*:\s*(\d+)')
+
 
 class ManifestStore:
     """
@@ -31,28 +63,191 @@ class ManifestStore:
             return Manifest(source_path=path)
 
         try:
-            data = load_json(path)
-            return Manifest.from_dict(data, source_path=path)
+            data, generation = load_manifest_json(path)
+            return Manifest.from_dict(data, source_path=path, generation=generation)
         except Exception as e:
             logger.error(f"Failed to load manifest from {path}: {e}")
             raise
 
     @staticmethod
-    def save_to_json(manifest: Manifest, path: Path) -> None:
+    def save_to_json(
+        manifest: Manifest, path: Path, compact: bool = False, index: bool = True
+    ) -> bool:
+        """
+        Save manifest to a JSON file, keys sorted for consistent output.
+
+        The file is replaced atomically, and left untouched if its content
+        would not change.
+
+        Args:
+            manifest: Manifest to save
+            path: Destination file
+            compact: If True, write without indentation
+            index: If True, also write the offset table used by load_section
+
+        Returns:
+            True if the file was written, False if it was unchanged.
+        """
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Sort for consistent output
-        sorted_data = _sort_dict(manifest.to_dict())
+        data = manifest.to_dict()
+        if manifest.generation:
+            data = {GENERATION_KEY: manifest.generation, **data}
 
         # Write to disk
-        dump_json(sorted_data, path)
-        logger.debug(f"Saved manifest to {path}")
+        written = dump_json(data, path, compact=compact, index=index)
+        if written:
+            logger.debug(f"Saved manifest to {path}")
+        return written
+
+    @staticmethod
+    def load_section(path: Path, asset_type: str, name: str | None = None) -> Manifest:
+        """
+        Load one asset type, or one asset, from a manifest file.
+
+        Uses the memory-mapped offset table read when the file has a current
+        one, otherwise loads the whole file and keeps the requested part.
+
+        Args:
+            path: Manifest file
+            asset_type: Asset type key
+            name: Optional asset name within asset_type
+
+        Returns:
+            Manifest holding only the requested section.
+        """
+        data = load_manifest_section(path, asset_type, name)
+        if data is not None:
+            return Manifest.from_dict(data, source_path=path)
+
+        full = ManifestStore.load_from_json(path)
+        if name is not None:
+            return full.section(asset_type, name)
+        section = Manifest(source_path=path)
+        section.data[asset_type] = full.data.get(asset_type, {})
+        return section
+
+    @staticmethod
+    def list_versions(path: Path) -> dict[str, dict[str, list[Version]]]:
+        """
+        List the versions of every asset of a manifest file, newest first.
+
+        Reads only the offset table when the file has a current one,
+        otherwise loads the whole file.
+
+        Returns:
+            Nested dict of type -> name -> versions.
+        """
+        listing = load_manifest_versions(path)
+        if listing is not None:
+            return listing
+        return ManifestStore.load_from_json(path).list_versions()
+
+    @staticmethod
+    def read_generation(path: Path) -> int:
+        """
+        Read the generation of a manifest file without decoding it.
+
+        The generation is written as the first key, so only the head of the
+        file is read. Files without one, or missing files, are generation 0.
+        """
+        try:
+            with open(path, "rb") as file:
+                head = codec_for_path(path).reader(file).read(_GENERATION_HEAD_BYTES)
+        except FileNotFoundError:
+            return 0
+        match = _GENERATION_RE.match(head)
+        return int(match[1]) if match else 0
+
+    @staticmethod
+    def commit_to_json(
+        path: Path,
+        manifest: Manifest,
+        change: Callable[[Manifest], None],
+        compact: bool = False,
+        retries: int = COMMIT_RETRIES,
+    ) -> Manifest:
+        """
+        Apply a change to a manifest and save it with compare-and-swap.
+
+        The write only succeeds if the file is still at the generation the
+        manifest was read at. Otherwise the file is reloaded, the change is
+        applied again on top of it and the commit is retried, so concurrent
+        publishers never overwrite each other's entries.
+
+        Args:
+            path: Manifest file
+            manifest: Manifest as read from path
+            change: Callable applying the change in place; it runs again on
+                every retry and may raise to abort
+            compact: If True, write without indentation
+            retries: Attempts before giving up
+
+        Returns:
+            The committed manifest, a reloaded one if a rebase happened.
+
+        Raises:
+            ManifestConflictError: If every attempt lost a race
+        """
+        for attempt in range(1, retries + 1):
+            change(manifest)
+            if ManifestStore._compare_and_swap(manifest, path, compact):
+                return manifest
+
+            logger.info(f"{path} changed concurrently, rebasing (attempt {attempt})")
+            time.sleep(random.uniform(0, _RETRY_DELAY * attempt))
+            manifest = ManifestStore.load_from_json(path)
+
+        raise ManifestConflictError(
+            f"Could not commit {path} after {retries} attempts",
+            details={"generation": manifest.generation},
+        )
+
+    @staticmethod
+    def _compare_and_swap(manifest: Manifest, path: Path, compact: bool) -> bool:
+        """Write manifest as the next generation if path is still at its one."""
+        expected = manifest.generation
+        # Only one writer can hold the claim on the next generation
+        claim = path.with_name(f"{path.name}.{expected + 1}.claim")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.close(os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+        except FileExistsError:
+            ManifestStore._clear_stale_claim(claim)
+            return False
+
+        try:
+            if ManifestStore.read_generation(path) != expected:
+                return False
+            manifest.generation = expected + 1
+            try:
+                ManifestStore.save_to_json(manifest, path, compact=compact)
+            except BaseException:
+                manifest.generation = expected
+                raise
+            return True
+        finally:
+            claim.unlink(missing_ok=True)
+
+    @staticmethod
+    def _clear_stale_claim(claim: Path) -> None:
+        """Remove a claim left behind by a writer that died mid-commit."""
+        try:
+            age = time.time() - claim.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if age > CLAIM_TIMEOUT:
+            logger.warning(f"Removing stale manifest claim {claim}")
+            claim.unlink(missing_ok=True)
 
     @staticmethod
     def load_from_filesystem(
         scan_path: Path,
         cached_manifest: Manifest | None = None,
+        index_path: Path | None = None,
+        workers: int = 1,
+        on_asset: Callable[[Asset], None] | None = None,
     ) -> Manifest:
         """
         Create manifest by scanning filesystem.
@@ -60,9 +255,15 @@ class ManifestStore:
         If cached_manifest is provided, merges metadata from cache
         (like author, changelog, etc.) with newly scanned assets.
 
+        If index_path is provided, a persisted stat index is used so only
+        directories that changed since the last scan are re-listed.
+
         Args:
             scan_path: Directory to scan for assets
             cached_manifest: Optional cached manifest to merge with
+            index_path: Optional scan index file to read and update
+            workers: Number of threads listing directories in parallel
+            on_asset: Optional callback invoked for each asset as it is found
 
         Returns:
             Manifest created from filesystem scan
@@ -73,8 +274,19 @@ class ManifestStore:
             if not scan_path.is_dir():
                 raise TypeError("Provided path for scanner is not a dir")
 
-        scanned_data = scan_folder(scan_path)
-        scanned_manifest = Manifest.from_dict(scanned_data)
+        index = ScanIndex.load(index_path) if index_path is not None else None
+
+        # Build the manifest incrementally, first occurrence of a version wins
+        scanned_manifest = Manifest()
+        for asset in iter_assets(scan_path, index=index, workers=workers):
+            if scanned_manifest.has_asset(asset):
+                continue
+            scanned_manifest.add_asset(asset)
+            if on_asset is not None:
+                on_asset(asset)
+
+        if index is not None:
+            index.save()
 
         # If we have cached data, merge it
         if cached_manifest:
@@ -103,6 +315,253 @@ class ManifestStore:
             return manifest
 
 
+class ManifestBackend(ABC):
+    """
+    Storage backend for the repository manifest.
+
+    Subclasses decide how the manifest is persisted. Workflows only go
+    through load, save, publish and latest_version, so backends can make
+    publishing and lookups cheaper than rewriting a whole file.
+
+    publish and latest_version take the full manifest if the caller has it
+    loaded, or None, in which case backends that can commit or look up one
+    asset without it do not load it.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def load(self) -> Manifest:
+        """Load the full manifest."""
+
+    @abstractmethod
+    def save(self, manifest: Manifest) -> None:
+        """Replace the stored manifest with the given one."""
+
+    def publish(self, manifest: Manifest | None, asset: Asset) -> Manifest | None:
+        """
+        Persist one newly published asset and add it to manifest.
+
+        Args:
+            manifest: In-memory manifest to update, None if not loaded
+            asset: Published asset
+
+        Returns:
+            The up to date manifest, which may be a reloaded one if other
+            publishes were committed since manifest was read, or None if
+            manifest was None and the backend committed without loading it.
+        """
+        if manifest is None:
+            manifest = self.load()
+        manifest.add_asset(asset)
+        self.save(manifest)
+        return manifest
+
+    def latest_version(self, manifest: Manifest | None, asset: Asset) -> Version | None:
+        """Return the highest stored version of an asset, or None."""
+        if manifest is None:
+            manifest = self.load_section(asset.type, asset.name)
+        return manifest.get_latest_asset_version(asset)
+
+    def list_versions(self) -> dict[str, dict[str, list[Version]]]:
+        """
+        List the stored versions of every asset, newest first.
+
+        Used to browse the repository, so backends that can list versions
+        without decoding every record override it.
+
+        Returns:
+            Nested dict of type -> name -> versions.
+        """
+        return self.load().list_versions()
+
+    def load_section(self, asset_type: str, name: str) -> Manifest:
+        """Load the stored versions of one asset only."""
+        return self.load().section(asset_type, name)
+
+    def compact(self) -> int:
+        """
+        Fold pending incremental writes into the main manifest file.
+
+        Returns:
+            Number of records folded, 0 for backends that write in place.
+        """
+        return 0
+
+    def import_json(self, path: Path) -> Manifest:
+        """
+        Replace the stored manifest with the content of a JSON manifest.
+
+        Args:
+            path: manifest.json to import
+
+        Returns:
+            The imported manifest.
+
+        Raises:
+            ManifestNotFoundError: If path does not exist, rather than
+                replacing the stored manifest with an empty one
+        """
+        if not path.is_file():
+            raise ManifestNotFoundError(f"Manifest {path} not found")
+        manifest = ManifestStore.load_from_json(path)
+        self.save(manifest)
+        logger.info(f"Imported {len(manifest)} asset versions from {path}")
+        return manifest
+
+    def export_json(self, path: Path, compact: bool = False) -> Manifest:
+        """
+        Write the stored manifest to a JSON manifest file.
+
+        Args:
+            path: Destination file
+            compact: If True, write without indentation
+
+        Returns:
+            The exported manifest.
+        """
+        manifest = self.load()
+        ManifestStore.save_to_json(manifest, path, compact=compact)
+        logger.info(f"Exported {len(manifest)} asset versions to {path}")
+        return manifest
+
+
+class JsonManifestBackend(ManifestBackend):
+    """
+    Repository manifest stored as a single JSON file.
+
+    Publishes are committed with compare-and-swap on the manifest
+    generation, see ManifestStore.commit_to_json.
+    """
+
+    name = "json"
+
+    def __init__(self, path: Path, compact: bool = False):
+        self.path = path
+        self.compact_json = compact
+
+    def load(self) -> Manifest:
+        return ManifestStore.load_from_json(self.path)
+
+    def save(self, manifest: Manifest) -> None:
+        ManifestStore.save_to_json(manifest, self.path, compact=self.compact_json)
+
+    def publish(self, manifest: Manifest | None, asset: Asset) -> Manifest:
+        """Commit the whole file, loading it first if manifest is None."""
+
+        def _add(target: Manifest) -> None:
+            existing = target.get_asset(asset)
+            if existing is not None and existing is not asset:
+                raise VersionConflictError(
+                    f"{asset} was published concurrently by {existing.author}"
+                )
+            target.add_asset(asset)
+
+        if manifest is None:
+            manifest = self.load()
+        return ManifestStore.commit_to_json(
+            self.path, manifest, _add, compact=self.compact_json
+        )
+
+    def list_versions(self) -> dict[str, dict[str, list[Version]]]:
+        return ManifestStore.list_versions(self.path)
+
+    def load_section(self, asset_type: str, name: str) -> Manifest:
+        return ManifestStore.load_section(self.path, asset_type, name)
+
+    def latest_version(self, manifest: Manifest | None, asset: Asset) -> Version | None:
+        """Use manifest unless the file was committed to since it was read."""
+        if (
+            manifest is None
+            or ManifestStore.read_generation(self.path) != manifest.generation
+        ):
+            # Only the section of this asset is decoded
+            manifest = ManifestStore.load_section(self.path, asset.type, asset.name)
+        return manifest.get_latest_asset_version(asset)
+
+
+def open_manifest_backend(repository: Repository) -> ManifestBackend:
+    """
+    Create the manifest backend configured for a repository.
+
+    Args:
+        repository: Repository whose manifest_backend selects the backend
+
+    Returns:
+        Backend instance for the repository root.
+
+    Raises:
+        ConfigurationError: If the backend name is unknown
+    """
+    if repository.manifest_backend in ("json", "journal"):
+        migrate_manifest(repository)
+    if repository.manifest_backend == "json":
+        return JsonManifestBackend(
+            repository.manifest_path, compact=repository.compact_manifest
+        )
+    if repository.manifest_backend == "sqlite":
+        from .sqlite_store import SqliteManifestBackend
+
+        return SqliteManifestBackend(repository.database_path)
+    if repository.manifest_backend == "journal":
+        from .journal_store import JournalManifestBackend
+
+        return JournalManifestBackend(
+            repository.manifest_path,
+            repository.journal_path,
+            compact=repository.compact_manifest,
+        )
+    if repository.manifest_backend == "sharded":
+        from .sharded_store import ShardedManifestBackend
+
+        return ShardedManifestBackend(
+            repository.root,
+            repository.index_path,
+            compact=repository.compact_manifest,
+        )
+    raise ConfigurationError(f"Unknown manifest backend: {repository.manifest_backend}")
+
+
+def migrate_manifest(repository: Repository) -> bool:
+    """
+    Convert a manifest stored with another compression to the configured one.
+
+    Changing repository.compression changes manifest_path, so without this
+    the existing manifest would be orphaned and the repository look empty.
+
+    Args:
+        repository: Repository whose manifest_path is the configured one
+
+    Returns:
+        True if a manifest was converted.
+    """
+    target = repository.manifest_path
+    if target.exists():
+        return False
+    candidates = [
+        target.with_name(f"manifest.json{suffix}") for suffix in ("", *STORED_SUFFIXES)
+    ]
+    if not any(path != target and path.exists() for path in candidates):
+        return False
+
+    with repository.write_lock():
+        if target.exists():
+            # Converted by another process meanwhile
+            return False
+        for legacy in candidates:
+            if legacy == target or not legacy.exists():
+                continue
+            manifest = ManifestStore.load_from_json(legacy)
+            ManifestStore.save_to_json(
+                manifest, target, compact=repository.compact_manifest
+            )
+            legacy.unlink()
+            manifest_index_path(legacy).unlink(missing_ok=True)
+            logger.info(f"Converted manifest {legacy.name} to {target.name}")
+            return True
+    return False
+
+
 # Convenience functions (optional)
 def load_manifest(path: Path) -> Manifest:
     """Load manifest from JSON file."""
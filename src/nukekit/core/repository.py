@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import logging
 import os
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
 from .assets import Asset, AssetType
+from .blob_store import BlobStore
+from .compression import STORED_SUFFIXES, get_codec
+from .exceptions import AssetNotFoundError
+from .locking import DEFAULT_LOCK_TIMEOUT, RepositoryLock
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +29,42 @@ class Repository:
     - Track what's installed (that's Manifest)
     """
 
-    def __init__(self, root: Path, asset_types: list[str]):
+    def __init__(
+        self,
+        root: Path,
+        asset_types: list[str],
+        compact_manifest: bool = False,
+        manifest_backend: str = "json",
+        lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+        compression: str = "none",
+        deduplicate: bool = False,
+    ):
         """
         Initialize repository.
 
         Args:
             root: Root directory of repository
             asset_types: List of asset type subdirectories (e.g., ["Gizmo", "Script"])
+            compact_manifest: If True, write the manifest without indentation
+            manifest_backend: Manifest storage backend ("json", "journal",
+                "sharded" or "sqlite")
+            lock_timeout: Seconds to wait for the repository lock
+            compression: Codec for stored manifests and assets ("none",
+                "gzip" or "zstd")
+            deduplicate: If True, store asset content once in a blob store
+                under .objects and hardlink version paths to it
         """
         self.root = Path(root).resolve()
         self.asset_types = asset_types
-        self.manifest_path = self.root / "manifest.json"
+        self.codec = get_codec(compression)
+        self.manifest_path = self.root / f"manifest.json{self.codec.suffix}"
+        self.journal_path = self.root / "manifest.journal"
+        self.index_path = self.root / "index.json"
+        self.database_path = self.root / "manifest.db"
+        self.compact_manifest = compact_manifest
+        self.manifest_backend = manifest_backend
+        self.lock = RepositoryLock(self.root / ".nukekit.lock", timeout=lock_timeout)
+        self.blob_store = BlobStore(self.root / ".objects") if deduplicate else None
 
         # Ensure structure exists
         self._ensure_structure()
@@ -48,8 +78,23 @@ class Repository:
         root = os.path.expanduser(root)
 
         asset_types = config["repository"]["subfolder"]
-
-        return cls(root=Path(root), asset_types=asset_types)
+        compact_manifest = bool(config["repository"].get("compact_manifest", False))
+        manifest_backend = config["repository"].get("manifest_backend", "json")
+        lock_timeout = float(
+            config["repository"].get("lock_timeout", DEFAULT_LOCK_TIMEOUT)
+        )
+        compression = config["repository"].get("compression", "none")
+        deduplicate = bool(config["repository"].get("deduplicate", False))
+
+        return cls(
+            root=Path(root),
+            asset_types=asset_types,
+            compact_manifest=compact_manifest,
+            manifest_backend=manifest_backend,
+            lock_timeout=lock_timeout,
+            compression=compression,
+            deduplicate=deduplicate,
+        )
 
     def _ensure_structure(self) -> None:
         """Ensure repository directory structure exists."""
@@ -62,17 +107,68 @@ class Repository:
 
         logger.debug(f"Ensured repository structure at {self.root}")
 
-    def get_asset_path(self, asset: Asset) -> Path:
+    def read_lock(self) -> AbstractContextManager[None]:
+        """
+        Shared lock for reading the manifest or copying assets out.
+
+        Raises:
+            RepositoryLockTimeoutError: If a writer holds the lock too long
+        """
+        return self.lock.shared()
+
+    def write_lock(self) -> AbstractContextManager[None]:
+        """
+        Exclusive lock for committing manifest changes.
+
+        Hold it only around the commit, never around asset copies.
+
+        Raises:
+            RepositoryLockTimeoutError: If readers or a writer hold it too long
+        """
+        return self.lock.exclusive()
+
+    def get_asset_path(self, asset: Asset, create: bool = True) -> Path:
+        """
+        Path of an asset version in the repository, without codec suffix.
+
+        Args:
+            asset: Asset to locate
+            create: If True, create the asset directory; False for read-only
+                lookups that should not touch the repository
+        """
         if asset.type not in self.asset_types:
             raise FileNotFoundError(
                 f"Path {self.root / asset.type} not found in repository"
             )
 
         # Force asset subfolder creation
-        (self.root / asset.type / asset.name).mkdir(exist_ok=True)
+        if create:
+            (self.root / asset.type / asset.name).mkdir(exist_ok=True)
 
         return self.root / asset.type / asset.name / f"{asset}{asset.type.suffix}"
 
+    def get_stored_path(self, asset: Asset) -> Path:
+        """Path an asset is published to, with the codec suffix if compressed."""
+        path = self.get_asset_path(asset)
+        return path.with_name(f"{path.name}{self.codec.suffix}")
+
+    def locate_asset(self, asset: Asset) -> Path:
+        """
+        Find the stored file of a published asset.
+
+        Assets published under another compression setting are found too.
+
+        Raises:
+            AssetNotFoundError: If no stored file exists
+        """
+        path = self.get_asset_path(asset, create=False)
+        suffixes = dict.fromkeys([self.codec.suffix, "", *STORED_SUFFIXES])
+        for suffix in suffixes:
+            candidate = path.with_name(f"{path.name}{suffix}")
+            if candidate.exists():
+                return candidate
+        raise AssetNotFoundError(f"{asset} not found in repository")
+
     def get_type_directory(self, asset_type: AssetType) -> Path:
         """Get directory for given asset type."""
         if isinstance(asset_type, str):
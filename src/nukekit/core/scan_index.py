@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from ..utils.fileio import write_atomic
+from .assets import Asset, AssetStatus, AssetType
+from .scanner import SUFFIX_TYPES, traverse
+from .versioning import Version
+
+logger = logging.getLogger(__name__)
+
+# Directories modified this recently may still change within the same mtime
+# tick, so their listing is never trusted on the next scan.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class ScanIndex:
+    """
+    Persisted stat index of previously scanned directories.
+
+    Stores (inode, size, mtime) for every scanned directory, along with the
+    asset records parsed from it. A rescan only lists and re-parses
+    directories whose stat data changed, and reuses the cached records for
+    everything else.
+    """
+
+    # 2 dropped the unused per-file stat map
+    FORMAT_VERSION = 2
+
+    def __init__(
+        self, path: Path | None = None, directories: dict[str, Any] | None = None
+    ):
+        """
+        Initialize scan index.
+
+        Args:
+            path: File the index is persisted to
+            directories: Directory records keyed by absolute path
+        """
+        self.path = path
+        self.directories: dict[str, Any] = directories or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> ScanIndex:
+        """Load index from disk, returning an empty one if missing or invalid."""
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scan index {path}: {e}")
+            return cls(path)
+
+        if data.get("version") != cls.FORMAT_VERSION:
+            logger.info(f"Scan index {path} has an old format, rebuilding")
+            return cls(path)
+        return cls(path, data.get("directories", {}))
+
+    def save(self) -> None:
+        """Persist index to disk if anything changed since loading."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            self.path,
+            json.dumps(
+                {"version": self.FORMAT_VERSION, "directories": self.directories}
+            ).encode(),
+        )
+        self._dirty = False
+        logger.debug(f"Saved scan index to {self.path}")
+
+    def scan(self, root: Path, workers: int = 1) -> Iterator[Asset]:
+        """
+        Yield every asset below root, re-listing only changed directories.
+
+        Args:
+            root: Root directory to scan
+            workers: Number of threads checking directories in parallel
+
+        Yields:
+            Asset instances built from cached or freshly parsed records.
+        """
+        root_str = os.path.abspath(root)
+        visited: set[str] = set()
+        for path, record, changed in traverse(root_str, self._visit, workers):
+            if record is None:
+                continue
+            visited.add(path)
+            if changed:
+                self.directories[path] = record
+                self._dirty = True
+            for asset_record in record["assets"]:
+                yield _asset_from_record(asset_record)
+
+        self._prune(root_str, visited)
+
+    def _visit(
+        self, path: str
+    ) -> tuple[list[str], tuple[str, dict[str, Any] | None, bool]]:
+        """Stat one directory and list it again only if it changed."""
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            logger.warning(f"Could not scan {path}: {e}")
+            return [], (path, None, False)
+
+        record = self.directories.get(path)
+        changed = record is None or record["stat"] != _stat_key(st)
+        if changed:
+            record = self._list_directory(path, st)
+        assert record is not None
+        subdirs = [os.path.join(path, name) for name in record["subdirs"]]
+        return subdirs, (path, record, changed)
+
+    def _list_directory(self, path: str, st: os.stat_result) -> dict[str, Any]:
+        """List a directory into a record of its subdirectories and assets."""
+        subdirs: list[str] = []
+        assets: list[dict[str, str]] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    asset_type = SUFFIX_TYPES.get(os.path.splitext(entry.name)[1])
+                    if asset_type is None or not entry.is_file():
+                        continue
+                    asset = Asset.from_path(Path(entry.path))
+                    assets.append(
+                        {
+                            "name": asset.name,
+                            "version": str(asset.version),
+                            "type": asset.type.value,
+                            "source_path": entry.path,
+                        }
+                    )
+        except OSError as e:
+            logger.warning(f"Could not scan {path}: {e}")
+
+        stat_key: list[int] | None = _stat_key(st)
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            stat_key = None
+
+        return {
+            "stat": stat_key,
+            "subdirs": subdirs,
+            "assets": assets,
+        }
+
+    def _prune(self, root: str, visited: set[str]) -> None:
+        """Drop records of directories under root that no longer exist."""
+        prefix = os.path.join(root, "")
+        stale = [
+            path
+            for path in self.directories
+            if (path == root or path.startswith(prefix)) and path not in visited
+        ]
+        for path in stale:
+            del self.directories[path]
+        if stale:
+            self._dirty = True
+
+
+def _stat_key(st: os.stat_result) -> list[int]:
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
+
+
+def _asset_from_record(record: dict[str, str]) -> Asset:
+    return Asset(
+        name=record["name"],
+        version=Version.from_string(record["version"]),
+        source_path=Path(record["source_path"]),
+        status=AssetStatus.UNPUBLISHED,
+        type=AssetType(record["type"]),
+    )
@@ -1,29 +1,152 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
 
 from ..utils import _sort_dict
 from .assets import Asset, AssetType
 
+if TYPE_CHECKING:
+    from .scan_index import ScanIndex
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Lookup of every registered suffix so one traversal can sort all asset types
+SUFFIX_TYPES: dict[str, AssetType] = {t.suffix: t for t in AssetType}
+
+
+def traverse(
+    root: str,
+    visit: Callable[[str], tuple[list[str], T]],
+    workers: int = 1,
+) -> Iterator[T]:
+    """
+    Visit every directory below root, optionally fanning out to a thread pool.
+
+    The visit callable handles a single directory and returns its
+    subdirectories along with a result. Serial mode walks depth-first in the
+    calling thread. With more than one worker, subdirectories are submitted to
+    a bounded thread pool as soon as their parent has been listed, which hides
+    per-directory round trips on network shares. Results are always yielded
+    in the calling thread, in completion order.
+
+    Args:
+        root: Directory to start from.
+        visit: Callable listing one directory.
+        workers: Number of threads; 1 or less walks serially.
+
+    Yields:
+        The result of visit for every directory reached.
+    """
+    if workers <= 1:
+        stack = [root]
+        while stack:
+            subdirs, result = visit(stack.pop())
+            stack.extend(subdirs)
+            yield result
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(visit, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, result = future.result()
+                pending.update(pool.submit(visit, subdir) for subdir in subdirs)
+                yield result
+
+
+def _list_asset_files(
+    path: str,
+) -> tuple[list[str], list[tuple[os.DirEntry[str], AssetType]]]:
+    """List one directory into its subdirectories and asset files."""
+    subdirs: list[str] = []
+    files: list[tuple[os.DirEntry[str], AssetType]] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                asset_type = SUFFIX_TYPES.get(os.path.splitext(entry.name)[1])
+                if asset_type is not None and entry.is_file():
+                    files.append((entry, asset_type))
+    except OSError as e:
+        logger.warning(f"Could not scan {path}: {e}")
+    return subdirs, files
+
+
+def walk_asset_files(
+    path: Path, workers: int = 1
+) -> Iterator[tuple[os.DirEntry[str], AssetType]]:
+    """
+    Walk a directory tree once and yield every asset file found.
 
-def scan_folder(path: Path) -> dict[Any, Any]:
+    Uses os.scandir so file type checks come from the directory listing
+    itself, and yields the DirEntry so callers can reuse its cached stat data.
+
+    Args:
+        path: Root directory to walk.
+        workers: Number of threads listing directories in parallel.
+
+    Yields:
+        Tuples of (DirEntry, AssetType) for each file with a registered suffix.
+    """
+    for files in traverse(os.fspath(path), _list_asset_files, workers):
+        yield from files
+
+
+def iter_assets(
+    path: Path, index: ScanIndex | None = None, workers: int = 1
+) -> Iterator[Asset]:
+    """
+    Yield assets below a directory as soon as they are found.
+
+    Nothing is accumulated, so callers can display or index results while
+    the traversal is still running. The same name and version may be
+    yielded more than once if it exists in several directories.
+
+    Args:
+        path: Root directory to scan
+        index: Optional stat index; unchanged directories are served from it
+        workers: Number of threads listing directories in parallel
+
+    Yields:
+        Asset instances in traversal order.
+    """
     logger.debug(path)
-    assets = {}
-    for asset_type in list(AssetType):
-        asset_paths = list(path.rglob(f"*{asset_type.suffix}"))
-        asset_subtype: dict[str, dict[Any, Any]]
-        asset_subtype = {}
-        for path in asset_paths:
-            asset = Asset.from_path(path)
-            if asset.name not in asset_subtype.keys():
-                asset_subtype[asset.name] = {}
-            if asset.version not in asset_subtype[asset.name].keys():
-                asset_subtype[asset.name][asset.version] = asset
-        assets[asset_type] = asset_subtype
+    if index is not None:
+        yield from index.scan(path, workers)
+        return
+    for entry, _ in walk_asset_files(path, workers):
+        yield Asset.from_path(Path(entry.path))
+
+
+def scan_folder(
+    path: Path, index: ScanIndex | None = None, workers: int = 1
+) -> dict[Any, Any]:
+    """
+    Scan a directory tree into a type -> name -> version -> Asset dict.
+
+    Args:
+        path: Root directory to scan
+        index: Optional stat index; unchanged directories are served from it
+        workers: Number of threads listing directories in parallel
+
+    Returns:
+        Nested dict of every asset found, sorted by key.
+    """
+    assets: dict[Any, dict[str, dict[Any, Any]]]
+    assets = {asset_type: {} for asset_type in AssetType}
+    for asset in iter_assets(path, index, workers):
+        versions = assets[asset.type].setdefault(asset.name, {})
+        if asset.version not in versions:
+            versions[asset.version] = asset
 
     # Compare against
     assets = _sort_dict(assets)
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import gc
 import json
 import logging
+import mmap
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from ..utils.fileio import write_atomic
 from .assets import Asset, AssetStatus, AssetType
+from .compression import codec_for_path
 from .versioning import Version
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Top-level manifest key holding the commit counter, see ManifestStore
+GENERATION_KEY = "__generation__"
+
+# Offset table (".idx") written next to manifests for section reads;
+# 2 added the version listing
+INDEX_FORMAT_VERSION = 2
+
 
 def dataclass_to_dict(obj: Any) -> Any:
     """Small dataclass serializer to avoid recursive"""
@@ -39,40 +58,99 @@ def stringify_keys(obj: Any) -> Any:
     return obj
 
 
-def key_to_version(obj: dict[Any, Any]) -> dict[Any, Any]:
-    def test_version(x: str) -> bool:
-        try:
-            Version.from_string(x)
-            return True
-        except Exception:
-            return False
+_STATUSES = {status.value: status for status in AssetStatus}
+_TYPES = {asset_type.value: asset_type for asset_type in AssetType}
 
-    if isinstance(obj, dict):
-        return {
-            Version.from_string(k) if test_version(k) else k: key_to_version(v)
-            for k, v in obj.items()
-        }
-    return obj
 
+def decode_asset(record: dict[str, Any]) -> Asset:
+    """Build an Asset from one manifest record, ignoring unknown keys."""
+    source_path = record.get("source_path")
+    status = record.get("status")
+    return Asset(
+        name=record["name"],
+        version=Version.from_string(record["version"]),
+        source_path=Path(source_path) if source_path else source_path,
+        status=_STATUSES.get(status, status),  # type: ignore[arg-type]
+        type=_TYPES.get(record["type"], record["type"]),
+        message=record.get("message", ""),
+        author=record.get("author", ""),
+        time=record.get("time", ""),
+        id=record.get("id", ""),
+        tags=record.get("tags") or [],
+        category=record.get("category", ""),
+        description=record.get("description", ""),
+        size=record.get("size", 0),
+        stored_size=record.get("stored_size", 0),
+        digest=record.get("digest", ""),
+    )
 
-def universal_decoder(dct: dict[Any, Any]) -> dict[Any, Any] | Asset:
-    # Dynamic: Convert any key that ends with "_path" into a Path object
-    for k, v in dct.items():
-        if isinstance(v, str) and k.endswith("_path"):
-            dct[k] = Path(v)
-        elif (isinstance(v, str)) and k == "version":
-            dct[k] = Version.from_string(v)
-        elif isinstance(v, str) and k == "status":
-            dct[k] = AssetStatus(v)
-        elif isinstance(v, str) and k == "type":
-            dct[k] = AssetType(v)
 
-    # After fixing paths, handle dataclass reconstruction
-    if "__type__" in dct:
-        type_name = dct.pop("__type__")
-        if type_name == "Asset":
-            return Asset(**dct)
-    return dct
+def encode_asset(asset: Asset) -> dict[str, Any]:
+    """Build the manifest record of an Asset, the inverse of decode_asset."""
+    return {
+        "name": asset.name,
+        "version": str(asset.version),
+        "source_path": str(asset.source_path) if asset.source_path else None,
+        "status": asset.status,
+        "type": asset.type,
+        "message": asset.message,
+        "author": asset.author,
+        "time": asset.time,
+        "id": asset.id,
+        "tags": asset.tags,
+        "category": asset.category,
+        "description": asset.description,
+        "size": asset.size,
+        "stored_size": asset.stored_size,
+        "digest": asset.digest,
+        "__type__": "Asset",
+    }
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic GC while building many acyclic objects at once."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def decode_manifest(raw: dict[str, Any]) -> dict[str, dict[str, dict[Version, Asset]]]:
+    """
+    Convert parsed manifest JSON into manifest data in a single pass.
+
+    The layout is known (type -> name -> version -> asset record), so version
+    keys and asset records are converted directly, without probing keys.
+    Top-level keys starting with "__" are reserved for metadata and skipped.
+
+    Args:
+        raw: Plain dict as returned by json.load
+
+    Returns:
+        Nested dict of type -> name -> Version -> Asset.
+    """
+    data: dict[str, dict[str, dict[Version, Asset]]]
+    data = {t.value: {} for t in AssetType}
+    with _gc_paused():
+        for type_key, names in raw.items():
+            if type_key.startswith("__"):
+                continue
+            type_data = data.setdefault(type_key, {})
+            for name, versions in names.items():
+                type_data[name] = decode_versions(versions)
+    return data
+
+
+def decode_versions(raw: dict[str, Any]) -> dict[Version, Asset]:
+    """Convert one parsed version -> asset record mapping."""
+    from_string = Version.from_string
+    return {
+        from_string(version): decode_asset(record) for version, record in raw.items()
+    }
 
 
 class UniversalEncoder(json.JSONEncoder):
@@ -92,40 +170,246 @@ class UniversalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def dump_json(data: dict[Any, Any], path: Path) -> None:
-    """_summary_
+class JsonBackend(ABC):
+    """
+    Serializer backend used for manifest I/O.
+
+    Subclasses wrap one JSON library. Output is always compact UTF-8 bytes;
+    manifest layout and indentation are handled by encode_manifest.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode obj to compact UTF-8 JSON bytes."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes."""
+
+
+class StdlibJsonBackend(JsonBackend):
+    """Backend using the standard library json module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, cls=UniversalEncoder
+        ).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """Backend using orjson, a native JSON library."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_orjson_default)  # type: ignore[union-attr]
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)  # type: ignore[union-attr]
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, (Version, Path)):
+        return str(obj)
+    if hasattr(obj, "__dataclass_fields__"):
+        return dataclass_to_dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def get_backend() -> JsonBackend:
+    """Return the fastest available backend, falling back to stdlib json."""
+    if orjson is not None:
+        return OrjsonBackend()
+    return StdlibJsonBackend()
+
+
+def _iter_manifest_chunks(
+    obj: dict[Any, Any],
+    depth: int,
+    levels: int,
+    backend: JsonBackend,
+    compact: bool,
+    key_path: tuple[str, ...] | None = None,
+) -> Iterator[Any]:
+    """
+    Encode manifest levels in sorted order, assets straight to records.
+
+    If key_path is given, the key path of every type and name mapping is
+    also yielded right before and right after its encoded bytes, so the
+    consumer can record where each section starts and ends.
+    """
+    if not obj:
+        yield b"{}"
+        return
+    inner = b"" if compact else b"\n" + b"    " * (depth + 1)
+    outer = b"" if compact else b"\n" + b"    " * depth
+    separator = b":" if compact else b": "
+
+    items = sorted(obj.items(), reverse=True)
+    if depth == 0:
+        # Metadata keys ("__generation__") lead, so they can be read cheaply
+        items.sort(key=lambda item: not str(item[0]).startswith("__"))
+
+    yield b"{"
+    for i, (key, value) in enumerate(items):
+        yield (b"," if i else b"") + inner + backend.dumps(str(key)) + separator
+        if depth < levels - 1 and isinstance(value, dict):
+            if key_path is None:
+                yield from _iter_manifest_chunks(
+                    value, depth + 1, levels, backend, compact
+                )
+                continue
+            section = (*key_path, str(key))
+            yield section
+            yield from _iter_manifest_chunks(
+                value, depth + 1, levels, backend, compact, section
+            )
+            yield section
+        elif isinstance(value, Asset):
+            yield backend.dumps(encode_asset(value))
+        else:
+            yield backend.dumps(value)
+    yield outer + b"}"
+
+
+def encode_manifest(
+    data: dict[Any, Any],
+    compact: bool = False,
+    backend: JsonBackend | None = None,
+    levels: int = 3,
+) -> bytes:
+    """
+    Encode manifest data (type -> name -> version -> Asset) to JSON bytes.
+
+    Keys are sorted newest first at every level. Assets are encoded directly,
+    without building a key-stringified copy of the tree first.
 
     Args:
-        data (_type_): _description_
-        path (Path): _description_
+        data: Manifest data
+        compact: If True, write no whitespace; else one asset record per line
+        backend: Serializer backend, defaults to get_backend()
+        levels: Mapping levels above the asset records, 1 for a single
+            version -> Asset mapping
+
+    Returns:
+        UTF-8 encoded JSON document.
+    """
+    backend = backend or get_backend()
+    return b"".join(_iter_manifest_chunks(data, 0, levels, backend, compact))
+
+
+def encode_manifest_sections(
+    data: dict[Any, Any], compact: bool = False, backend: JsonBackend | None = None
+) -> tuple[bytes, dict[str, Any]]:
+    """
+    Encode manifest data like encode_manifest, recording section offsets.
+
+    Returns:
+        Tuple of (JSON document, offset table). The table maps each asset
+        type to its [start, end) byte range under "types", each
+        type -> name to its range under "names", and each type -> name to
+        its version strings, newest first, under "versions".
+    """
+    backend = backend or get_backend()
+    chunks: list[bytes] = []
+    position = 0
+    opened: dict[tuple[str, ...], int] = {}
+    types: dict[str, list[int]] = {}
+    names: dict[str, dict[str, list[int]]] = {}
+    for chunk in _iter_manifest_chunks(data, 0, 3, backend, compact, key_path=()):
+        if isinstance(chunk, bytes):
+            chunks.append(chunk)
+            position += len(chunk)
+        elif chunk not in opened:
+            opened[chunk] = position
+        elif len(chunk) == 1:
+            types[chunk[0]] = [opened.pop(chunk), position]
+        else:
+            names.setdefault(chunk[0], {})[chunk[1]] = [opened.pop(chunk), position]
+    versions = {
+        str(asset_type): {
+            str(name): [str(v) for v in sorted(by_version, reverse=True)]
+            for name, by_version in by_name.items()
+        }
+        for asset_type, by_name in data.items()
+        if isinstance(by_name, dict)
+    }
+    return b"".join(chunks), {"types": types, "names": names, "versions": versions}
+
+
+def manifest_index_path(path: Path) -> Path:
+    """Offset table written alongside an uncompressed manifest."""
+    return path.with_name(f"{path.name}.idx")
+
+
+def _index_stat(path: Path) -> list[int]:
+    st = os.stat(path)
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
+
+
+def dump_json(
+    data: dict[Any, Any], path: Path, compact: bool = False, index: bool = False
+) -> bool:
+    """
+    Write manifest data to a JSON file atomically.
+
+    The write is skipped when the file already holds the same content.
+    Paths ending in a codec suffix (".gz", ".zst") are written compressed.
+
+    Args:
+        data: Manifest data (type -> name -> version -> Asset)
+        path: Destination file
+        compact: If True, write without indentation
+        index: If True and the file is not compressed, also write the offset
+            table read by load_manifest_section
+
+    Returns:
+        True if the file was written, False if it was unchanged.
 
     Raises:
-        e: _description_
+        Exception: Re-raised after logging if encoding or writing fails
     """
-    data = stringify_keys(data)
     try:
-        with open(path, "w") as f:
-            json.dump(data, f, indent=4, cls=UniversalEncoder)
+        codec = codec_for_path(path)
+        if not index or codec.suffix:
+            encoded = encode_manifest(data, compact=compact)
+            return write_atomic(path, codec.compress(encoded))
+
+        encoded, table = encode_manifest_sections(data, compact=compact)
+        written = write_atomic(path, encoded)
+        # The stat of the manifest ties the table to this exact file
+        table = {
+            "version": INDEX_FORMAT_VERSION,
+            "stat": _index_stat(path),
+            **table,
+        }
+        write_atomic(manifest_index_path(path), json.dumps(table).encode())
+        return written
     except Exception as e:
         logger.exception(f"Error writing manifest to {path}: {e}")
         raise e
 
 
-def dumps_json(data: dict[Any, Any]) -> str:
-    """_summary_
+def dumps_json(data: dict[Any, Any], compact: bool = False) -> str:
+    """
+    Encode manifest data to a JSON string.
 
     Args:
-        data (_type_): _description_
-
-    Raises:
-        e: _description_
+        data: Manifest data (type -> name -> version -> Asset)
+        compact: If True, encode without indentation
 
     Returns:
-        str: _description_
+        JSON document as str.
     """
-    data = stringify_keys(data)
     try:
-        out = json.dumps(data, indent=4, cls=UniversalEncoder)
+        out = encode_manifest(data, compact=compact).decode()
     except Exception as e:
         logger.exception(e)
         raise e
@@ -133,11 +417,116 @@ def dumps_json(data: dict[Any, Any]) -> str:
         return out
 
 
+def load_manifest_section(
+    path: Path, asset_type: str, name: str | None = None
+) -> dict[Any, Any] | None:
+    """
+    Decode one asset type, or one asset, of a manifest file.
+
+    The file is memory-mapped and only the byte range given by its offset
+    table is parsed, so the rest of the catalog is never decoded.
+
+    Args:
+        path: Uncompressed manifest file
+        asset_type: Asset type key
+        name: Optional asset name within asset_type
+
+    Returns:
+        Manifest data holding only the requested section (empty if the
+        manifest has no such entry), or None when there is no offset table
+        matching the current file.
+    """
+    table = read_manifest_index(path)
+    if table is None:
+        return None
+
+    if name is None:
+        span = table["types"].get(asset_type)
+    else:
+        span = table["names"].get(asset_type, {}).get(name)
+    data: dict[str, dict[str, dict[Version, Asset]]]
+    data = {t.value: {} for t in AssetType}
+    if span is None:
+        return data
+
+    with open(path, "rb") as file:
+        st = os.fstat(file.fileno())
+        if [st.st_ino, st.st_size, st.st_mtime_ns] != table["stat"]:
+            # Replaced since the table was checked
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            raw = get_backend().loads(mapped[span[0] : span[1]])
+    with _gc_paused():
+        if name is None:
+            data[asset_type] = {n: decode_versions(v) for n, v in raw.items()}
+        else:
+            data.setdefault(asset_type, {})[name] = decode_versions(raw)
+    return data
+
+
+def load_manifest_versions(path: Path) -> dict[str, dict[str, list[Version]]] | None:
+    """
+    List the versions of every asset of a manifest file from its offset table.
+
+    No asset record is decoded.
+
+    Args:
+        path: Uncompressed manifest file
+
+    Returns:
+        Nested dict of type -> name -> versions newest first, or None when
+        there is no offset table matching the current file.
+    """
+    table = read_manifest_index(path)
+    if table is None:
+        return None
+    listing: dict[str, dict[str, list[Version]]] = {t.value: {} for t in AssetType}
+    for asset_type, names in table["versions"].items():
+        listing[asset_type] = {
+            name: [Version.from_string(v) for v in versions]
+            for name, versions in names.items()
+        }
+    return listing
+
+
+def read_manifest_index(path: Path) -> dict[str, Any] | None:
+    """
+    Read the offset table of a manifest.
+
+    Returns:
+        The table, or None if it is missing, unreadable or was written for
+        another version of the manifest file.
+    """
+    try:
+        with open(manifest_index_path(path), "rb") as file:
+            table = json.loads(file.read())
+        current = _index_stat(path)
+    except (OSError, ValueError):
+        return None
+    if table.get("version") != INDEX_FORMAT_VERSION or table.get("stat") != current:
+        return None
+    return dict(table)
+
+
 def load_json(path: Path) -> dict[Any, Any]:
+    return load_manifest_json(path)[0]
+
+
+def load_manifest_json(path: Path) -> tuple[dict[Any, Any], int]:
+    """
+    Read a manifest file along with its generation.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Tuple of (manifest data, generation), generation is 0 if unset.
+    """
     try:
-        with open(path) as file:
-            data = json.load(file, object_hook=universal_decoder)
-            return key_to_version(data)
+        with open(path, "rb") as file:
+            data = codec_for_path(path).decompress(file.read())
+        raw = get_backend().loads(data)
+        return decode_manifest(raw), int(raw.get(GENERATION_KEY, 0))
     except json.JSONDecodeError as e:
         logger.error(f"Failed to read {path}: {e}")
         raise
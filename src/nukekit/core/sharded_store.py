@@ -0,0 +1,193 @@
+"""
+Sharded manifest backend.
+
+Each asset keeps its own manifest next to its files, at
+<root>/<Type>/<name>/manifest.json, holding only its version -> record
+mapping. A small index.json at the root lists every asset with its
+versions. Publishing rewrites one shard and the index, browsing reads only
+the index, and reading a single asset decodes one small file instead of
+the whole catalog.
+
+Publishes read-modify-write both files, so they hold an exclusive lock on
+an index lock file while they do. Readers never take it.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from ..utils.fileio import write_atomic
+from .assets import Asset, AssetType
+from .exceptions import VersionConflictError
+from .locking import RepositoryLock
+from .manifest import Manifest
+from .manifest_store import ManifestBackend
+from .serialization import decode_versions, encode_manifest, get_backend
+from .versioning import Version
+
+logger = logging.getLogger(__name__)
+
+SHARD_NAME = "manifest.json"
+
+
+class ShardedManifestBackend(ManifestBackend):
+    """
+    Repository manifest split into one shard per asset plus an index.
+
+    The index maps type -> name -> version strings, newest first. Shards
+    are the source of truth; the index only lists them.
+    """
+
+    name = "sharded"
+
+    def __init__(self, root: Path, index_path: Path, compact: bool = False):
+        """
+        Initialize sharded backend.
+
+        Args:
+            root: Repository root holding the <Type>/<name> directories
+            index_path: Top-level index file
+            compact: If True, write shards without indentation
+        """
+        self.root = root
+        self.index_path = index_path
+        self.compact_json = compact
+        self.lock = RepositoryLock(index_path.with_name(f"{index_path.name}.lock"))
+
+    def shard_path(self, asset_type: str, name: str) -> Path:
+        """Return the manifest shard of one asset."""
+        return self.root / asset_type / name / SHARD_NAME
+
+    def load_index(self) -> dict[str, dict[str, list[Version]]]:
+        """
+        Read the top-level index.
+
+        Indexes written before it listed every version only hold the latest
+        one; the versions of those entries are read from their shards until
+        the next publish rewrites the index.
+
+        Returns:
+            Nested dict of type -> name -> versions newest first, empty if
+            missing.
+        """
+        try:
+            with open(self.index_path, "rb") as file:
+                raw = get_backend().loads(file.read())
+        except FileNotFoundError:
+            return {}
+
+        index: dict[str, dict[str, list[Version]]] = {}
+        for asset_type, names in raw.items():
+            type_index = index.setdefault(asset_type, {})
+            for name, versions in names.items():
+                if isinstance(versions, str):
+                    shard = self.load_asset(asset_type, name)
+                    type_index[name] = sorted(shard, reverse=True)
+                else:
+                    type_index[name] = [Version.from_string(v) for v in versions]
+        return index
+
+    def _save_index(self, index: dict[str, dict[str, list[Version]]]) -> None:
+        raw = {
+            asset_type: {
+                name: [str(version) for version in index[asset_type][name]]
+                for name in sorted(names)
+            }
+            for asset_type, names in sorted(index.items())
+        }
+        write_atomic(self.index_path, get_backend().dumps(raw))
+
+    def load_asset(self, asset_type: str, name: str) -> dict[Version, Asset]:
+        """Read every version of one asset from its shard."""
+        try:
+            with open(self.shard_path(asset_type, name), "rb") as file:
+                return decode_versions(get_backend().loads(file.read()))
+        except FileNotFoundError:
+            return {}
+
+    def _save_asset(
+        self, asset_type: str, name: str, versions: dict[Version, Asset]
+    ) -> None:
+        path = self.shard_path(asset_type, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            path, encode_manifest(versions, compact=self.compact_json, levels=1)
+        )
+
+    def load(self) -> Manifest:
+        """Load every shard listed in the index."""
+        manifest = Manifest(source_path=self.index_path)
+        for asset_type, names in self.load_index().items():
+            type_data = manifest.data.setdefault(asset_type, {})
+            for name in names:
+                versions = self.load_asset(asset_type, name)
+                if versions:
+                    type_data[name] = versions
+        return manifest
+
+    def save(self, manifest: Manifest) -> None:
+        """Write one shard per asset and rebuild the index."""
+        index: dict[str, dict[str, list[Version]]] = {}
+        with self.lock.exclusive():
+            for asset_type, names in manifest.data.items():
+                if not isinstance(names, dict):
+                    continue
+                for name, versions in names.items():
+                    if not versions:
+                        continue
+                    self._save_asset(asset_type, name, versions)
+                    index.setdefault(asset_type, {})[name] = sorted(
+                        versions, reverse=True
+                    )
+            self._save_index(index)
+        logger.debug(f"Saved {len(manifest)} asset versions to shards in {self.root}")
+
+    def publish(self, manifest: Manifest | None, asset: Asset) -> Manifest | None:
+        """
+        Rewrite the shard of one asset and its index entry.
+
+        Raises:
+            VersionConflictError: If this version of asset was already
+                published
+        """
+        asset_type = AssetType(asset.type).value
+        with self.lock.exclusive():
+            versions = self.load_asset(asset_type, asset.name)
+            existing = versions.get(asset.version)
+            if existing is not None:
+                raise VersionConflictError(
+                    f"{asset} was published concurrently by {existing.author}"
+                )
+            versions[asset.version] = asset
+            self._save_asset(asset_type, asset.name, versions)
+
+            index = self.load_index()
+            index.setdefault(asset_type, {})[asset.name] = sorted(
+                versions, reverse=True
+            )
+            self._save_index(index)
+
+        if manifest is not None:
+            manifest.add_asset(asset)
+        return manifest
+
+    def list_versions(self) -> dict[str, dict[str, list[Version]]]:
+        """List versions from the index, without opening any shard."""
+        listing: dict[str, dict[str, list[Version]]] = {t.value: {} for t in AssetType}
+        for asset_type, names in self.load_index().items():
+            listing.setdefault(asset_type, {}).update(names)
+        return listing
+
+    def load_section(self, asset_type: str, name: str) -> Manifest:
+        """Load the stored versions of one asset from its shard only."""
+        manifest = Manifest(source_path=self.shard_path(asset_type, name))
+        versions = self.load_asset(asset_type, name)
+        if versions:
+            manifest.data.setdefault(asset_type, {})[name] = versions
+        return manifest
+
+    def latest_version(self, manifest: Manifest | None, asset: Asset) -> Version | None:
+        """Read the highest version from the asset shard."""
+        versions = self.load_asset(AssetType(asset.type).value, asset.name)
+        return max(versions) if versions else None
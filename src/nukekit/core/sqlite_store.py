@@ -0,0 +1,259 @@
+"""
+SQLite manifest backend.
+
+Keeps the repository manifest in a SQLite database next to the asset
+folders, so publishing writes one row instead of rewriting manifest.json
+and lookups are indexed point queries.
+
+The database runs in WAL mode so readers are not blocked while a publish
+commits. WAL relies on shared memory and POSIX locks, which many SMB/NFS
+mounts do not implement correctly: only enable this backend on a
+repository root served from a local or cluster filesystem with working
+locks.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .assets import Asset, AssetType
+from .exceptions import VersionConflictError
+from .manifest import Manifest
+from .manifest_store import ManifestBackend
+from .serialization import decode_asset, encode_asset, get_backend
+from .versioning import Version
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (type, name)
+);
+CREATE TABLE IF NOT EXISTS versions (
+    asset_id INTEGER NOT NULL REFERENCES assets (id),
+    major INTEGER NOT NULL,
+    minor INTEGER NOT NULL,
+    patch INTEGER NOT NULL,
+    author TEXT,
+    uid TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (asset_id, major, minor, patch)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS versions_author ON versions (author);
+CREATE INDEX IF NOT EXISTS versions_uid ON versions (uid);
+"""
+
+
+class SqliteManifestBackend(ManifestBackend):
+    """
+    Repository manifest stored in a SQLite database.
+
+    Every asset (type, name) has one row in assets, and every published
+    version one row in versions holding its full manifest record as JSON.
+    Publish is a single transaction inserting that one version row.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode, transactions are opened explicitly
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection, if open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction, rolled back on error."""
+        connection = self._connect()
+        # IMMEDIATE takes the write lock up front, so concurrent publishes
+        # wait on the connection timeout instead of failing on lock upgrade
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _asset_id(connection: sqlite3.Connection, asset_type: str, name: str) -> int:
+        connection.execute(
+            "INSERT OR IGNORE INTO assets (type, name) VALUES (?, ?)",
+            (asset_type, name),
+        )
+        row = connection.execute(
+            "SELECT id FROM assets WHERE type = ? AND name = ?", (asset_type, name)
+        ).fetchone()
+        return int(row[0])
+
+    @staticmethod
+    def _insert_version(
+        connection: sqlite3.Connection,
+        asset_id: int,
+        asset: Asset,
+        record: str,
+        replace: bool = False,
+    ) -> None:
+        """
+        Insert one version row.
+
+        Raises:
+            sqlite3.IntegrityError: If the version exists and replace is False
+        """
+        version = asset.version
+        connection.execute(
+            f"INSERT {'OR REPLACE ' if replace else ''}INTO versions "
+            "(asset_id, major, minor, patch, author, uid, record) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                asset_id,
+                version.major,
+                version.minor,
+                version.patch,
+                asset.author or None,
+                asset.id or None,
+                record,
+            ),
+        )
+
+    def load(self) -> Manifest:
+        """Load every stored version into a Manifest."""
+        manifest = Manifest(source_path=self.path)
+        data = manifest.data
+        loads = get_backend().loads
+        rows = self._connect().execute(
+            "SELECT a.type, a.name, v.record FROM versions v "
+            "JOIN assets a ON a.id = v.asset_id"
+        )
+        for asset_type, name, record in rows:
+            asset = decode_asset(loads(record))
+            data.setdefault(asset_type, {}).setdefault(name, {})[asset.version] = asset
+        return manifest
+
+    def save(self, manifest: Manifest) -> None:
+        """Replace all stored versions with the content of manifest."""
+        dumps = get_backend().dumps
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM versions")
+            connection.execute("DELETE FROM assets")
+            for asset_type, names in manifest.data.items():
+                if not isinstance(names, dict):
+                    continue
+                for name, versions in names.items():
+                    if not versions:
+                        continue
+                    asset_id = self._asset_id(connection, asset_type, name)
+                    for asset in versions.values():
+                        record = dumps(encode_asset(asset)).decode()
+                        self._insert_version(
+                            connection, asset_id, asset, record, replace=True
+                        )
+        logger.debug(f"Saved manifest to {self.path}")
+
+    def publish(self, manifest: Manifest | None, asset: Asset) -> Manifest | None:
+        """
+        Insert one version row in a single transaction, then update manifest.
+
+        Raises:
+            VersionConflictError: If this version of asset was already
+                published
+        """
+        record = get_backend().dumps(encode_asset(asset)).decode()
+        asset_type = AssetType(asset.type).value
+        try:
+            with self._transaction() as connection:
+                asset_id = self._asset_id(connection, asset_type, asset.name)
+                self._insert_version(connection, asset_id, asset, record)
+        except sqlite3.IntegrityError as e:
+            existing = self.get_asset(asset_type, asset.name, asset.version)
+            author = existing.author if existing is not None else "another publisher"
+            raise VersionConflictError(
+                f"{asset} was published concurrently by {author}"
+            ) from e
+        if manifest is not None:
+            manifest.add_asset(asset)
+        return manifest
+
+    def latest_version(self, manifest: Manifest | None, asset: Asset) -> Version | None:
+        """Query the highest stored version, ignoring the in-memory manifest."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT v.major, v.minor, v.patch FROM versions v "
+                "JOIN assets a ON a.id = v.asset_id "
+                "WHERE a.type = ? AND a.name = ? "
+                "ORDER BY v.major DESC, v.minor DESC, v.patch DESC LIMIT 1",
+                (AssetType(asset.type).value, asset.name),
+            )
+            .fetchone()
+        )
+        return Version(*row) if row is not None else None
+
+    def list_versions(self) -> dict[str, dict[str, list[Version]]]:
+        """List versions from the key columns, without decoding any record."""
+        listing: dict[str, dict[str, list[Version]]] = {t.value: {} for t in AssetType}
+        rows = self._connect().execute(
+            "SELECT a.type, a.name, v.major, v.minor, v.patch FROM versions v "
+            "JOIN assets a ON a.id = v.asset_id "
+            "ORDER BY a.type, a.name, v.major DESC, v.minor DESC, v.patch DESC"
+        )
+        for asset_type, name, *version in rows:
+            listing.setdefault(asset_type, {}).setdefault(name, []).append(
+                Version(*version)
+            )
+        return listing
+
+    def load_section(self, asset_type: str, name: str) -> Manifest:
+        """Load the stored versions of one asset only."""
+        manifest = Manifest(source_path=self.path)
+        loads = get_backend().loads
+        rows = self._connect().execute(
+            "SELECT v.record FROM versions v "
+            "JOIN assets a ON a.id = v.asset_id "
+            "WHERE a.type = ? AND a.name = ?",
+            (asset_type, name),
+        )
+        for (record,) in rows:
+            manifest.add_asset(decode_asset(loads(record)))
+        return manifest
+
+    def get_asset(self, asset_type: str, name: str, version: Version) -> Asset | None:
+        """Fetch one stored asset version, or None if it is not published."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT v.record FROM versions v "
+                "JOIN assets a ON a.id = v.asset_id "
+                "WHERE a.type = ? AND a.name = ? "
+                "AND v.major = ? AND v.minor = ? AND v.patch = ?",
+                (asset_type, name, version.major, version.minor, version.patch),
+            )
+            .fetchone()
+        )
+        return decode_asset(get_backend().loads(row[0])) if row is not None else None
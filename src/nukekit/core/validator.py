@@ -128,5 +128,5 @@ def resolve_version(latest_version: Version, asset: Asset) -> Asset:
 def _version_up(asset: Asset) -> Asset:
     """Increment asset version based on user choice."""
     version_update = user_input_choice("Which type of add", VERSION_CLASSES, type="str")
-    asset.version.version_up(version_update)
+    asset.version = asset.version.version_up(version_update)
     return asset
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
-from typing import Literal
+import re
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
 import semver
 
@@ -10,18 +12,37 @@ logger = logging.getLogger(__name__)
 
 VERSION_CLASSES = Literal["major", "minor", "patch"]
 
+# Each version part is packed into 20 bits of a single integer key
+_PART_BITS = 20
+_PART_LIMIT = 1 << _PART_BITS
 
-@dataclass(order=True)
+# Plain MAJOR.MINOR.PATCH, the form used in asset file names and manifests
+_VERSION_RE = re.compile(r"(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)")
+VERSION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Version:
-    """_Semantic version implementation._
+    """Immutable semantic version.
+
+    Ordering, equality and hashing all use a packed integer key computed
+    once at construction.
 
     Raises:
-        ValueError: _description_
+        ValueError: If a part is negative or does not fit in 20 bits
     """
 
     major: int
     minor: int
     patch: int
+    _key: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for part in (self.major, self.minor, self.patch):
+            if not 0 <= part < _PART_LIMIT:
+                raise ValueError(f"Version part out of range: {part}")
+        key = (self.major << (2 * _PART_BITS)) | (self.minor << _PART_BITS) | self.patch
+        object.__setattr__(self, "_key", key)
 
     @classmethod
     def from_tuple(cls, version_tuple: tuple[int, int, int]) -> Version:
@@ -29,12 +50,13 @@ class Version:
 
     @classmethod
     def from_string(cls, version_string: str) -> Version:
-        try:
-            ver = semver.Version.parse(version_string)
-        except ValueError as e:
-            raise e
-        else:
-            return cls(ver.major, ver.minor, ver.patch)
+        """
+        Parse a version string, memoized since Version is immutable.
+
+        Raises:
+            ValueError: If the string is not a valid semantic version
+        """
+        return _parse_version(version_string)
 
     @staticmethod
     def highest_version(version_list: list[Version]) -> Version:
@@ -48,21 +70,23 @@ class Version:
         """
         return max(version_list)
 
-    def version_up(self, type_name: VERSION_CLASSES) -> None:
+    def version_up(self, type_name: VERSION_CLASSES) -> Version:
         """
-        Increment version number.
+        Return the next version.
 
         Args:
             type_name: Type of version increment ('major', 'minor', or 'patch')
-        """
-        current_val = getattr(self, type_name)
-        setattr(self, type_name, current_val + 1)
 
+        Returns:
+            New incremented version; this instance is left unchanged.
+        """
         if type_name == "major":
-            self.minor = 0
-            self.patch = 0
-        elif type_name == "minor":
-            self.patch = 0
+            return Version(self.major + 1, 0, 0)
+        if type_name == "minor":
+            return Version(self.major, self.minor + 1, 0)
+        if type_name == "patch":
+            return Version(self.major, self.minor, self.patch + 1)
+        raise ValueError(f"Unknown version increment: {type_name}")
 
     def __repr__(self) -> str:
         return f"Version('{self}')"
@@ -73,5 +97,40 @@ class Version:
     def __format__(self, format_spec: str) -> str:
         return str(self)
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key < other._key
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key <= other._key
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key > other._key
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key >= other._key
+
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._key
+
+
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_version(version_string: str) -> Version:
+    match = _VERSION_RE.fullmatch(version_string)
+    if match is not None:
+        return Version(int(match[1]), int(match[2]), int(match[3]))
+    # Pre-release and build suffixes go through the full semver grammar
+    ver = semver.Version.parse(version_string)
+    return Version(ver.major, ver.minor, ver.patch)
@@ -1,4 +1,5 @@
 from .config import ConfigLoader
+from .fileio import temporary_path, write_atomic
 from .logger import init_logger
 from .misc import _sort_dict, deep_merge
 from .paths import UserPaths
@@ -10,4 +11,6 @@ __all__ = [
     "deep_merge",
     "ConfigLoader",
     "ConfigValidator",
+    "temporary_path",
+    "write_atomic",
 ]
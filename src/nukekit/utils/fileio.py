@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK = 1 << 20
+
+# Stat data and SHA-256 of each file this process wrote or found up to date,
+# by path: a later write of the same data to the unchanged file is skipped
+# without reading it
+_written: dict[str, tuple[int, int, int, bytes]] = {}
+_written_lock = threading.Lock()
+
+
+def temporary_path(path: Path) -> Path:
+    """Hidden sibling of path, unique to this process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _content_matches(path: Path, size: int, digest: bytes) -> bool:
+    """
+    Check whether path already holds content of this size and SHA-256.
+
+    A file this process wrote or checked, unchanged since, is matched from
+    its stat data alone. Otherwise the file is only read when it has the
+    same size, and recorded when it matches.
+    """
+    key = _stat_key(path)
+    if key is None or key[1] != size:
+        return False
+    with _written_lock:
+        record = _written.get(str(path))
+    if record is not None and record[:3] == key:
+        return record[3] == digest
+    try:
+        if _file_digest(path) != digest:
+            return False
+    except FileNotFoundError:
+        return False
+    # Stat data from before the read, so a change while hashing is seen
+    with _written_lock:
+        _written[str(path)] = (*key, digest)
+    return True
+
+
+def _record_write(path: Path, digest: bytes) -> None:
+    key = _stat_key(path)
+    with _written_lock:
+        if key is None:
+            _written.pop(str(path), None)
+        else:
+            _written[str(path)] = (*key, digest)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist a rename in path, where the platform supports it."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some network filesystems refuse fsync on directories
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: Path, data: bytes, skip_unchanged: bool = True) -> bool:
+    """
+    Replace a file's content atomically.
+
+    Data goes to a temporary file in the same directory, is fsynced, then
+    renamed over path, so readers see either the old or the new content and
+    never a partial file.
+
+    Args:
+        path: Destination file
+        data: New content
+        skip_unchanged: If True, do nothing when path already holds data,
+            see _content_matches
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    digest = hashlib.sha256(data).digest()
+    if skip_unchanged and _content_matches(path, len(data), digest):
+        logger.debug(f"{path} unchanged, skipped write")
+        return False
+
+    temporary = temporary_path(path)
+    try:
+        with open(temporary, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+    _record_write(path, digest)
+    return True
@@ -22,8 +22,8 @@ def init_logger(
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler, on stderr to keep stdout for reports (nukekit verify)
+    console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
 
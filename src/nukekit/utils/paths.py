@@ -19,6 +19,8 @@ class UserPaths:
     STATE_FILE = BASE_DIR / "local_state.json"
     LOG_FILE = BASE_DIR / "nukekit.log"
     CACHED_MANIFEST = BASE_DIR / "cached_manifest.json"
+    SCAN_INDEX = BASE_DIR / "scan_index.json"
+    VERIFY_CACHE = BASE_DIR / "verify_cache.json"
 
     def __init__(self) -> None:
         self.ensure()
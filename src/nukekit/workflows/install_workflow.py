@@ -6,11 +6,17 @@ The ApplicationService handles those concerns.
 """
 
 import logging
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from ..app.container import Dependencies
-from ..core import ManifestStore, console, copy
-from ..core.exceptions import ManifestNotFoundError, UserAbortedError
+from ..core import Asset, Manifest, ManifestStore, console, copy
+from ..core.exceptions import (
+    AssetNotFoundError,
+    ManifestNotFoundError,
+    UserAbortedError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,26 +41,38 @@ def execute(deps: Dependencies, interactive: bool = True) -> dict[Any, Any]:
         UserAbortedError: If user cancels during selection.
         NotImplementedError: If interactive=False (not yet supported).
     """
-    if deps.repo_manifest is None or deps.cached_manifest is None:
+    if deps.repo_backend is None or deps.cached_manifest is None:
         raise ManifestNotFoundError("Manifests not loaded")
 
-    # User chooses asset from repository manifest
+    # User chooses asset from the repository listing; only the chosen
+    # asset's records are decoded
     if interactive:
+        with deps.repository.read_lock():
+            listing = deps.repo_backend.list_versions()
+
+        def load_section(asset_type: str, name: str) -> Manifest:
+            with deps.repository.read_lock():
+                return deps.repo_backend.load_section(asset_type, name)
+
         asset = console.choose_asset_fuzzy(
-            deps.repo_manifest.to_dict(),
+            listing,
             prompt="Select asset to install",
             prompt_version="Version to install (Latest or specific)",
+            load_section=load_section,
         )
         if asset is None:
             raise UserAbortedError("User cancelled asset selection")
     else:
         raise NotImplementedError("Non-interactive install not yet supported")
 
-    # Install locally
-    copy.copy_asset(
-        deps.repository.get_asset_path(asset),
-        deps.user_paths.NUKE_KIT_DIR / asset.get_file_name(),
-    )
+    # Install locally, alongside other readers
+    with deps.repository.read_lock():
+        copy.restore_asset(
+            deps.repository.locate_asset(asset),
+            deps.user_paths.NUKE_KIT_DIR / asset.get_file_name(),
+            hardlink=deps.hardlink_installs,
+            digest=asset.digest if deps.verify_installs else "",
+        )
     asset.set_install_status("local")
 
     # Update local manifest and save
@@ -62,3 +80,82 @@ def execute(deps: Dependencies, interactive: bool = True) -> dict[Any, Any]:
     ManifestStore.save_to_json(deps.cached_manifest, deps.user_paths.CACHED_MANIFEST)
 
     return {"asset": asset}
+
+
+def execute_all(
+    deps: Dependencies,
+    on_progress: Callable[[copy.CopyProgress], None] | None = None,
+) -> dict[Any, Any]:
+    """
+    Install the latest version of every asset in the repository.
+
+    Files are copied in parallel, see copy.copy_files. Assets that fail to
+    copy are reported and left out of the cached manifest; the others are
+    installed regardless.
+
+    Args:
+        deps: Injected dependencies containing repository, manifests, and user paths.
+        on_progress: Called as each file finishes, see copy.copy_files.
+
+    Returns:
+        Dictionary with 'assets' (installed Asset instances), 'total' and
+        'report' (copy.CopyReport, including assets missing from the repository).
+
+    Raises:
+        ManifestNotFoundError: If manifests are not loaded.
+    """
+    if deps.repo_manifest is None or deps.cached_manifest is None:
+        raise ManifestNotFoundError("Manifests not loaded")
+
+    latest: list[Asset] = []
+    for asset_type, names in deps.repo_manifest.data.items():
+        for name, versions in names.items():
+            version = deps.repo_manifest.latest_version(asset_type, name)
+            if version is not None:
+                latest.append(versions[version])
+
+    # Resolve stored paths under the read lock. Stored files are only ever
+    # moved into place whole, never modified, so copies need no lock.
+    missing: list[copy.CopyFailure] = []
+    by_job: dict[copy.CopyJob, Asset] = {}
+    with deps.repository.read_lock():
+        for asset in latest:
+            destination = deps.user_paths.NUKE_KIT_DIR / asset.get_file_name()
+            try:
+                source = deps.repository.locate_asset(asset)
+            except AssetNotFoundError as e:
+                job = copy.CopyJob(deps.repository.get_stored_path(asset), destination)
+                missing.append(copy.CopyFailure(job, e))
+                continue
+            by_job[copy.CopyJob(source, destination)] = asset
+
+    by_destination = {job.destination_path: a for job, a in by_job.items()}
+
+    def restore(source: Path, destination: Path) -> None:
+        digest = by_destination[destination].digest
+        copy.restore_asset(
+            source,
+            destination,
+            hardlink=deps.hardlink_installs,
+            digest=digest if deps.verify_installs else "",
+        )
+
+    report = copy.copy_files(
+        by_job,
+        copy=restore,
+        workers=deps.copy_workers,
+        per_device=deps.copy_per_device,
+        on_progress=on_progress,
+    )
+    report.failed[:0] = missing
+
+    installed = [by_job[job] for job in report.copied]
+    for asset in installed:
+        asset.set_install_status("local")
+        deps.cached_manifest.add_asset(asset)
+    if installed:
+        ManifestStore.save_to_json(
+            deps.cached_manifest, deps.user_paths.CACHED_MANIFEST
+        )
+
+    return {"assets": installed, "total": len(latest), "report": report}
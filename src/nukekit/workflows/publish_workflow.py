@@ -6,13 +6,15 @@ The ApplicationService handles those concerns.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 from ..app.container import Dependencies
-from ..core import Asset, Manifest, ManifestStore, console, copy, scanner
-from ..core.exceptions import UserAbortedError
+from ..core import Asset, ManifestStore, console, copy
+from ..core.exceptions import FileOperationError, UserAbortedError
 from ..core.validator import AssetValidator, resolve_version
+from ..utils import temporary_path
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +29,7 @@ def execute(
     Execute publish workflow.
 
     Scans for assets (local directory or NUKE_DIR), prompts user to select one,
-    resolves version conflicts, ensures metadata, publishes to repository,
+    resolves version conflicts, stamps metadata, publishes to repository,
     and installs locally.
 
     Args:
@@ -47,16 +49,20 @@ def execute(
 
     # Get assets to choose from
     if scan_local:
-        data = scanner.scan_folder(Path.cwd())
-        local_state = Manifest.from_dict(data)
+        local_state = ManifestStore.load_from_filesystem(
+            Path.cwd(), workers=deps.scan_workers
+        )
     else:
         local_state = ManifestStore.load_from_filesystem(
-            deps.user_paths.NUKE_DIR, cached_manifest=deps.cached_manifest
+            deps.user_paths.NUKE_DIR,
+            cached_manifest=deps.cached_manifest,
+            index_path=deps.user_paths.SCAN_INDEX,
+            workers=deps.scan_workers,
         )
 
     # User selects asset
     if interactive:
-        asset = console.choose_asset_fuzzy(local_state.to_dict(), prompt="Publish")
+        asset = console.choose_asset_fuzzy(local_state, prompt="Publish")
         if asset is None:
             raise UserAbortedError("User cancelled asset selection")
 
@@ -67,32 +73,70 @@ def execute(
         if asset is None:
             raise NotImplementedError("Non-interactive publish not yet supported")
 
-    # Resolve version conflicts
-    if deps.repo_manifest is None:
-        deps.repo_manifest = Manifest(source_path=deps.repository.manifest_path)
-
-    latest_version = deps.repo_manifest.get_latest_asset_version(asset)
+    # Resolve version conflicts, from the stored versions of this asset only
+    # unless the full manifest is already loaded
+    with deps.repository.read_lock():
+        latest_version = deps.repo_backend.latest_version(
+            deps.loaded_repo_manifest, asset
+        )
     if latest_version is not None:
         asset = resolve_version(latest_version, asset)
 
     # Validate asset
     AssetValidator.validate_and_raise(asset)
 
-    # Publish to repository
-    destination_path = deps.repository.get_asset_path(asset)
-    copy.copy_asset(asset.source_path, destination_path)
-
-    # Upate asset status
-    asset.set_publish_status("published")
-
-    # Update repository manifest and save
-    deps.repo_manifest.add_asset(asset)
-    ManifestStore.save_to_json(deps.repo_manifest, deps.repository.manifest_path)
+    # Stamp author, time and id for this publish
+    asset.stamp_metadata()
+
+    # Stage the stored file beside its final path, compressed and
+    # deduplicated if configured, hashing the content in the same pass
+    destination_path = deps.repository.get_stored_path(asset)
+    staged_path = temporary_path(destination_path)
+    blob_store = deps.repository.blob_store
+    try:
+        if blob_store is None:
+            try:
+                asset.digest, asset.size = copy.stream_copy(
+                    asset.source_path,
+                    staged_path,
+                    write_codec=deps.repository.codec,
+                )
+            except OSError as e:
+                raise FileOperationError(
+                    f"Could not store {asset.source_path}: {e}"
+                ) from e
+            asset.stored_size = staged_path.stat().st_size
+        else:
+            blob = blob_store.put(asset.source_path, deps.repository.codec)
+            blob_store.link(blob, staged_path)
+            asset.digest = blob.digest
+            asset.size = blob.size
+            asset.stored_size = blob.stored_size
+
+        # Upate asset status
+        asset.set_publish_status("published")
+
+        # Commit the version, then move the file into place: a publisher
+        # that loses the version never replaces the winner's file
+        with deps.repository.write_lock():
+            manifest = deps.repo_backend.publish(deps.loaded_repo_manifest, asset)
+            if manifest is not None:
+                deps.repo_manifest = manifest
+            try:
+                os.replace(staged_path, destination_path)
+            except OSError as e:
+                raise FileOperationError(
+                    f"Committed {asset} but could not move it into place: {e}"
+                ) from e
+    finally:
+        staged_path.unlink(missing_ok=True)
 
     # Install locally
-    copy.copy_asset(
-        deps.repository.get_asset_path(asset),
+    copy.restore_asset(
+        destination_path,
         deps.user_paths.NUKE_KIT_DIR / asset.get_file_name(),
+        hardlink=deps.hardlink_installs,
+        digest=asset.digest if deps.verify_installs else "",
     )
 
     # Update local manifest
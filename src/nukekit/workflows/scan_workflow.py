@@ -6,10 +6,10 @@ The ApplicationService handles those concerns.
 """
 
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from ..app.container import Dependencies
-from ..core import ManifestStore
+from ..core import Asset, ManifestStore
 from ..core.exceptions import ManifestNotFoundError, ScannerError
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 def execute(
     deps: Dependencies,
     location: str = "local",
+    on_asset: Callable[[Asset], None] | None = None,
 ) -> dict[Any, Any]:
     """
     Execute scan workflow.
@@ -30,10 +31,12 @@ def execute(
         deps: Injected dependencies containing user paths and manifests.
         location: "local" to scan NUKE_DIR filesystem, "remote" to use
             repository manifest.
+        on_asset: Optional callback invoked for each asset as the local
+            scan finds it, before the full result is available.
 
     Returns:
         Dictionary with:
-            - 'assets': Nested dict from Manifest.to_dict()
+            - 'versions': Nested dict of type -> name -> versions, newest first
             - 'count': Total number of asset versions found
 
     Raises:
@@ -47,17 +50,19 @@ def execute(
         manifest = ManifestStore.load_from_filesystem(
             deps.user_paths.NUKE_DIR,
             cached_manifest=cached,
+            index_path=deps.user_paths.SCAN_INDEX,
+            workers=deps.scan_workers,
+            on_asset=on_asset,
         )
+        versions = manifest.list_versions()
     elif location == "remote":
-        if deps.repo_manifest is None:
+        if deps.repo_backend is None:
             raise ManifestNotFoundError("Repository manifest not loaded")
-        manifest = deps.repo_manifest
+        # Listed without decoding asset records where the backend allows
+        with deps.repository.read_lock():
+            versions = deps.repo_backend.list_versions()
     else:
         raise ScannerError(f"Unknown scan location: {location}")
 
-    data = manifest.to_dict()
-    count = sum(
-        len(versions) for type_data in data.values() for versions in type_data.values()
-    )
-
-    return {"assets": data, "count": count}
+    count = sum(len(v) for names in versions.values() for v in names.values())
+    return {"versions": versions, "count": count}
@@ -0,0 +1,97 @@
+"""
+Verify workflow with dependency injection.
+
+This is pure business logic - no I/O creation, no error handling.
+The ApplicationService handles those concerns.
+"""
+
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+from ..app.container import Dependencies
+from ..core.exceptions import AssetNotFoundError, ManifestNotFoundError
+from ..core.integrity import VerifyCache, VerifyTarget, verify_files
+
+logger = logging.getLogger(__name__)
+
+
+def execute(
+    deps: Dependencies, workers: int | None = None, use_cache: bool = True
+) -> dict[Any, Any]:
+    """
+    Execute verify workflow.
+
+    Checks every entry of the repository manifest against its stored file
+    and every entry of the cached manifest against its installed file:
+    the file exists, has the recorded size and, when a digest is recorded,
+    the same content.
+
+    No repository lock is held while files are hashed: a nightly run must
+    not block publishers for its whole duration. A publish commits its
+    manifest entry before moving the file into place, both under the write
+    lock, so entries flagged as problems are checked again under the read
+    lock before they are reported.
+
+    Args:
+        deps: Injected dependencies containing repository, manifests, and user paths.
+        workers: Hashing processes, one per core if None.
+        use_cache: If True, skip files unchanged since they last verified.
+
+    Returns:
+        Dictionary with 'report' containing the integrity.VerifyReport.
+
+    Raises:
+        ManifestNotFoundError: If manifests are not loaded.
+    """
+    if deps.repo_manifest is None or deps.cached_manifest is None:
+        raise ManifestNotFoundError("Manifests not loaded")
+
+    cache = VerifyCache.load(deps.user_paths.VERIFY_CACHE) if use_cache else None
+    targets = list(_targets(deps))
+    report = verify_files(targets, workers=workers, cache=cache)
+    if not report.ok:
+        flagged = {(p["manifest"], p["path"]) for p in report.problems}
+        with deps.repository.read_lock():
+            recheck = verify_files(
+                [t for t in targets if (t.manifest, str(t.path)) in flagged],
+                workers=workers,
+                cache=None,
+            )
+        report.hashed += recheck.hashed
+        report.problems = recheck.problems
+    if cache is not None:
+        cache.save()
+
+    return {"report": report}
+
+
+def _targets(deps: Dependencies) -> Iterator[VerifyTarget]:
+    """Yield the files both manifests expect, without creating directories."""
+    for asset in deps.repo_manifest.iter_assets():
+        try:
+            path = deps.repository.locate_asset(asset)
+        except AssetNotFoundError:
+            path = deps.repository.get_asset_path(asset, create=False)
+        except FileNotFoundError as e:
+            # Asset type not configured for this repository
+            logger.warning(f"Skipping {asset}: {e}")
+            continue
+        yield VerifyTarget(
+            "repository",
+            str(asset),
+            asset.type.value,
+            path,
+            size=asset.stored_size,
+            digest=asset.digest,
+        )
+
+    for asset in deps.cached_manifest.iter_assets():
+        yield VerifyTarget(
+            "cached",
+            str(asset),
+            asset.type.value,
+            deps.user_paths.NUKE_KIT_DIR / asset.get_file_name(),
+            size=asset.size,
+            digest=asset.digest,
+        )
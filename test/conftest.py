@@ -4,6 +4,7 @@ from typing import Any
 import pytest
 from nukekit.app import Dependencies
 from nukekit.core import Asset, AssetType, Repository
+from nukekit.workflows import publish_workflow
 
 
 @pytest.fixture
@@ -36,3 +37,31 @@ def sample_repo(tmp_path_factory) -> Repository:
 @pytest.fixture
 def sample_deps(sample_config) -> Dependencies:
     return Dependencies.create(sample_config, logger=logging.Logger)
+
+
+@pytest.fixture
+def isolated_deps(sample_deps, tmp_path):
+    """sample_deps installing into tmp_path instead of the user's home."""
+    sample_deps.user_paths.NUKE_KIT_DIR = tmp_path / "nukekit"
+    sample_deps.user_paths.NUKE_KIT_DIR.mkdir()
+    sample_deps.user_paths.CACHED_MANIFEST = tmp_path / "cached_manifest.json"
+    sample_deps.logger = logging.getLogger("nukekit")
+    return sample_deps
+
+
+@pytest.fixture
+def publish_files(isolated_deps, tmp_path):
+    """Publish assets from files named <name>_v<version>.<ext> under tmp_path."""
+
+    def publish(*names):
+        assets = []
+        for name in names:
+            path = tmp_path / "sources" / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(name)
+            asset = Asset.from_path(path)
+            publish_workflow.execute(isolated_deps, interactive=False, asset=asset)
+            assets.append(asset)
+        return assets
+
+    return publish
@@ -0,0 +1,31 @@
+from argparse import Namespace
+
+from nukekit import cli
+from nukekit.app.service import ApplicationService
+
+
+def test_install_all_rejects_asset_selection(isolated_deps, monkeypatch):
+    app = ApplicationService(isolated_deps)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("installed anyway")
+
+    monkeypatch.setattr(app, "install_all_assets", fail)
+    for asset, version in (("tool", None), (None, "0.1.0")):
+        args = Namespace(all=True, asset=asset, version=version)
+        assert cli.cmd_install(args, app) == 1
+
+
+def test_install_all_reports_failed_copies(isolated_deps, publish_files, capsys):
+    tool, gone = publish_files("tool_v0.1.0.gizmo", "gone_v1.0.0.gizmo")
+    isolated_deps.repository.locate_asset(gone).unlink()
+    app = ApplicationService(isolated_deps)
+
+    assert cli._install_all(app) == 1
+    output = capsys.readouterr().out
+    assert "Failed copies" in output
+    assert "Installed 1 of 2 assets" in output
+
+    publish_files("gone_v1.0.1.gizmo")
+    assert cli._install_all(app) == 0
+    assert "Installed 2 of 2 assets" in capsys.readouterr().out
@@ -1,8 +1,17 @@
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
-from nukekit.core import Asset, Repository
-from nukekit.workflows import publish_workflow
+from nukekit.core import Asset, Repository, Version, copy
+from nukekit.core.exceptions import VersionConflictError
+from nukekit.core.manifest_store import open_manifest_backend
+from nukekit.app import Dependencies
+from nukekit.workflows import (
+    install_workflow,
+    publish_workflow,
+    scan_workflow,
+    verify_workflow,
+)
 
 
 @pytest.mark.dependency(name="publish")
@@ -15,3 +24,116 @@ def test_install_asset_from_repo(
     tmp_path: Path, sample_asset: Asset, sample_repo: Repository
 ):
     pass
+
+
+def test_losing_publisher_keeps_winner_file(
+    tmp_path: Path, sample_asset: Asset, isolated_deps, monkeypatch
+):
+    publish_workflow.execute(isolated_deps, interactive=False, asset=sample_asset)
+    stored = isolated_deps.repository.locate_asset(sample_asset)
+    winner = stored.read_bytes()
+
+    # A concurrent publisher that resolved the same version before the commit
+    loser_path = tmp_path / "loser" / sample_asset.source_path.name
+    loser_path.parent.mkdir()
+    loser_path.write_text("Loser")
+    monkeypatch.setattr(
+        isolated_deps.repo_backend, "latest_version", lambda manifest, asset: None
+    )
+    with pytest.raises(VersionConflictError):
+        publish_workflow.execute(
+            isolated_deps, interactive=False, asset=Asset.from_path(loser_path)
+        )
+
+    assert stored.read_bytes() == winner
+    assert [p.name for p in stored.parent.iterdir()] == [stored.name]
+
+
+@pytest.mark.parametrize("backend", ["journal", "sqlite", "sharded"])
+def test_publish_does_not_load_manifest(
+    isolated_deps, publish_files, backend, monkeypatch
+):
+    isolated_deps.repository.manifest_backend = backend
+    repo_backend = open_manifest_backend(isolated_deps.repository)
+    isolated_deps.repo_backend = repo_backend
+    loads = []
+    load = repo_backend.load
+    monkeypatch.setattr(repo_backend, "load", lambda: loads.append(1) or load())
+
+    publish_files("tool_v0.1.0.gizmo", "tool_v0.2.0.gizmo", "blur_v1.0.0.gizmo")
+
+    assert loads == []
+    assert isolated_deps.loaded_repo_manifest is None
+    assert repo_backend.load_section("Gizmo", "tool").sorted_versions(
+        "Gizmo", "tool"
+    ) == [Version(0, 1, 0), Version(0, 2, 0)]
+
+
+def test_scan_remote_lists_without_loading_manifest(
+    sample_asset: Asset, isolated_deps, sample_config
+):
+    publish_workflow.execute(isolated_deps, interactive=False, asset=sample_asset)
+
+    deps = Dependencies.create(sample_config)
+    result = scan_workflow.execute(deps, location="remote")
+    assert result["count"] == 1
+    assert result["versions"]["Gizmo"] == {"tool": [sample_asset.version]}
+    assert deps._repo_manifest is None
+
+    section = deps.repo_backend.load_section("Gizmo", "tool")
+    assert section.get_asset(sample_asset) is not None
+
+
+def test_install_all_copies_latest_versions_unlocked(
+    tmp_path: Path, isolated_deps, publish_files, monkeypatch
+):
+    assets = publish_files(
+        "tool_v0.1.0.gizmo", "tool_v0.2.0.gizmo", "blur_v1.0.0.gizmo"
+    )
+    missing = publish_files("gone_v1.0.0.gizmo")[0]
+    isolated_deps.repository.locate_asset(missing).unlink()
+    for path in isolated_deps.user_paths.NUKE_KIT_DIR.iterdir():
+        path.unlink()
+
+    copy_files = copy.copy_files
+
+    def unlocked_copy_files(*args, **kwargs):
+        # A writer could commit while files are copied
+        with isolated_deps.repository.lock.exclusive(timeout=0):
+            pass
+        return copy_files(*args, **kwargs)
+
+    monkeypatch.setattr(copy, "copy_files", unlocked_copy_files)
+    result = install_workflow.execute_all(isolated_deps)
+
+    assert result["total"] == 3
+    assert sorted(str(a) for a in result["assets"]) == sorted(
+        str(a) for a in (assets[1], assets[2])
+    )
+    [failure] = result["report"].failed
+    assert failure.job.destination_path.name == missing.get_file_name()
+    installed = sorted(p.name for p in isolated_deps.user_paths.NUKE_KIT_DIR.iterdir())
+    assert installed == sorted(a.get_file_name() for a in (assets[1], assets[2]))
+    assert isolated_deps.cached_manifest.get_asset(assets[1]) is not None
+
+
+def test_verify_rechecks_problems_under_read_lock(
+    isolated_deps, publish_files, monkeypatch
+):
+    [tool] = publish_files("tool_v0.1.0.gizmo")
+    stored = isolated_deps.repository.locate_asset(tool)
+    # Committed by a publisher that has not moved the file into place yet
+    staged = stored.with_name(f".{stored.name}.staged")
+    stored.rename(staged)
+    read_lock = isolated_deps.repository.read_lock
+
+    @contextmanager
+    def after_publisher():
+        staged.rename(stored)
+        with read_lock():
+            yield
+
+    monkeypatch.setattr(isolated_deps.repository, "read_lock", after_publisher)
+    report = verify_workflow.execute(isolated_deps, workers=1, use_cache=False)
+    assert report["report"].ok
+    assert report["report"].checked == 2
@@ -1,5 +1,6 @@
 import pytest
-from nukekit.core import Asset, AssetType
+from nukekit.core import Asset, AssetType, Version
+from nukekit.core.assets import parse_asset_stem
 
 
 def test_assets_create_gizmo(tmp_path):
@@ -35,7 +36,7 @@ def test_asset_same(sample_gizmo_path):
 
 
 def test_asset_metadata(sample_asset):
-    sample_asset.ensure_metadata()
+    sample_asset.stamp_metadata()
     assert sample_asset.author is not None
     assert sample_asset.id is not None
     assert sample_asset.time is not None
@@ -43,3 +44,38 @@ def test_asset_metadata(sample_asset):
 
 def test_asset_get_file_name(sample_asset):
     assert sample_asset.get_file_name() == "tool_v0.1.0.gizmo"
+
+
+def test_asset_metadata_is_lazy(sample_gizmo_path):
+    asset = Asset.from_path(sample_gizmo_path)
+    assert asset.id == ""
+    assert asset.author == ""
+
+
+def test_asset_stamp_metadata_replaces_stored(sample_asset):
+    sample_asset.id = "stored"
+    sample_asset.stamp_metadata()
+    assert sample_asset.id not in ("", "stored")
+
+
+def test_asset_is_slotted(sample_asset):
+    assert not hasattr(sample_asset, "__dict__")
+    assert hash(sample_asset) == hash(Asset.from_path(sample_asset.source_path))
+
+
+@pytest.mark.parametrize(
+    "stem, name, version",
+    [
+        ("blur_v1.2.0", "blur", Version(1, 2, 0)),
+        ("my_vfx_tool_v0.3.1", "my_vfx_tool", Version(0, 3, 1)),
+        ("my_vfx_tool", "my_vfx_tool", None),
+        ("blur", "blur", None),
+    ],
+)
+def test_parse_asset_stem(stem, name, version):
+    assert parse_asset_stem(stem) == (name, version)
+
+
+def test_parse_asset_stem_invalid_version():
+    with pytest.raises(ValueError):
+        parse_asset_stem("blur_v1.2")
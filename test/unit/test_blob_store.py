@@ -0,0 +1,60 @@
+import hashlib
+
+from nukekit.core import Repository, blob_store, copy
+from nukekit.core.assets import Version
+from nukekit.core.blob_store import BlobStore
+from nukekit.core.compression import GzipCodec
+from nukekit.core.serialization import decode_asset, encode_asset
+
+
+def test_identical_content_is_stored_once(tmp_path, sample_gizmo_path, monkeypatch):
+    store = BlobStore(tmp_path / "objects")
+    first = store.put(sample_gizmo_path)
+
+    def no_write(*args, **kwargs):
+        raise AssertionError("existing blob written again")
+
+    monkeypatch.setattr(blob_store, "stream_copy", no_write)
+    second = store.put(sample_gizmo_path)
+
+    assert first.digest == hashlib.sha256(b"Test").hexdigest()
+    assert first.created and not second.created
+    assert first.path == second.path == store.path_for(first.digest)
+    assert first.path.parent.name == first.digest[:2]
+    assert [p for p in store.root.rglob("*") if p.is_file()] == [first.path]
+
+
+def test_compressed_blob_keyed_by_content(tmp_path, sample_gizmo_path):
+    store = BlobStore(tmp_path / "objects")
+    plain = store.put(sample_gizmo_path)
+    compressed = store.put(sample_gizmo_path, GzipCodec())
+
+    assert compressed.digest == plain.digest
+    assert compressed.path.name == f"{plain.digest}.gz"
+    assert compressed.size == plain.size == 4
+
+
+def test_versions_hardlink_one_blob(tmp_path, sample_asset):
+    repository = Repository(tmp_path / "repo", ["Gizmo"], deduplicate=True)
+    store = repository.blob_store
+    assert store is not None
+
+    blob = store.put(sample_asset.source_path)
+    paths = []
+    for version in ("0.1.0", "0.2.0"):
+        sample_asset.version = Version.from_string(version)
+        path = repository.get_stored_path(sample_asset)
+        store.link(blob, path)
+        paths.append(path)
+
+    assert paths[0].samefile(paths[1])
+    assert blob.path.stat().st_nlink == 3
+
+    installed = tmp_path / "installed.gizmo"
+    copy.restore_asset(repository.locate_asset(sample_asset), installed)
+    assert installed.read_text() == "Test"
+
+
+def test_digest_round_trip(sample_asset):
+    sample_asset.digest = "ab" * 32
+    assert decode_asset(encode_asset(sample_asset)).digest == sample_asset.digest
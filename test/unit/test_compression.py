@@ -0,0 +1,77 @@
+import pytest
+from nukekit.core import Manifest, ManifestStore, Repository, copy
+from nukekit.core.compression import IDENTITY, GzipCodec, codec_for_path, get_codec
+from nukekit.core.exceptions import AssetNotFoundError, ManifestNotFoundError
+from nukekit.core.manifest_store import open_manifest_backend
+
+SCRIPT = b"Root {\n inputs 0\n name comp\n}\n" * 200
+
+
+def test_gzip_round_trip():
+    codec = GzipCodec()
+    compressed = codec.compress(SCRIPT)
+    assert len(compressed) < len(SCRIPT) // 10
+    assert codec.decompress(compressed) == SCRIPT
+    assert codec.compress(SCRIPT) == compressed
+
+
+def test_get_codec():
+    assert get_codec("none") is IDENTITY
+    assert get_codec("zstd").name in ("zstd", "gzip")
+    with pytest.raises(ValueError):
+        get_codec("lz4")
+
+
+def test_compressed_manifest_round_trip(tmp_path, sample_asset):
+    path = tmp_path / "manifest.json.gz"
+    manifest = Manifest()
+    manifest.add_asset(sample_asset)
+    manifest.generation = 3
+    ManifestStore.save_to_json(manifest, path)
+
+    assert codec_for_path(path).name == "gzip"
+    assert ManifestStore.read_generation(path) == 3
+    assert ManifestStore.load_from_json(path).data == manifest.data
+    assert not ManifestStore.save_to_json(manifest, path)
+
+
+def test_store_and_restore_compressed_asset(tmp_path, sample_asset):
+    sample_asset.source_path.write_bytes(SCRIPT)
+    repository = Repository(tmp_path / "repo", ["Gizmo"], compression="gzip")
+    assert repository.manifest_path.name == "manifest.json.gz"
+
+    stored = repository.get_stored_path(sample_asset)
+    assert stored.name.endswith(".gizmo.gz")
+    copy.stream_copy(sample_asset.source_path, stored, write_codec=repository.codec)
+    assert stored.stat().st_size < len(SCRIPT)
+
+    # Found whatever compression the repository is configured with now
+    plain_repository = Repository(tmp_path / "repo", ["Gizmo"])
+    assert plain_repository.locate_asset(sample_asset) == stored
+
+    installed = tmp_path / "installed.gizmo"
+    copy.restore_asset(stored, installed)
+    assert installed.read_bytes() == SCRIPT
+
+
+def test_locate_missing_asset(tmp_path, sample_asset):
+    repository = Repository(tmp_path / "repo", ["Gizmo"])
+    with pytest.raises(AssetNotFoundError):
+        repository.locate_asset(sample_asset)
+
+
+def test_enabling_compression_converts_manifest(tmp_path, sample_asset):
+    plain = Repository(tmp_path / "repo", ["Gizmo"])
+    backend = open_manifest_backend(plain)
+    backend.publish(backend.load(), sample_asset)
+
+    compressed = Repository(tmp_path / "repo", ["Gizmo"], compression="gzip")
+    manifest = open_manifest_backend(compressed).load()
+    assert manifest.get_asset(sample_asset) is not None
+    assert compressed.manifest_path.exists()
+    assert not plain.manifest_path.exists()
+
+    # Importing a manifest that is not there keeps the stored one
+    with pytest.raises(ManifestNotFoundError):
+        open_manifest_backend(compressed).import_json(plain.manifest_path)
+    assert len(open_manifest_backend(compressed).load()) == 1
@@ -0,0 +1,181 @@
+import hashlib
+import shutil
+import threading
+import time
+
+import pytest
+from nukekit.core import copy
+from nukekit.core.compression import GzipCodec
+from nukekit.core.copy import CopyStrategy, copy_file
+from nukekit.core.exceptions import ChecksumMismatchError
+
+CONTENT = b"Root {\n inputs 0\n}\n" * 1000
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "comp_v1.0.0.nk"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [CopyStrategy.COPY_FILE_RANGE, CopyStrategy.SENDFILE, CopyStrategy.BUFFERED],
+)
+def test_each_strategy_copies(tmp_path, source, strategy):
+    destination = tmp_path / "installed.nk"
+    try:
+        used = copy_file(source, destination, strategies=[strategy])
+    except OSError:
+        pytest.skip(f"{strategy} unsupported here")
+    assert used is strategy
+    assert destination.read_bytes() == CONTENT
+    assert destination.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+def test_falls_back_to_buffered_copy(tmp_path, source, monkeypatch):
+    def unsupported(src, dst):
+        raise OSError("unsupported")
+
+    for strategy in (CopyStrategy.REFLINK, CopyStrategy.COPY_FILE_RANGE):
+        monkeypatch.setitem(copy._DATA_COPIES, strategy, unsupported)
+    strategies = [
+        CopyStrategy.REFLINK,
+        CopyStrategy.COPY_FILE_RANGE,
+        CopyStrategy.BUFFERED,
+    ]
+
+    destination = tmp_path / "installed.nk"
+    used = copy_file(source, destination, strategies=strategies)
+    assert used is CopyStrategy.BUFFERED
+    assert destination.read_bytes() == CONTENT
+
+
+def test_failed_copy_keeps_destination(tmp_path, source, monkeypatch):
+    def unsupported(src, dst):
+        raise OSError("unsupported")
+
+    monkeypatch.setitem(copy._DATA_COPIES, CopyStrategy.BUFFERED, unsupported)
+    destination = tmp_path / "installed.nk"
+    destination.write_bytes(b"previous install")
+
+    with pytest.raises(OSError):
+        copy_file(source, destination, strategies=[CopyStrategy.BUFFERED])
+    assert destination.read_bytes() == b"previous install"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_hardlink_only_when_allowed(tmp_path, source):
+    linked = tmp_path / "linked.nk"
+    strategy = copy_file(source, linked, hardlink=True)
+    assert strategy in (CopyStrategy.REFLINK, CopyStrategy.HARDLINK)
+
+    copied = tmp_path / "copied.nk"
+    assert copy_file(source, copied) is not CopyStrategy.HARDLINK
+    assert not copied.samefile(source)
+
+
+def test_copy_replaces_hardlinked_destination(tmp_path, source):
+    destination = tmp_path / "installed.nk"
+    copy_file(source, destination, strategies=[CopyStrategy.HARDLINK], hardlink=True)
+    other = tmp_path / "other.nk"
+    other.write_bytes(b"other")
+
+    copy_file(other, destination)
+    assert destination.read_bytes() == b"other"
+    assert source.read_bytes() == CONTENT
+
+    # Relinking onto the same file leaves no temporary behind
+    copy_file(source, destination, strategies=[CopyStrategy.HARDLINK], hardlink=True)
+    copy_file(source, destination, strategies=[CopyStrategy.HARDLINK], hardlink=True)
+    assert destination.samefile(source)
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_same_path_rejected(source):
+    with pytest.raises(shutil.SameFileError):
+        copy_file(source, source)
+    assert source.read_bytes() == CONTENT
+
+
+def test_copy_files_reports_failures_and_progress(tmp_path, source):
+    jobs = [(source, tmp_path / f"copy{i}.nk") for i in range(5)]
+    jobs.append((tmp_path / "missing.nk", tmp_path / "never.nk"))
+    events = []
+
+    report = copy.copy_files(jobs, workers=3, on_progress=events.append)
+
+    assert len(report.copied) == 5 and not report.ok
+    assert report.bytes_copied == 5 * len(CONTENT)
+    [failure] = report.failed
+    assert failure.job.source_path.name == "missing.nk"
+    assert isinstance(failure.error, FileNotFoundError)
+    assert [event.done for event in events] == [1, 2, 3, 4, 5, 6]
+    assert {event.total for event in events} == {6}
+    assert all((tmp_path / f"copy{i}.nk").read_bytes() == CONTENT for i in range(5))
+
+
+def test_copy_files_limits_copies_per_filesystem(tmp_path, source):
+    lock = threading.Lock()
+    # Copies wait for a second one to run alongside, so the limit is reached
+    pair = threading.Barrier(2, timeout=5)
+    running = peak = 0
+
+    def slow_copy(src, dst):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        pair.wait()
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    jobs = [(source, tmp_path / f"copy{i}.nk") for i in range(8)]
+    report = copy.copy_files(jobs, copy=slow_copy, workers=8, per_device=2)
+    assert report.ok
+    assert peak <= 2
+
+
+def test_stream_copy_hashes_uncompressed_content(tmp_path, source):
+    stored = tmp_path / "stored.nk.gz"
+    digest, size = copy.stream_copy(source, stored, write_codec=GzipCodec())
+    assert digest == hashlib.sha256(CONTENT).hexdigest()
+    assert size == len(CONTENT) > stored.stat().st_size
+
+    installed = tmp_path / "installed.nk"
+    copy.restore_asset(stored, installed, digest=digest)
+    assert installed.read_bytes() == CONTENT
+    assert installed.stat().st_mtime_ns == stored.stat().st_mtime_ns
+    assert stored.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+@pytest.mark.parametrize("damage", ["truncated", "garbled"])
+def test_restore_rejects_undecodable_file(tmp_path, source, damage):
+    stored = tmp_path / "stored.nk.gz"
+    digest, _ = copy.stream_copy(source, stored, write_codec=GzipCodec())
+    data = stored.read_bytes()
+    if damage == "truncated":
+        stored.write_bytes(data[: len(data) // 2])
+    else:
+        stored.write_bytes(data[:20] + b"\xff" * 64 + data[84:])
+
+    installed = tmp_path / "installed.nk"
+    for expected in (digest, ""):
+        with pytest.raises(ChecksumMismatchError):
+            copy.restore_asset(stored, installed, digest=expected)
+    assert not installed.exists()
+
+
+def test_restore_rejects_corrupted_file(tmp_path, source):
+    digest = hashlib.sha256(CONTENT).hexdigest()
+    stored = tmp_path / "stored.nk"
+    stored.write_bytes(CONTENT[:-1] + b"!")
+
+    installed = tmp_path / "installed.nk"
+    installed.write_bytes(b"previous install")
+    with pytest.raises(ChecksumMismatchError):
+        copy.restore_asset(stored, installed, hardlink=True, digest=digest)
+    assert installed.read_bytes() == b"previous install"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
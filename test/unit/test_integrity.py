@@ -0,0 +1,93 @@
+import hashlib
+import os
+
+from nukekit.core import copy
+from nukekit.core.compression import GzipCodec
+from nukekit.core.integrity import VerifyCache, VerifyTarget, hash_file, verify_files
+
+CONTENT = b"Group {\n name tool\n}\n" * 50
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+def _target(path, **kwargs):
+    return VerifyTarget("repository", path.stem, "Gizmo", path, **kwargs)
+
+
+def _age(path):
+    # Older than the racy window, so results can be cached
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10_000_000_000))
+
+
+def test_hash_file_reads_compressed_content(tmp_path):
+    plain = tmp_path / "tool.gizmo"
+    plain.write_bytes(CONTENT)
+    stored = tmp_path / "tool.gizmo.gz"
+    copy.stream_copy(plain, stored, write_codec=GzipCodec())
+
+    assert hash_file(str(plain)) == hash_file(str(stored)) == (DIGEST, "")
+    digest, error = hash_file(str(tmp_path / "missing.gizmo"))
+    assert digest == "" and error
+
+
+def test_verify_reports_problems(tmp_path):
+    good = tmp_path / "good.gizmo"
+    good.write_bytes(CONTENT)
+    corrupted = tmp_path / "corrupted.gizmo"
+    corrupted.write_bytes(CONTENT[:-1] + b"!")
+    truncated = tmp_path / "truncated.gizmo"
+    truncated.write_bytes(CONTENT[:10])
+
+    report = verify_files(
+        [
+            _target(good, size=len(CONTENT), digest=DIGEST),
+            _target(corrupted, size=len(CONTENT), digest=DIGEST),
+            _target(truncated, size=len(CONTENT), digest=DIGEST),
+            _target(tmp_path / "missing.gizmo", digest=DIGEST),
+            _target(good),
+        ],
+        workers=2,
+    )
+
+    assert report.checked == 5 and report.hashed == 2
+    problems = {p["asset"]: p["problem"] for p in report.problems}
+    assert problems == {
+        "corrupted": "digest",
+        "truncated": "size",
+        "missing": "missing",
+    }
+    assert report.to_dict()["ok"] is False
+
+
+def test_verify_hashes_hardlinked_files_once(tmp_path):
+    blob = tmp_path / "blob"
+    blob.write_bytes(CONTENT)
+    targets = [_target(blob, digest=DIGEST)]
+    for i in range(3):
+        os.link(blob, tmp_path / f"tool_v{i}.gizmo")
+        targets.append(_target(tmp_path / f"tool_v{i}.gizmo", digest=DIGEST))
+
+    report = verify_files(targets, workers=1)
+    assert report.ok and report.checked == 4 and report.hashed == 1
+
+
+def test_cache_skips_unchanged_files(tmp_path):
+    path = tmp_path / "tool.gizmo"
+    path.write_bytes(CONTENT)
+    _age(path)
+    cache_path = tmp_path / "verify_cache.json"
+
+    cache = VerifyCache.load(cache_path)
+    assert verify_files([_target(path, digest=DIGEST)], cache=cache).hashed == 1
+    cache.save()
+
+    cache = VerifyCache.load(cache_path)
+    report = verify_files([_target(path, digest=DIGEST)], cache=cache)
+    assert report.ok and report.hashed == 0 and report.skipped == 1
+
+    # A changed file is hashed again, and dropped from the cache on mismatch
+    path.write_bytes(CONTENT[:-1] + b"!")
+    _age(path)
+    report = verify_files([_target(path, digest=DIGEST)], cache=cache)
+    assert report.hashed == 1 and report.problems[0]["problem"] == "digest"
+    assert cache.files == {}
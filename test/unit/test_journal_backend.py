@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+from nukekit.core import Asset, Manifest, ManifestStore, Repository, Version
+from nukekit.core.exceptions import VersionConflictError
+from nukekit.core.journal_store import JournalManifestBackend
+from nukekit.core.manifest_store import open_manifest_backend
+
+
+def _asset(name, version):
+    return Asset.from_path(Path(f"{name}_v{version}.gizmo"))
+
+
+def _backend(tmp_path):
+    return JournalManifestBackend(
+        tmp_path / "manifest.json", tmp_path / "manifest.journal"
+    )
+
+
+def test_publish_appends_without_rewriting_snapshot(tmp_path):
+    backend = _backend(tmp_path)
+    manifest = Manifest()
+    backend.publish(manifest, _asset("tool", "0.1.0"))
+    backend.publish(manifest, _asset("tool", "0.2.0"))
+
+    assert not backend.snapshot_path.exists()
+    assert len(backend.journal_path.read_bytes().splitlines()) == 2
+    assert backend.load().data == manifest.data
+
+
+def test_concurrent_publishers_keep_both_records(tmp_path):
+    first, second = _backend(tmp_path), _backend(tmp_path)
+    first.publish(first.load(), _asset("tool", "0.1.0"))
+    second.publish(second.load(), _asset("blur", "1.0.0"))
+
+    loaded = _backend(tmp_path).load()
+    assert loaded.latest_version("Gizmo", "tool") == Version(0, 1, 0)
+    assert loaded.latest_version("Gizmo", "blur") == Version(1, 0, 0)
+
+
+def test_same_version_published_twice_conflicts(tmp_path):
+    first, second = _backend(tmp_path), _backend(tmp_path)
+    stale = second.load()
+    first.publish(first.load(), _asset("tool", "0.1.0"))
+
+    assert second.latest_version(stale, _asset("tool", "0.1.0")) == Version(0, 1, 0)
+    with pytest.raises(VersionConflictError):
+        second.publish(stale, _asset("tool", "0.1.0"))
+    assert len(second.journal_path.read_bytes().splitlines()) == 1
+
+    # Still found once compaction moved it into the snapshot
+    first.compact()
+    with pytest.raises(VersionConflictError):
+        second.publish(stale, _asset("tool", "0.1.0"))
+
+
+def test_compact_folds_journal_into_snapshot(tmp_path):
+    backend = _backend(tmp_path)
+    manifest = Manifest()
+    for version in ("0.1.0", "0.2.0", "0.3.0"):
+        backend.publish(manifest, _asset("tool", version))
+
+    assert backend.compact() == 3
+    assert not backend.journal_path.exists()
+    assert backend._pending_journals() == []
+    assert ManifestStore.load_from_json(backend.snapshot_path).data == manifest.data
+    assert backend.compact() == 0
+
+
+def test_pending_journal_is_replayed(tmp_path):
+    backend = _backend(tmp_path)
+    backend.publish(Manifest(), _asset("tool", "0.1.0"))
+    # Compaction interrupted after renaming the live journal
+    backend.journal_path.rename(tmp_path / "manifest.journal.1")
+    backend.publish(Manifest(), _asset("tool", "0.2.0"))
+
+    assert backend.load().sorted_versions("Gizmo", "tool") == [
+        Version(0, 1, 0),
+        Version(0, 2, 0),
+    ]
+    assert backend.compact() == 2
+
+
+def test_load_sees_records_compacted_while_loading(tmp_path, monkeypatch):
+    backend = _backend(tmp_path)
+    backend.publish(Manifest(), _asset("tool", "0.1.0"))
+    read_journals = backend._read_journals
+
+    def compacted_first():
+        # Another process compacts just before this reader gets to the journals
+        _backend(tmp_path).compact()
+        return read_journals()
+
+    monkeypatch.setattr(backend, "_read_journals", compacted_first)
+    assert backend.load().latest_version("Gizmo", "tool") == Version(0, 1, 0)
+
+
+def test_torn_record_is_skipped(tmp_path):
+    backend = _backend(tmp_path)
+    backend.publish(Manifest(), _asset("tool", "0.1.0"))
+    with open(backend.journal_path, "ab") as file:
+        file.write(b'{"name": "tool", "vers')
+
+    assert len(backend.load()) == 1
+
+
+def test_open_journal_backend(tmp_path):
+    repository = Repository(tmp_path / "repo", ["Gizmo"], manifest_backend="journal")
+    backend = open_manifest_backend(repository)
+    assert isinstance(backend, JournalManifestBackend)
+    assert backend.snapshot_path == repository.manifest_path
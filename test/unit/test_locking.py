@@ -0,0 +1,148 @@
+import errno
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from nukekit.core import Asset
+from nukekit.core.exceptions import RepositoryLockTimeoutError
+from nukekit.core import locking
+from nukekit.core.locking import RepositoryLock
+from nukekit.core.manifest_store import JsonManifestBackend
+
+_context = multiprocessing.get_context("fork")
+
+
+def _hold_shared(lock_path, held, release):
+    with RepositoryLock(lock_path).shared():
+        held.set()
+        release.wait(10)
+
+
+def _publish_many(root, worker, count):
+    lock = RepositoryLock(root / ".nukekit.lock")
+    backend = JsonManifestBackend(root / "manifest.json")
+    for i in range(count):
+        with lock.shared():
+            manifest = backend.load()
+        asset = Asset.from_path(Path(f"tool{worker}_v1.{i}.0.gizmo"))
+        with lock.exclusive():
+            backend.publish(manifest, asset)
+
+
+def _read_many(root, count, errors):
+    lock = RepositoryLock(root / ".nukekit.lock")
+    backend = JsonManifestBackend(root / "manifest.json")
+    for _ in range(count):
+        try:
+            with lock.shared():
+                backend.load()
+        except Exception as e:
+            errors.put(repr(e))
+
+
+def test_shared_locks_overlap(tmp_path):
+    lock = RepositoryLock(tmp_path / "repo.lock", timeout=0.2)
+    with lock.shared(), lock.shared():
+        pass
+
+
+def test_exclusive_waits_for_readers_in_other_process(tmp_path):
+    lock_path = tmp_path / "repo.lock"
+    held, release = _context.Event(), _context.Event()
+    reader = _context.Process(target=_hold_shared, args=(lock_path, held, release))
+    reader.start()
+    try:
+        assert held.wait(10)
+        lock = RepositoryLock(lock_path)
+        with lock.shared(timeout=0.2):
+            pass
+        start = time.monotonic()
+        with pytest.raises(RepositoryLockTimeoutError):
+            with lock.exclusive(timeout=0.2):
+                pass
+        assert time.monotonic() - start >= 0.2
+    finally:
+        release.set()
+        reader.join(10)
+
+    with RepositoryLock(lock_path).exclusive(timeout=1):
+        pass
+
+
+def test_waiting_writer_holds_off_new_readers(tmp_path):
+    lock = RepositoryLock(tmp_path / "repo.lock", timeout=5)
+    written = threading.Event()
+
+    def write():
+        with lock.exclusive():
+            written.set()
+
+    with lock.shared():
+        writer = threading.Thread(target=write)
+        writer.start()
+        # New readers are admitted until the writer queues on the gate
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                with lock.shared(timeout=0):
+                    pass
+            except RepositoryLockTimeoutError:
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("writer never queued")
+        assert not written.is_set()
+    writer.join(5)
+    assert written.is_set()
+
+
+def test_read_only_lock_file(tmp_path, monkeypatch, caplog):
+    real_open = os.open
+
+    def read_only_open(path, flags, *args):
+        if flags & (os.O_RDWR | os.O_WRONLY | os.O_CREAT):
+            raise OSError(errno.EROFS, "Read-only file system", str(path))
+        return real_open(path, flags, *args)
+
+    existing = tmp_path / "repo.lock"
+    with RepositoryLock(existing).shared():
+        pass
+
+    monkeypatch.setattr(locking.os, "open", read_only_open)
+    lock = RepositoryLock(existing)
+    with lock.shared():
+        # Still locked through the read-only descriptor
+        with pytest.raises(RepositoryLockTimeoutError):
+            with lock.exclusive(timeout=0.1):
+                pass
+
+    with caplog.at_level(logging.WARNING):
+        with RepositoryLock(tmp_path / "missing.lock").shared():
+            pass
+    assert "continuing unlocked" in caplog.text
+
+
+def test_multiprocess_publish_contention(tmp_path):
+    errors = _context.Queue()
+    writers = [
+        _context.Process(target=_publish_many, args=(tmp_path, worker, 5))
+        for worker in range(4)
+    ]
+    readers = [
+        _context.Process(target=_read_many, args=(tmp_path, 20, errors))
+        for _ in range(4)
+    ]
+    for process in writers + readers:
+        process.start()
+    for process in writers + readers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    assert errors.empty()
+    manifest = JsonManifestBackend(tmp_path / "manifest.json").load()
+    assert len(manifest) == 20
+    assert manifest.generation == 20
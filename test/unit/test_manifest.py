@@ -1,4 +1,11 @@
-from nukekit.core import Manifest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from nukekit.core import Asset, Manifest, ManifestStore, Version
+from nukekit.core.exceptions import VersionConflictError
+from nukekit.core.manifest_store import JsonManifestBackend
 
 
 def test_manifest_empty():
@@ -36,9 +43,176 @@ def test_manifest_len(sample_asset):
 
 
 def test_manifest_latest_asset_version(sample_asset):
-    asset2 = sample_asset
-    asset2.version.version_up("minor")
+    asset2 = replace(sample_asset, version=sample_asset.version.version_up("minor"))
     manifest = Manifest()
     manifest.add_asset(sample_asset)
     manifest.add_asset(asset2)
     assert manifest.get_latest_asset_version(sample_asset) == asset2.version
+
+
+def test_manifest_store_load_from_filesystem(tmp_path):
+    (tmp_path / "tool_v0.1.0.gizmo").write_text("Test")
+    (tmp_path / "comp_v1.0.0.nk").write_text("Test")
+    seen = []
+    manifest = ManifestStore.load_from_filesystem(tmp_path, on_asset=seen.append)
+    assert len(manifest) == 2
+    assert sorted(str(a) for a in seen) == ["comp_v1.0.0", "tool_v0.1.0"]
+
+
+def test_manifest_json_round_trip_keeps_metadata(tmp_path, sample_asset):
+    sample_asset.stamp_metadata()
+    manifest = Manifest()
+    manifest.add_asset(sample_asset)
+    path = tmp_path / "manifest.json"
+    ManifestStore.save_to_json(manifest, path)
+
+    loaded = ManifestStore.load_from_json(path).get_asset(sample_asset)
+    assert loaded.id == sample_asset.id
+    assert loaded.time == sample_asset.time
+    assert loaded.author == sample_asset.author
+
+
+def test_manifest_sorted_versions_kept_current(sample_asset):
+    manifest = Manifest()
+    manifest.add_asset(replace(sample_asset, version=Version(1, 0, 0)))
+    assert manifest.latest_version("Gizmo", "tool") == Version(1, 0, 0)
+
+    manifest.add_asset(replace(sample_asset, version=Version(0, 5, 0)))
+    manifest.add_asset(replace(sample_asset, version=Version(2, 0, 0)))
+    manifest.add_asset(replace(sample_asset, version=Version(2, 0, 0)))
+    assert manifest.sorted_versions("Gizmo", "tool", reverse=True) == [
+        Version(2, 0, 0),
+        Version(1, 0, 0),
+        Version(0, 5, 0),
+    ]
+    assert manifest.latest_version("Gizmo", "missing") is None
+
+
+def test_manifest_merge_keeps_version_index(sample_asset):
+    local = Manifest()
+    local.add_asset(replace(sample_asset, version=Version(0, 2, 0)))
+    cached = Manifest()
+    cached.add_asset(replace(sample_asset, version=Version(0, 3, 0)))
+    local.latest_version("Gizmo", "tool")
+    cached.latest_version("Gizmo", "tool")
+
+    merged = local.merge(cached)
+    assert merged.sorted_versions("Gizmo", "tool") == [
+        Version(0, 2, 0),
+        Version(0, 3, 0),
+    ]
+
+
+def test_manifest_find(sample_asset):
+    manifest = Manifest()
+    keyer = replace(sample_asset, author="alice", tags=["keyer"], id="a1")
+    blur = replace(
+        sample_asset, name="blur", author="bob", tags=["filter", "keyer"], id="b1"
+    )
+    manifest.add_asset(keyer)
+    manifest.add_asset(blur)
+
+    assert manifest.find(author="alice") == [keyer]
+    assert manifest.find(tag="keyer") == [blur, keyer]
+    assert manifest.find(tag="keyer", author="bob") == [blur]
+    assert manifest.find(id="missing") == []
+    assert manifest.find(name="tool") == [keyer]
+
+
+def test_manifest_find_kept_current(sample_asset):
+    manifest = Manifest()
+    manifest.add_asset(replace(sample_asset, author="alice"))
+    assert len(manifest.find(author="alice")) == 1
+
+    # Re-adding the same version replaces its index entries
+    manifest.add_asset(replace(sample_asset, author="carol"))
+    assert manifest.find(author="alice") == []
+    assert len(manifest.find(author="carol")) == 1
+
+
+def test_manifest_find_reindexes_asset_mutated_in_place(sample_asset):
+    manifest = Manifest()
+    asset = replace(sample_asset, author="alice")
+    manifest.add_asset(asset)
+    assert manifest.find(author="alice") == [asset]
+
+    asset.author = "carol"
+    manifest.add_asset(asset)
+    assert manifest.find(author="alice") == []
+    assert manifest.find(author="carol") == [asset]
+
+
+def test_manifest_merge_does_not_mutate_inputs(sample_asset):
+    local = Manifest()
+    local.add_asset(replace(sample_asset, version=Version(0, 2, 0), message="local"))
+    cached = Manifest()
+    cached.add_asset(replace(sample_asset, version=Version(0, 2, 0), message="cache"))
+    cached.add_asset(replace(sample_asset, version=Version(0, 1, 0)))
+    cached.add_asset(replace(sample_asset, name="blur"))
+
+    merged = local.merge(cached)
+    assert len(merged) == 3
+    assert len(local) == 1
+    assert len(cached) == 3
+    # Versions from the receiving manifest win
+    assert merged.data["Gizmo"]["tool"][Version(0, 2, 0)].message == "local"
+    assert cached.data["Gizmo"]["tool"][Version(0, 2, 0)].message == "cache"
+
+    # Shared subtrees are copied on write, on both sides
+    assert merged.data["Gizmo"]["blur"] is cached.data["Gizmo"]["blur"]
+    merged.add_asset(replace(sample_asset, name="blur", version=Version(0, 9, 0)))
+    assert len(cached.data["Gizmo"]["blur"]) == 1
+    cached.add_asset(replace(sample_asset, name="blur", version=Version(0, 8, 0)))
+    assert Version(0, 8, 0) not in merged.data["Gizmo"]["blur"]
+    assert merged.latest_version("Gizmo", "blur") == Version(0, 9, 0)
+    assert cached.latest_version("Gizmo", "blur") == Version(0, 8, 0)
+
+
+def test_manifest_generation_round_trip(tmp_path, sample_asset):
+    path = tmp_path / "manifest.json"
+    manifest = Manifest()
+    manifest.add_asset(sample_asset)
+    manifest.generation = 7
+    ManifestStore.save_to_json(manifest, path)
+
+    assert ManifestStore.read_generation(path) == 7
+    assert ManifestStore.load_from_json(path).generation == 7
+    assert ManifestStore.read_generation(tmp_path / "missing.json") == 0
+
+
+def test_manifest_commit_rebases_stale_publish(tmp_path):
+    backend = JsonManifestBackend(tmp_path / "manifest.json")
+    first, second = backend.load(), backend.load()
+
+    backend.publish(first, Asset.from_path(Path("tool_v0.1.0.gizmo")))
+    committed = backend.publish(second, Asset.from_path(Path("blur_v1.0.0.gizmo")))
+
+    assert committed.generation == 2
+    stored = backend.load()
+    assert stored.latest_version("Gizmo", "tool") == Version(0, 1, 0)
+    assert stored.latest_version("Gizmo", "blur") == Version(1, 0, 0)
+
+
+def test_manifest_commit_rejects_concurrent_same_version(tmp_path):
+    backend = JsonManifestBackend(tmp_path / "manifest.json")
+    first, second = backend.load(), backend.load()
+
+    backend.publish(first, Asset.from_path(Path("tool_v0.1.0.gizmo")))
+    assert backend.latest_version(second, Asset.from_path(Path("tool_v0.1.0.gizmo")))
+    with pytest.raises(VersionConflictError):
+        backend.publish(second, Asset.from_path(Path("tool_v0.1.0.gizmo")))
+
+
+def test_manifest_commit_concurrent_publishers(tmp_path):
+    backend = JsonManifestBackend(tmp_path / "manifest.json")
+    stale = [backend.load() for _ in range(8)]
+
+    def _publish(i):
+        backend.publish(stale[i], Asset.from_path(Path(f"tool{i}_v1.0.0.gizmo")))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_publish, range(8)))
+
+    stored = backend.load()
+    assert len(stored) == 8
+    assert stored.generation == 8
@@ -1,4 +1,6 @@
+import pytest
 from nukekit.core import AssetType, Repository
+from nukekit.core.exceptions import AssetNotFoundError
 
 
 def test_repo_from_config(sample_config):
@@ -27,3 +29,12 @@ def test_repo_build_asset_path(sample_config, sample_asset):
 def test_repo_list_asset_directories(sample_config):
     repository = Repository.from_config(sample_config)
     assert repository.list_asset_directories("Gizmo") == []
+
+
+def test_repo_locate_does_not_create_directories(sample_config, sample_asset):
+    repository = Repository.from_config(sample_config)
+    path = repository.get_asset_path(sample_asset, create=False)
+    assert not path.parent.exists()
+    with pytest.raises(AssetNotFoundError):
+        repository.locate_asset(sample_asset)
+    assert not path.parent.exists()
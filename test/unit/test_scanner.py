@@ -0,0 +1,97 @@
+from nukekit.core import AssetType, Version, scan_index
+from nukekit.core.scan_index import ScanIndex
+from nukekit.core.scanner import iter_assets, scan_folder, walk_asset_files
+
+
+def _make_tree(root):
+    (root / "gizmos" / "nested").mkdir(parents=True)
+    (root / "scripts").mkdir()
+    (root / "gizmos" / "tool_v0.1.0.gizmo").write_text("Test")
+    (root / "gizmos" / "nested" / "tool_v0.2.0.gizmo").write_text("Test")
+    (root / "scripts" / "comp_v1.0.0.nk").write_text("Test")
+    (root / "scripts" / "notes.txt").write_text("Test")
+
+
+def test_walk_asset_files_single_pass(tmp_path):
+    _make_tree(tmp_path)
+    found = sorted((entry.name, t) for entry, t in walk_asset_files(tmp_path))
+    assert found == [
+        ("comp_v1.0.0.nk", AssetType.SCRIPT),
+        ("tool_v0.1.0.gizmo", AssetType.GIZMO),
+        ("tool_v0.2.0.gizmo", AssetType.GIZMO),
+    ]
+
+
+def test_iter_assets_is_lazy(tmp_path):
+    _make_tree(tmp_path)
+    assets = iter_assets(tmp_path)
+    first = next(assets)
+    assert first.type in (AssetType.GIZMO, AssetType.SCRIPT)
+    assert len(list(assets)) == 2
+
+
+def test_scan_folder(tmp_path):
+    _make_tree(tmp_path)
+    data = scan_folder(tmp_path)
+    assert set(data[AssetType.GIZMO]["tool"]) == {
+        Version(0, 1, 0),
+        Version(0, 2, 0),
+    }
+    assert list(data[AssetType.SCRIPT]["comp"]) == [Version(1, 0, 0)]
+
+
+def test_scan_folder_parallel_matches_serial(tmp_path):
+    _make_tree(tmp_path)
+    for i in range(20):
+        deep = tmp_path / "deep" / str(i) / "a" / "b"
+        deep.mkdir(parents=True)
+        (deep / f"node{i}_v1.0.0.gizmo").write_text("Test")
+    assert scan_folder(tmp_path, workers=4) == scan_folder(tmp_path)
+
+
+def test_scan_folder_empty(tmp_path):
+    data = scan_folder(tmp_path)
+    assert data == {AssetType.SCRIPT: {}, AssetType.GIZMO: {}}
+
+
+def test_scan_index_reuses_unchanged_directories(tmp_path, monkeypatch):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(tree)
+    index_path = tmp_path / "scan_index.json"
+
+    monkeypatch.setattr(scan_index, "_RACY_WINDOW_NS", 0)
+    index = ScanIndex.load(index_path)
+    first = scan_folder(tree, index=index)
+    index.save()
+
+    index = ScanIndex.load(index_path)
+    assert all(
+        set(r) == {"stat", "subdirs", "assets"} for r in index.directories.values()
+    )
+    listed = []
+    original = index._list_directory
+
+    def _spy(path, st):
+        listed.append(path)
+        return original(path, st)
+
+    monkeypatch.setattr(index, "_list_directory", _spy)
+    assert scan_folder(tree, index=index) == first
+    assert listed == []
+
+
+def test_scan_index_picks_up_new_files(tmp_path, monkeypatch):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(tree)
+    index_path = tmp_path / "scan_index.json"
+
+    monkeypatch.setattr(scan_index, "_RACY_WINDOW_NS", 0)
+    index = ScanIndex.load(index_path)
+    scan_folder(tree, index=index)
+    index.save()
+
+    (tree / "scripts" / "comp_v1.1.0.nk").write_text("Test")
+    data = scan_folder(tree, index=ScanIndex.load(index_path))
+    assert set(data[AssetType.SCRIPT]["comp"]) == {Version(1, 0, 0), Version(1, 1, 0)}
@@ -0,0 +1,197 @@
+import os
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from nukekit.core import AssetStatus, AssetType, Manifest, ManifestStore, Version
+from nukekit.core import serialization
+from nukekit.core.serialization import (
+    JsonBackend,
+    StdlibJsonBackend,
+    decode_manifest,
+    dump_json,
+    encode_manifest,
+    load_json,
+    load_manifest_json,
+    load_manifest_section,
+    load_manifest_versions,
+)
+from nukekit.utils import fileio, write_atomic
+
+EXAMPLE_MANIFEST = Path(__file__).parents[2] / "examples" / "manifest.json"
+
+
+def test_decode_manifest_layout():
+    raw = {
+        "Gizmo": {
+            "tool": {
+                "0.1.0": {
+                    "name": "tool",
+                    "version": "0.1.0",
+                    "source_path": "/repo/tool_v0.1.0.gizmo",
+                    "status": "published",
+                    "type": "Gizmo",
+                    "author": "alice",
+                    "__type__": "Asset",
+                    "unknown_field": 1,
+                }
+            }
+        },
+    }
+    data = decode_manifest(raw)
+    asset = data["Gizmo"]["tool"][Version(0, 1, 0)]
+    assert asset.status is AssetStatus.PUBLISHED
+    assert asset.type is AssetType.GIZMO
+    assert asset.source_path == Path("/repo/tool_v0.1.0.gizmo")
+    assert asset.author == "alice"
+    assert data["Script"] == {}
+
+
+def test_decode_manifest_skips_generation(tmp_path):
+    raw = {"__generation__": 3, "Gizmo": {}}
+    assert "__generation__" not in decode_manifest(raw)
+
+    path = tmp_path / "manifest.json"
+    dump_json(raw, path)
+    data, generation = load_manifest_json(path)
+    assert generation == 3 and "__generation__" not in data
+
+
+def test_load_example_manifest():
+    data = load_json(EXAMPLE_MANIFEST)
+    assert Version(2, 0, 0) in data["Gizmo"]["my_gizmo"]
+
+
+def test_backends_produce_same_bytes():
+    data = load_json(EXAMPLE_MANIFEST)
+    stdlib = encode_manifest(data, backend=StdlibJsonBackend())
+    assert encode_manifest(data) == stdlib
+    assert encode_manifest(data, compact=True, backend=StdlibJsonBackend()) == (
+        encode_manifest(data, compact=True)
+    )
+    with pytest.raises(TypeError):
+        JsonBackend()  # type: ignore[abstract]
+
+
+def test_encode_manifest_round_trip(tmp_path):
+    data = load_json(EXAMPLE_MANIFEST)
+    for compact in (False, True):
+        path = tmp_path / "manifest.json"
+        dump_json(data, path, compact=compact)
+        assert load_json(path) == data
+    assert b"\n" not in path.read_bytes()
+
+
+def test_save_to_json_skips_unchanged(tmp_path, sample_asset):
+    path = tmp_path / "repository" / "manifest.json"
+    manifest = Manifest()
+    manifest.add_asset(sample_asset)
+
+    assert ManifestStore.save_to_json(manifest, path)
+    inode = path.stat().st_ino
+    assert not ManifestStore.save_to_json(manifest, path)
+    assert path.stat().st_ino == inode
+
+    manifest.add_asset(replace(sample_asset, version=Version(0, 2, 0)))
+    assert ManifestStore.save_to_json(manifest, path)
+    assert path.stat().st_ino != inode
+    assert sorted(p.name for p in path.parent.iterdir()) == [
+        "manifest.json",
+        "manifest.json.idx",
+    ]
+
+
+def test_write_atomic_compares_existing_content(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    path.write_bytes(b'{"a": 1}')
+    assert not write_atomic(path, b'{"a": 1}')
+    # Same size, different content
+    assert write_atomic(path, b'{"a": 2}')
+
+    def no_read(*args, **kwargs):
+        raise AssertionError("existing file read")
+
+    # Checked or written by this process and unchanged since: stat only
+    monkeypatch.setattr("builtins.open", no_read)
+    assert not write_atomic(path, b'{"a": 2}')
+    # Different size: written without reading the old content
+    monkeypatch.undo()
+    monkeypatch.setattr(fileio, "_file_digest", no_read)
+    assert write_atomic(path, b'{"a": 10}')
+
+
+def test_write_atomic_skips_unchanged_from_another_process(tmp_path):
+    path = tmp_path / "manifest.json"
+    write = (
+        "import sys; from pathlib import Path; from nukekit.utils import write_atomic; "
+        "sys.exit(0 if write_atomic(Path(sys.argv[1]), b'{}') else 1)"
+    )
+    assert subprocess.run([sys.executable, "-c", write, str(path)]).returncode == 0
+    mtime = path.stat().st_mtime_ns
+
+    assert subprocess.run([sys.executable, "-c", write, str(path)]).returncode == 1
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_write_atomic_keeps_old_content_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    write_atomic(path, b"old")
+
+    def _fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail)
+    with pytest.raises(OSError):
+        write_atomic(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_load_section_reads_only_requested_asset(tmp_path):
+    path = tmp_path / "manifest.json"
+    full = ManifestStore.load_from_json(EXAMPLE_MANIFEST)
+    ManifestStore.save_to_json(full, path)
+
+    for asset_type, names in full.data.items():
+        section = ManifestStore.load_section(path, asset_type)
+        assert section.data[asset_type] == names
+        for name, versions in names.items():
+            section = ManifestStore.load_section(path, asset_type, name)
+            assert section.data[asset_type] == {name: versions}
+            assert len(section) == len(versions)
+
+    assert len(ManifestStore.load_section(path, "Gizmo", "missing")) == 0
+
+
+def test_list_versions_from_offset_table(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    full = ManifestStore.load_from_json(EXAMPLE_MANIFEST)
+    ManifestStore.save_to_json(full, path)
+    assert load_manifest_versions(path) == full.list_versions()
+
+    def no_decode(*args):
+        raise AssertionError("manifest decoded")
+
+    monkeypatch.setattr(serialization, "decode_versions", no_decode)
+    monkeypatch.setattr(serialization, "decode_manifest", no_decode)
+    assert ManifestStore.list_versions(path) == full.list_versions()
+
+
+def test_load_section_ignores_stale_offset_table(tmp_path, sample_asset):
+    path = tmp_path / "repository" / "manifest.json"
+    manifest = Manifest()
+    manifest.add_asset(sample_asset)
+    ManifestStore.save_to_json(manifest, path)
+    assert load_manifest_section(path, "Gizmo", "tool") is not None
+
+    # Rewritten without a table, e.g. by an older client
+    manifest.add_asset(replace(sample_asset, version=Version(0, 2, 0)))
+    dump_json(manifest.to_dict(), path)
+    assert load_manifest_section(path, "Gizmo", "tool") is None
+    section = ManifestStore.load_section(path, "Gizmo", "tool")
+    assert section.sorted_versions("Gizmo", "tool") == [
+        Version(0, 1, 0),
+        Version(0, 2, 0),
+    ]
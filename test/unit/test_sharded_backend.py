@@ -0,0 +1,128 @@
+import threading
+from pathlib import Path
+
+import pytest
+from nukekit.core import Asset, Manifest, Repository, Version
+from nukekit.core.exceptions import VersionConflictError
+from nukekit.core.manifest_store import open_manifest_backend
+from nukekit.core.sharded_store import ShardedManifestBackend
+
+EXAMPLE_MANIFEST = Path(__file__).parents[2] / "examples" / "manifest.json"
+
+
+def _asset(name, version):
+    return Asset.from_path(Path(f"{name}_v{version}.gizmo"))
+
+
+def _backend(tmp_path):
+    return ShardedManifestBackend(tmp_path, tmp_path / "index.json")
+
+
+def test_publish_touches_one_shard(tmp_path):
+    backend = _backend(tmp_path)
+    manifest = Manifest()
+    backend.publish(manifest, _asset("blur", "1.0.0"))
+    blur_shard = backend.shard_path("Gizmo", "blur")
+    blur_mtime = blur_shard.stat().st_mtime_ns
+
+    backend.publish(manifest, _asset("tool", "0.1.0"))
+    backend.publish(manifest, _asset("tool", "0.2.0"))
+
+    assert blur_shard.stat().st_mtime_ns == blur_mtime
+    assert set(backend.load_asset("Gizmo", "tool")) == {
+        Version(0, 1, 0),
+        Version(0, 2, 0),
+    }
+    assert backend.load_index() == {
+        "Gizmo": {
+            "blur": [Version(1, 0, 0)],
+            "tool": [Version(0, 2, 0), Version(0, 1, 0)],
+        }
+    }
+    assert backend.latest_version(Manifest(), _asset("tool", "0.1.0")) == Version(
+        0, 2, 0
+    )
+
+
+def test_concurrent_publishes_keep_every_index_entry(tmp_path):
+    def publish_many(worker):
+        backend = _backend(tmp_path)
+        for i in range(5):
+            backend.publish(Manifest(), _asset(f"tool{worker}", f"1.{i}.0"))
+
+    threads = [threading.Thread(target=publish_many, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    backend = _backend(tmp_path)
+    assert len(backend.load()) == 20
+    assert {v[0] for v in backend.load_index()["Gizmo"].values()} == {Version(1, 4, 0)}
+
+
+def test_publish_rejects_existing_version(tmp_path):
+    backend = _backend(tmp_path)
+    backend.publish(Manifest(), _asset("tool", "0.1.0"))
+    with pytest.raises(VersionConflictError):
+        backend.publish(Manifest(), _asset("tool", "0.1.0"))
+
+
+def test_browsing_reads_only_the_chosen_shard(tmp_path, monkeypatch):
+    backend = _backend(tmp_path)
+    for i in range(20):
+        backend.publish(None, _asset(f"tool{i}", "1.0.0"))
+    backend.publish(None, _asset("tool0", "1.1.0"))
+    reads = []
+    load_asset = backend.load_asset
+
+    def counted(asset_type, name):
+        reads.append(name)
+        return load_asset(asset_type, name)
+
+    monkeypatch.setattr(backend, "load_asset", counted)
+
+    listing = backend.list_versions()
+    assert reads == []
+    assert len(listing["Gizmo"]) == 20
+    assert listing["Gizmo"]["tool0"] == [Version(1, 1, 0), Version(1, 0, 0)]
+
+    section = backend.load_section("Gizmo", "tool0")
+    assert reads == ["tool0"]
+    assert section.sorted_versions("Gizmo", "tool0") == listing["Gizmo"]["tool0"][::-1]
+
+
+def test_index_with_latest_versions_only_is_read(tmp_path):
+    backend = _backend(tmp_path)
+    backend.publish(None, _asset("tool", "0.1.0"))
+    backend.publish(None, _asset("tool", "0.2.0"))
+    # Written before the index listed every version
+    backend.index_path.write_text('{"Gizmo": {"tool": "0.2.0"}}')
+
+    versions = [Version(0, 2, 0), Version(0, 1, 0)]
+    assert backend.list_versions()["Gizmo"] == {"tool": versions}
+    backend.publish(None, _asset("blur", "1.0.0"))
+    assert backend.load_index()["Gizmo"]["tool"] == versions
+
+
+def test_load_round_trip(tmp_path):
+    backend = _backend(tmp_path)
+    imported = backend.import_json(EXAMPLE_MANIFEST)
+    assert len(imported) > 0
+    assert _backend(tmp_path).load().data == imported.data
+
+
+def test_missing_shard_is_empty(tmp_path):
+    backend = _backend(tmp_path)
+    assert backend.load_asset("Gizmo", "missing") == {}
+    assert backend.latest_version(Manifest(), _asset("missing", "1.0.0")) is None
+    assert len(backend.load()) == 0
+
+
+def test_open_sharded_backend(tmp_path):
+    repository = Repository(tmp_path / "repo", ["Gizmo"], manifest_backend="sharded")
+    backend = open_manifest_backend(repository)
+    assert isinstance(backend, ShardedManifestBackend)
+    assert backend.shard_path("Gizmo", "tool") == (
+        repository.root / "Gizmo" / "tool" / "manifest.json"
+    )
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+from nukekit.core import Asset, Manifest, ManifestStore, Repository, Version
+from nukekit.core.exceptions import VersionConflictError
+from nukekit.core.manifest_store import (
+    JsonManifestBackend,
+    ManifestBackend,
+    open_manifest_backend,
+)
+from nukekit.core.sqlite_store import SqliteManifestBackend
+
+EXAMPLE_MANIFEST = Path(__file__).parents[2] / "examples" / "manifest.json"
+
+
+def _asset(name, version, author="me"):
+    asset = Asset.from_path(Path(f"{name}_v{version}.gizmo"))
+    asset.author = author
+    return asset
+
+
+def test_publish_and_latest_version(tmp_path):
+    backend = SqliteManifestBackend(tmp_path / "manifest.db")
+    manifest = Manifest()
+    assert backend.latest_version(manifest, _asset("tool", "0.1.0")) is None
+
+    for version in ("0.1.0", "0.10.0", "0.2.0"):
+        backend.publish(manifest, _asset("tool", version))
+
+    assert backend.latest_version(manifest, _asset("tool", "0.1.0")) == Version(
+        0, 10, 0
+    )
+    assert manifest.latest_version("Gizmo", "tool") == Version(0, 10, 0)
+    stored = backend.get_asset("Gizmo", "tool", Version(0, 2, 0))
+    assert stored is not None and stored.author == "me"
+    assert backend.get_asset("Gizmo", "tool", Version(9, 0, 0)) is None
+
+
+def test_publish_rejects_existing_version(tmp_path):
+    backend = SqliteManifestBackend(tmp_path / "manifest.db")
+    backend.publish(Manifest(), _asset("tool", "0.1.0", author="alice"))
+
+    manifest = Manifest()
+    with pytest.raises(VersionConflictError, match="alice"):
+        backend.publish(manifest, _asset("tool", "0.1.0", author="bob"))
+    assert len(manifest) == 0
+    stored = backend.get_asset("Gizmo", "tool", Version(0, 1, 0))
+    assert stored is not None and stored.author == "alice"
+
+
+def test_publish_without_manifest_runs_point_queries(tmp_path):
+    backend = SqliteManifestBackend(tmp_path / "manifest.db")
+    backend.publish(None, _asset("tool", "0.1.0"))
+    backend.publish(None, _asset("blur", "1.0.0"))
+    statements = []
+    backend._connect().set_trace_callback(statements.append)
+
+    asset = _asset("tool", "0.2.0")
+    assert backend.latest_version(None, asset) == Version(0, 1, 0)
+    assert backend.publish(None, asset) is None
+
+    # One indexed lookup, then one transaction inserting one version row
+    assert [s.split()[0] for s in statements] == [
+        "SELECT",
+        "BEGIN",
+        "INSERT",
+        "SELECT",
+        "INSERT",
+        "COMMIT",
+    ]
+    assert "LIMIT 1" in statements[0]
+    assert statements[4].startswith("INSERT INTO versions")
+
+
+def test_load_round_trip(tmp_path):
+    path = tmp_path / "manifest.db"
+    backend = SqliteManifestBackend(path)
+    manifest = Manifest()
+    backend.publish(manifest, _asset("tool", "0.1.0"))
+    backend.publish(manifest, _asset("blur", "1.0.0"))
+    backend.close()
+
+    loaded = SqliteManifestBackend(path).load()
+    assert loaded.data == manifest.data
+    assert loaded.find(author="me") == manifest.find(author="me")
+
+
+def test_uses_wal(tmp_path):
+    backend = SqliteManifestBackend(tmp_path / "manifest.db")
+    mode = backend._connect().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_json_import_export(tmp_path):
+    backend = SqliteManifestBackend(tmp_path / "manifest.db")
+    imported = backend.import_json(EXAMPLE_MANIFEST)
+    assert len(backend.load()) == len(imported) > 0
+
+    exported = tmp_path / "exported.json"
+    backend.export_json(exported)
+    assert ManifestStore.load_from_json(exported).data == imported.data
+
+
+def test_open_manifest_backend(tmp_path):
+    with pytest.raises(TypeError):
+        ManifestBackend()  # type: ignore[abstract]
+
+    repository = Repository(tmp_path / "repo", ["Gizmo"])
+    assert isinstance(open_manifest_backend(repository), JsonManifestBackend)
+
+    repository = Repository(tmp_path / "repo", ["Gizmo"], manifest_backend="sqlite")
+    backend = open_manifest_backend(repository)
+    assert isinstance(backend, SqliteManifestBackend)
+    assert backend.path == repository.root / "manifest.db"
@@ -10,7 +10,7 @@ def test_version_comparison_gt():
 
 def test_version_up_major():
     v1 = Version.from_string("1.1.13")
-    v1.version_up("major")
+    v1 = v1.version_up("major")
 
     assert v1.major == 2
     assert v1.minor == 0
@@ -19,7 +19,7 @@ def test_version_up_major():
 
 def test_version_up_minor():
     v1 = Version.from_string("1.1.13")
-    v1.version_up("minor")
+    v1 = v1.version_up("minor")
 
     assert v1.major == 1
     assert v1.minor == 2
@@ -59,3 +59,29 @@ def test_version_sort():
     x = [v1, v2]
     sort = sorted(x, reverse=True)
     assert sort[0] == v2
+
+
+def test_version_is_immutable():
+    v = Version(1, 2, 3)
+    with pytest.raises(AttributeError):
+        v.major = 2
+    assert v.version_up("patch") == Version(1, 2, 4)
+    assert v == Version(1, 2, 3)
+
+
+def test_version_hash_and_order_use_packed_key():
+    assert hash(Version(1, 2, 3)) == hash(Version.from_string("1.2.3"))
+    assert Version(0, 0, 1_000) < Version(0, 1, 0) < Version(1, 0, 0)
+
+
+def test_version_part_out_of_range():
+    with pytest.raises(ValueError):
+        Version(1 << 20, 0, 0)
+
+
+def test_version_from_string_is_memoized():
+    assert Version.from_string("3.2.1") is Version.from_string("3.2.1")
+
+
+def test_version_from_string_prerelease():
+    assert Version.from_string("1.2.3-rc.1") == Version(1, 2, 3)